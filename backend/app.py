@@ -42,10 +42,10 @@ from services import (
     ApplicationService,
     AdminService,
     FileService,
-    EmailService,
     JWTService,
     AuditService
 )
+from services.email_service import email_service as shared_email_service
 
 
 from typing import Optional
@@ -95,7 +95,7 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     try:
         # Core services
         app_service = ApplicationService(logger)
-        email_service = EmailService(logger)
+        email_service = shared_email_service
         file_service = FileService(logger)
 
         # Authentication services
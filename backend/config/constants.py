@@ -56,6 +56,11 @@ REQUIRED_FIELDS = [
     'puesto', 'ingles_nivel', 'experiencia', 'nacionalidad'
 ]
 
+# Optional free-text form fields stored with the application
+OPTIONAL_FIELDS = [
+    'puestos_adicionales', 'salario_esperado', 'disponibilidad', 'motivacion'
+]
+
 # Email validation pattern
 EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
@@ -111,14 +116,20 @@ ENGLISH_LEVELS = [
 COLLECTIONS = {
     'candidates': 'candidates',
     'admin_logs': 'admin_logs',
-    'email_logs': 'email_logs'
+    'email_logs': 'email_logs',
+    'audit_logs': 'audit_logs'
 }
 
 # Database indexes configuration
+# Case-insensitive collation for email lookups (must match the unique index)
+EMAIL_COLLATION = {'locale': 'en', 'strength': 2}
+
 DATABASE_INDEXES = [
     # Candidates collection indexes
     {'collection': 'candidates', 'index': [("created_at", -1)], 'options': {}},
-    {'collection': 'candidates', 'index': [("email", 1)], 'options': {'unique': True, 'name': 'email_unique_idx'}},
+    {'collection': 'candidates', 'index': [("email", 1)], 'options': {
+        'unique': True, 'name': 'email_unique_ci_idx', 'collation': EMAIL_COLLATION
+    }},
     {'collection': 'candidates', 'index': [("puesto", 1), ("created_at", -1)], 'options': {}},
     {'collection': 'candidates', 'index': [("status", 1)], 'options': {}},
     {'collection': 'candidates', 'index': [("telefono", 1)], 'options': {}},
@@ -132,6 +143,15 @@ DATABASE_INDEXES = [
         ("puesto", "text"),
         ("experiencia", "text")
     ], 'options': {'name': 'search_idx'}},
+    # Audit log indexes (newest-first listing, per-admin and per-event filters)
+    {'collection': 'audit_logs', 'index': [("timestamp", -1)], 'options': {}},
+    {'collection': 'audit_logs', 'index': [("admin_id", 1), ("timestamp", -1)], 'options': {}},
+    {'collection': 'audit_logs', 'index': [("event_type", 1), ("timestamp", -1)], 'options': {}},
+]
+
+# Indexes superseded by DATABASE_INDEXES, dropped once their replacement exists
+OBSOLETE_INDEXES = [
+    {'collection': 'candidates', 'name': 'email_unique_idx', 'replaced_by': 'email_unique_ci_idx'},
 ]
 
 # =================== API CONSTANTS ===================
@@ -13,10 +13,13 @@ from pymongo.database import Database
 from config.env_loader import ensure_env_loaded
 ensure_env_loaded()
 
-from config.constants import DATABASE_INDEXES, COLLECTIONS
+from config.constants import DATABASE_INDEXES, OBSOLETE_INDEXES, COLLECTIONS
 
 logger = logging.getLogger(__name__)
 
+# How long the driver waits to find a usable server before an operation fails
+SERVER_SELECTION_TIMEOUT_MS = 30000
+
 
 class DatabaseConfig:
     """Database configuration and connection management"""
@@ -39,7 +42,7 @@ class DatabaseConfig:
             try:
                 self._client = MongoClient(
                     self.uri,
-                    serverSelectionTimeoutMS=30000,  # 30 seconds
+                    serverSelectionTimeoutMS=SERVER_SELECTION_TIMEOUT_MS,
                     socketTimeoutMS=20000,           # 20 seconds
                     connectTimeoutMS=20000,          # 20 seconds
                     maxPoolSize=10,
@@ -112,6 +115,18 @@ class DatabaseConfig:
                     else:
                         logger.warning(f"Failed to create index on {collection_name}: {e}")
 
+            for obsolete in OBSOLETE_INDEXES:
+                collection_name = obsolete['collection']
+                collection = self.db[collection_name]
+                try:
+                    existing = collection.index_information()
+                    if obsolete['name'] not in existing or obsolete['replaced_by'] not in existing:
+                        continue
+                    collection.drop_index(obsolete['name'])
+                    logger.info(f"Dropped obsolete index '{obsolete['name']}' on {collection_name}")
+                except errors.OperationFailure as e:
+                    logger.warning(f"Failed to drop index '{obsolete['name']}' on {collection_name}: {e}")
+
             logger.info("Database index creation completed")
             return True
 
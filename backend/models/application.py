@@ -4,9 +4,10 @@ Data model for job applications
 """
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from bson import ObjectId
 import json
+import re
 
 
 @dataclass
@@ -63,7 +64,7 @@ class Application:
     experiencia: str
 
     # Additional fields
-    puestos_adicionales: Optional[str] = None
+    puestos_adicionales: Optional[Union[str, List[str]]] = None
     salario_esperado: Optional[str] = None
     disponibilidad: Optional[str] = None
     motivacion: Optional[str] = None
@@ -296,12 +297,14 @@ class ApplicationQuery:
 
         # Text search
         if self.search:
+            # Escape user input so it is matched literally (no ReDoS patterns)
+            search_term = re.escape(self.search.strip())
             query['$or'] = [
-                {'nombre': {'$regex': self.search, '$options': 'i'}},
-                {'apellido': {'$regex': self.search, '$options': 'i'}},
-                {'email': {'$regex': self.search, '$options': 'i'}},
-                {'puesto': {'$regex': self.search, '$options': 'i'}},
-                {'experiencia': {'$regex': self.search, '$options': 'i'}}
+                {'nombre': {'$regex': search_term, '$options': 'i'}},
+                {'apellido': {'$regex': search_term, '$options': 'i'}},
+                {'email': {'$regex': search_term, '$options': 'i'}},
+                {'puesto': {'$regex': search_term, '$options': 'i'}},
+                {'experiencia': {'$regex': search_term, '$options': 'i'}}
             ]
 
         # Exact match filters
@@ -3,7 +3,7 @@ Updated Admin Routes
 Flask routes for admin operations with JWT authentication
 """
 import logging
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, Response, request, jsonify, g, stream_with_context
 from typing import Dict, Any
 
 # Create blueprint
@@ -763,19 +763,25 @@ def export_applications():
         # Remove None values
         filters = {k: v for k, v in filters.items() if v is not None}
 
-        # Perform export
-        result = application_service.export_applications(format, filters)
+        # Perform export, streaming rows from the database as they are written
+        result = application_service.export_applications_stream(format, filters)
 
         if result['success']:
+            export = result['data']
+
             # Log export action
             if audit_service:
                 rbac_middleware.log_admin_action('applications_export', {
                     'format': format,
                     'filters': filters,
-                    'count': result['data']['count']
+                    'count': export['count']
                 })
 
-            return jsonify(result), 200
+            return Response(
+                stream_with_context(export['stream']),
+                mimetype=export['mimetype'],
+                headers={'Content-Disposition': f"attachment; filename={export['filename']}"}
+            )
         else:
             return jsonify(result), 400 if result.get('error_type') == 'NoDataFound' else 500
 
@@ -814,7 +820,7 @@ def get_filter_options():
 def update_application_status(application_id):
     """Update application status and send notification email"""
     try:
-        from services.email_service import EmailService
+        from services.email_service import email_service
 
         data = request.get_json()
         if not data or 'status' not in data:
@@ -841,16 +847,16 @@ def update_application_status(application_id):
         if not update_result['success']:
             return jsonify(update_result), 400
 
-        # Send notification email if requested and status changed
-        email_sent = False
+        # Queue notification email if requested and status changed; the SMTP
+        # dialog runs on the email worker instead of this request
+        email_queued = False
         if send_notification and old_status != new_status:
-            email_service = EmailService()
-            email_result = email_service.send_application_status_change_email(
+            email_result = email_service.queue_application_status_change_email(
                 application_data,
                 new_status,
                 old_status
             )
-            email_sent = email_result.get('success', False)
+            email_queued = email_result.get('success', False)
 
         # Log status change
         if audit_service:
@@ -858,7 +864,8 @@ def update_application_status(application_id):
                 'application_id': application_id,
                 'old_status': old_status,
                 'new_status': new_status,
-                'notification_sent': email_sent
+                'notification_sent': email_queued,
+                'notification_queued': email_queued
             })
 
         return jsonify({
@@ -868,7 +875,10 @@ def update_application_status(application_id):
                 'application_id': application_id,
                 'old_status': old_status,
                 'new_status': new_status,
-                'notification_sent': email_sent,
+                # notification_sent is kept for existing clients; the email
+                # has been accepted for delivery, not yet sent
+                'notification_sent': email_queued,
+                'notification_queued': email_queued,
                 'updated_at': update_result['data'].get('updated_at')
             }
         }), 200
@@ -887,7 +897,7 @@ def update_application_status(application_id):
 def approve_application(application_id):
     """Approve application and send notification"""
     try:
-        from services.email_service import EmailService
+        from services.email_service import email_service
 
         data = request.get_json() or {}
         send_notification = data.get('send_notification', True)
@@ -906,19 +916,23 @@ def approve_application(application_id):
         if not update_result['success']:
             return jsonify(update_result), 400
 
-        # Send notification email
-        email_sent = False
+        # Queue notification email; the SMTP dialog runs on the email worker
+        email_queued = False
         if send_notification:
-            email_service = EmailService()
-            email_result = email_service.send_application_approved_email(application_data)
-            email_sent = email_result.get('success', False)
+            email_result = email_service.queue_application_status_change_email(
+                application_data,
+                'approved',
+                application_data.get('status')
+            )
+            email_queued = email_result.get('success', False)
 
         # Log approval
         if audit_service:
             rbac_middleware.log_admin_action('application_approved', {
                 'application_id': application_id,
                 'candidate_email': application_data.get('email'),
-                'notification_sent': email_sent,
+                'notification_sent': email_queued,
+                'notification_queued': email_queued,
                 'notes': notes
             })
 
@@ -928,7 +942,10 @@ def approve_application(application_id):
             'data': {
                 'application_id': application_id,
                 'status': 'approved',
-                'notification_sent': email_sent,
+                # notification_sent is kept for existing clients; the email
+                # has been accepted for delivery, not yet sent
+                'notification_sent': email_queued,
+                'notification_queued': email_queued,
                 'approved_by': g.current_admin['username'],
                 'approved_at': update_result['data'].get('updated_at')
             }
@@ -948,7 +965,7 @@ def approve_application(application_id):
 def reject_application(application_id):
     """Reject application and send notification"""
     try:
-        from services.email_service import EmailService
+        from services.email_service import email_service
 
         data = request.get_json() or {}
         send_notification = data.get('send_notification', True)
@@ -967,19 +984,23 @@ def reject_application(application_id):
         if not update_result['success']:
             return jsonify(update_result), 400
 
-        # Send notification email
-        email_sent = False
+        # Queue notification email; the SMTP dialog runs on the email worker
+        email_queued = False
         if send_notification:
-            email_service = EmailService()
-            email_result = email_service.send_application_rejected_email(application_data)
-            email_sent = email_result.get('success', False)
+            email_result = email_service.queue_application_status_change_email(
+                application_data,
+                'rejected',
+                application_data.get('status')
+            )
+            email_queued = email_result.get('success', False)
 
         # Log rejection
         if audit_service:
             rbac_middleware.log_admin_action('application_rejected', {
                 'application_id': application_id,
                 'candidate_email': application_data.get('email'),
-                'notification_sent': email_sent,
+                'notification_sent': email_queued,
+                'notification_queued': email_queued,
                 'notes': notes
             })
 
@@ -989,7 +1010,10 @@ def reject_application(application_id):
             'data': {
                 'application_id': application_id,
                 'status': 'rejected',
-                'notification_sent': email_sent,
+                # notification_sent is kept for existing clients; the email
+                # has been accepted for delivery, not yet sent
+                'notification_sent': email_queued,
+                'notification_queued': email_queued,
                 'rejected_by': g.current_admin['username'],
                 'rejected_at': update_result['data'].get('updated_at')
             }
@@ -3,9 +3,10 @@ API Routes
 Main API endpoints for application management
 """
 import logging
-from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash
+from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash, send_file
 from werkzeug.exceptions import BadRequest
-from services import ApplicationService, FileService, EmailService
+from services import ApplicationService, FileService
+from services.email_service import email_service
 from middleware import (
     handle_api_errors,
     validate_json_schema,
@@ -25,7 +26,6 @@ logger = logging.getLogger(__name__)
 # Initialize services
 app_service = ApplicationService(logger)
 file_service = FileService(logger)
-email_service = EmailService(logger)
 
 
 @api_bp.route('/submit', methods=['GET', 'POST'])
@@ -93,42 +93,22 @@ def submit_application():
                     "application_id": result["data"].get("_id")
                 })
 
-                # Send confirmation email
-                logger.info("=" * 80)
-                logger.info("STARTING EMAIL SEND PROCESS")
-                logger.info(f"Target email: {form_data.get('email')}")
-                logger.info(f"Candidate: {form_data.get('nombre')} {form_data.get('apellido')}")
-                logger.info("=" * 80)
-
+                # Confirmation and admin notification are delivered in the
+                # background so the response does not wait on SMTP
                 try:
-                    email_result = email_service.send_confirmation_email(form_data)
-                    logger.info("EMAIL SEND COMPLETED")
-                    logger.info(f"Email result: {email_result}")
-
-                    if email_result.get('success'):
-                        logger.info("Confirmation email sent successfully", extra={
-                            "email": form_data.get('email')
+                    emails_result = email_service.queue_application_emails(form_data, {})
+                    if emails_result.get('success'):
+                        logger.info("Application emails queued", extra={
+                            "email": form_data.get('email'),
+                            "job_id": emails_result['data']['job_id']
                         })
                     else:
-                        logger.error("Failed to send confirmation email", extra={
-                            "error": email_result.get('message'),
+                        logger.error("Failed to queue application emails", extra={
+                            "error": emails_result.get('error'),
                             "email": form_data.get('email')
                         })
                 except Exception as email_error:
-                    logger.error(f"Exception sending confirmation email: {email_error}", exc_info=True)
-
-                # Send admin notification
-                logger.info("Attempting to send admin notification")
-                try:
-                    admin_email_result = email_service.send_admin_notification(form_data, {})
-                    if admin_email_result.get('success'):
-                        logger.info("Admin notification sent successfully")
-                    else:
-                        logger.error("Failed to send admin notification", extra={
-                            "error": admin_email_result.get('message')
-                        })
-                except Exception as admin_email_error:
-                    logger.error(f"Exception sending admin notification: {admin_email_error}", exc_info=True)
+                    logger.error(f"Exception queueing application emails: {email_error}", exc_info=True)
 
                 return jsonify(result), 201
             else:
@@ -347,19 +327,25 @@ def export_applications():
         from_date = request.args.get('from_date')
         to_date = request.args.get('to_date')
 
+        filters = {'status': status, 'from_date': from_date, 'to_date': to_date}
         result = app_service.export_applications(
-            status=status,
-            from_date=from_date,
-            to_date=to_date
+            'excel',
+            {k: v for k, v in filters.items() if v is not None}
         )
 
         if result["success"]:
+            export = result["data"]
             logger.info("Applications exported successfully", extra={
                 "status_filter": status,
                 "from_date": from_date,
                 "to_date": to_date
             })
-            return jsonify(result), 200
+            return send_file(
+                export["file"],
+                mimetype=export["mimetype"],
+                as_attachment=True,
+                download_name=export["filename"]
+            )
         else:
             logger.error("Failed to export applications", extra={
                 "error": result["error"]
@@ -5,7 +5,8 @@ Flask routes for application management
 import logging
 from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash
 from werkzeug.exceptions import BadRequest
-from services import ApplicationService, FileService, EmailService
+from services import ApplicationService, FileService
+from services.email_service import email_service
 
 # Create blueprint
 applications_bp = Blueprint('applications', __name__, url_prefix='/api')
@@ -16,7 +17,6 @@ logger = logging.getLogger(__name__)
 # Initialize services
 app_service = ApplicationService(logger)
 file_service = FileService(logger)
-email_service = EmailService(logger)
 
 
 @applications_bp.route('/submit', methods=['GET', 'POST'])
@@ -92,42 +92,21 @@ def submit_application():
                     "details": create_result.get('details')
                 }), 400
 
-            # Send confirmation email
-            logger.info("=" * 80)
-            logger.info("STARTING EMAIL SEND PROCESS")
-            logger.info(f"Target email: {form_data.get('email')}")
-            logger.info(f"Candidate: {form_data.get('nombre')} {form_data.get('apellido')}")
-            logger.info("=" * 80)
+            # Confirmation and admin notification are delivered in the
+            # background so the response does not wait on SMTP
+            emails_result = email_service.queue_application_emails(form_data, files_info)
 
-            email_result = email_service.send_confirmation_email(form_data)
-
-            logger.info("EMAIL SEND COMPLETED")
-            logger.info(f"Email result: {email_result}")
-
-            if email_result.get('success'):
-                logger.info("Confirmation email sent successfully", extra={
-                    "email": form_data.get('email')
-                })
-            else:
-                logger.error("Failed to send confirmation email", extra={
-                    "error": email_result.get('message'),
-                    "error_type": email_result.get('error_type'),
+            if emails_result.get('success'):
+                logger.info("Application emails queued", extra={
                     "email": form_data.get('email'),
-                    "full_result": email_result
+                    "job_id": emails_result['data']['job_id']
                 })
-
-            # Send admin notification
-            logger.info("Attempting to send admin notification")
-
-            admin_email_result = email_service.send_admin_notification(form_data, files_info)
-
-            if admin_email_result.get('success'):
-                logger.info("Admin notification sent successfully")
             else:
-                logger.error("Failed to send admin notification", extra={
-                    "error": admin_email_result.get('message'),
-                    "error_type": admin_email_result.get('error_type'),
-                    "full_result": admin_email_result
+                logger.error("Failed to queue application emails", extra={
+                    "error": emails_result.get('error'),
+                    "error_type": emails_result.get('error_type'),
+                    "email": form_data.get('email'),
+                    "full_result": emails_result
                 })
 
             logger.info("Application submitted successfully", extra={
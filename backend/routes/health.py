@@ -4,7 +4,8 @@ System health monitoring endpoints
 """
 import logging
 from flask import Blueprint, jsonify
-from services import ApplicationService, AdminService, FileService, EmailService
+from services import ApplicationService, AdminService, FileService
+from services.email_service import email_service
 
 # Create blueprint
 health_bp = Blueprint('health', __name__)
@@ -32,7 +33,6 @@ def health_check():
         app_service = ApplicationService(logger)
         admin_service = AdminService(logger)
         file_service = FileService(logger)
-        email_service = EmailService(logger)
 
         # Check application service
         try:
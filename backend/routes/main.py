@@ -4,7 +4,8 @@ Flask routes for main application pages and utilities
 """
 import logging
 from flask import Blueprint, request, jsonify, render_template
-from services import ApplicationService, AdminService, FileService, EmailService
+from services import ApplicationService, AdminService, FileService
+from services.email_service import email_service
 
 # Create blueprint
 main_bp = Blueprint('main', __name__)
@@ -16,7 +17,6 @@ logger = logging.getLogger(__name__)
 app_service = ApplicationService(logger)
 admin_service = AdminService(logger)
 file_service = FileService(logger)
-email_service = EmailService(logger)
 
 
 @main_bp.route('/')
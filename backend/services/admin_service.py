@@ -4,7 +4,7 @@ Complete admin authentication and management with JWT and bcrypt
 """
 import bcrypt
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
 from config.settings import Config
 from services.base_service import BaseService
@@ -34,17 +34,19 @@ class AdminService(BaseService):
             }
         }
 
-    def hash_password(self, password: str) -> str:
+        # Dashboard date boundaries, cached per wall-clock minute
+        self._bounds_cache = None
+
+    def hash_password(self, password: str) -> bytes:
         """Hash password using bcrypt"""
         salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        return bcrypt.hashpw(password.encode('utf-8'), salt)
 
-    def verify_password(self, password: str, hashed: str) -> bool:
+    def verify_password(self, password: str, hashed: bytes) -> bool:
         """Verify password against bcrypt hash"""
         try:
-            return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
-        except Exception as e:
+            return bcrypt.checkpw(password.encode('utf-8'), hashed)
+        except ValueError as e:
             self.logger.error(f"Password verification error: {e}")
             return False
 
@@ -56,7 +58,9 @@ class AdminService(BaseService):
             if username == self.config.ADMIN_USERNAME:
                 # Check if password is already hashed (starts with $2b$)
                 stored_password = self.config.ADMIN_PASSWORD
-                if not stored_password.startswith('$2b$'):
+                if stored_password.startswith('$2b$'):
+                    stored_password = stored_password.encode('utf-8')
+                else:
                     # Hash the plain text password for first time
                     stored_password = self.hash_password(stored_password)
                     self.logger.warning("Admin password was stored in plain text. Consider updating environment variables.")
@@ -224,16 +228,32 @@ class AdminService(BaseService):
 
     def check_admin_permission(self, admin_role: str, required_permission: str) -> bool:
         """Check if admin role has required permission"""
-        try:
-            role_permissions = self.roles.get(admin_role, {}).get('permissions', [])
-            return 'all' in role_permissions or required_permission in role_permissions
-        except Exception:
-            return False
+        role_permissions = self.roles.get(admin_role, {}).get('permissions', [])
+        return 'all' in role_permissions or required_permission in role_permissions
+
+    def _get_dashboard_bounds(self, now: datetime) -> tuple:
+        """Get (today_start, week_start, month_start, thirty_days_ago), reused within the same minute
+
+        The bounds are computed from the start of now's minute, which is also
+        the cache key, so a cached entry always matches the minute it is used in.
+        """
+        minute_start = now.replace(second=0, microsecond=0)
+        if self._bounds_cache is not None and self._bounds_cache[0] == minute_start:
+            return self._bounds_cache[1]
+
+        today_start = minute_start.replace(hour=0, minute=0)
+        bounds = (
+            today_start,
+            today_start - timedelta(days=minute_start.weekday()),
+            today_start.replace(day=1),
+            minute_start - timedelta(days=30)
+        )
+        self._bounds_cache = (minute_start, bounds)
+        return bounds
 
     def get_admin_dashboard_stats(self) -> Dict[str, Any]:
         """Get comprehensive dashboard stats with real data"""
         try:
-            from datetime import datetime, timedelta, timezone
             from config.database import get_database
 
             db = get_database()
@@ -241,9 +261,7 @@ class AdminService(BaseService):
 
             # Get current date info
             now = datetime.now(timezone.utc)
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            week_start = today_start - timedelta(days=now.weekday())
-            month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            today_start, week_start, month_start, thirty_days_ago = self._get_dashboard_bounds(now)
 
             # Summary statistics
             total_applications = collection.count_documents({})
@@ -286,7 +304,6 @@ class AdminService(BaseService):
             }
 
             # Trend data - last 30 days
-            thirty_days_ago = now - timedelta(days=30)
             trend_pipeline = [
                 {"$match": {"created_at": {"$gte": thirty_days_ago}}},
                 {"$group": {
@@ -405,7 +422,7 @@ class AdminService(BaseService):
             # In production, update database
             return self.success_response({
                 'password_updated': True,
-                'new_password_hash': new_password_hash,
+                'new_password_hash': new_password_hash.decode('utf-8'),
                 'message': 'Password changed successfully. Update environment variables in production.'
             }, "Password changed successfully")
 
@@ -2,9 +2,13 @@
 Application Service
 Business logic for application management
 """
+import csv
+import io
+import itertools
 import logging
+import time
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from flask import current_app
 from bson import ObjectId
 from pymongo.errors import DuplicateKeyError
@@ -13,16 +17,138 @@ import re
 from services.base_service import BaseService
 from models.application import Application
 from schemas.basic_schemas import ApplicationCreateSchemaBasic
-from config.database import get_database
+from config.database import get_database, SERVER_SELECTION_TIMEOUT_MS
 from config.constants import (
-    REQUIRED_FIELDS, VALIDATION_PATTERNS, PHONE_PATTERNS,
+    REQUIRED_FIELDS, OPTIONAL_FIELDS, VALIDATION_PATTERNS, PHONE_PATTERNS,
     FILE_SIZE_LIMITS, ALLOWED_EXTENSIONS
 )
 
+# Format patterns checked field by field (phone has its own validation)
+_FIELD_FORMAT_PATTERNS = {
+    field: pattern for field, pattern in VALIDATION_PATTERNS.items()
+    if field != 'telefono'
+}
+
+# 24-character hex string accepted by ObjectId()
+_OID_RE = re.compile(r'\A[0-9a-fA-F]{24}\Z')
+
+# Display names for required-field error messages
+_FIELD_LABELS = {
+    'nombre': 'Nombre',
+    'apellido': 'Apellido',
+    'nacionalidad': 'Nacionalidad',
+    'email': 'Email',
+    'telefono': 'Teléfono',
+    'puesto': 'Puesto',
+    'ingles_nivel': 'Nivel de inglés',
+    'experiencia': 'Experiencia laboral'
+}
+
+# Maximum field lengths, to prevent DoS through oversized submissions
+_MAX_LENGTHS = {
+    'nombre': 50, 'apellido': 50, 'email': 100, 'telefono': 25,
+    'nacionalidad': 50, 'puesto': 50, 'experiencia': 500,
+    'motivacion': 1000, 'disponibilidad': 200, 'puestos_adicionales': 200,
+    'espanol_nivel': 20, 'otro_idioma': 50, 'otro_idioma_nivel': 20,
+    'ingles_nivel': 20
+}
+
+def _normalize_field(value: Any) -> Any:
+    """Strip a submitted text field; lists (e.g. puestos_adicionales) keep
+    their stripped, non-empty string items. Empty values become None."""
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, list):
+        items = [item.strip() for item in value if isinstance(item, str) and item.strip()]
+        return items or None
+    return None
+
+
+# Cached result of get_application_statistics, dropped on any write
+_STATS_CACHE_TTL = 30  # seconds
+_stats_cache: Dict[str, Any] = {"value": None, "expires": 0.0}
+
+# Health probes are polled frequently by monitors, and routes create a new
+# service per request, so the last probe result is shared at module level
+_HEALTH_CACHE_TTL = 5.0  # seconds
+_health_cache: Dict[str, Any] = {"value": None, "expires": 0.0}
+
+# Advanced filter options change only when applications are added/removed
+_FILTERS_CACHE_TTL = 120  # seconds
+_filters_cache: Dict[str, Any] = {"value": None, "expires": 0.0}
+
+
+def _invalidate_stats_cache():
+    """Force the next statistics/filter options request to hit the database"""
+    _stats_cache["expires"] = 0.0
+    _filters_cache["expires"] = 0.0
+
+
+# Export columns as (header, Excel column width)
+_EXPORT_COLUMNS = [
+    ('ID', 26), ('Nombre', 20), ('Apellido', 20), ('Email', 32), ('Teléfono', 18),
+    ('Nacionalidad', 18), ('Nivel de Inglés', 16), ('Puesto', 24),
+    ('Puestos Adicionales', 30), ('Experiencia', 50), ('Estado', 12),
+    ('CV URL', 50), ('Foto URL', 50), ('Fecha de Postulación', 26)
+]
+
+# Rows per Mongo batch and per streamed CSV chunk
+_EXPORT_BATCH_SIZE = 1000
+
+# Only the document fields read by ApplicationService._export_row
+_EXPORT_PROJECTION = {
+    "_id": 1, "nombre": 1, "apellido": 1, "email": 1, "telefono": 1,
+    "nacionalidad": 1, "ingles_nivel": 1, "puesto": 1, "puestos_adicionales": 1,
+    "experiencia": 1, "status": 1, "cv_url": 1, "foto_url": 1, "created_at": 1
+}
+
+
+# BSON datetime fields converted to ISO strings in listing responses
+_DATETIME_FIELDS = ('created_at', 'updated_at')
+
+
+def _to_json_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a listing document whose BSON-only values are JSON-ready strings"""
+    json_doc = {**doc, '_id': str(doc['_id'])}
+    for field in _DATETIME_FIELDS:
+        value = doc.get(field)
+        if isinstance(value, datetime):
+            json_doc[field] = value.isoformat()
+    return json_doc
+
+
+def _search_filter(term: str) -> Dict[str, Any]:
+    """Build the get_applications filter for a free-text search term
+
+    Emails are matched from the start and phone numbers anywhere, so
+    partial input such as "juan@" or "600123" still finds the applicant.
+    Other terms match each word against the start of a word in nombre
+    or apellido, or the start of the email. Patterns are escaped, so user
+    input is never interpreted as a regex.
+    """
+    if '@' in term:
+        return {'email': {'$regex': f"^{re.escape(term)}", '$options': 'i'}}
+
+    if term.lstrip('+').replace(' ', '').isdigit():
+        return {'telefono': {'$regex': re.escape(term)}}
+
+    clauses = []
+    for word in term.split():
+        word = re.escape(word)
+        clauses.append({'$or': [
+            {'nombre': {'$regex': f"(?:^|\\s){word}", '$options': 'i'}},
+            {'apellido': {'$regex': f"(?:^|\\s){word}", '$options': 'i'}},
+            {'email': {'$regex': f"^{word}", '$options': 'i'}}
+        ]})
+    return clauses[0] if len(clauses) == 1 else {'$and': clauses}
+
 
 class ApplicationService(BaseService):
     """Service for handling application business logic"""
 
+    # The first probe may have to connect, which waits for server selection
+    health_check_timeout = SERVER_SELECTION_TIMEOUT_MS / 1000
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(logger)
         self.db = None
@@ -52,20 +178,24 @@ class ApplicationService(BaseService):
 
         phone = phone.strip()
 
-        # Check if phone matches the general international format
-        if not re.match(r'^\+\d{1,4}\s\d{7,15}$', phone):
+        # Check the general international format "+<1-4 digits> <7-15 digits>"
+        # with plain string checks instead of a regex
+        idx = phone.find(' ')
+        digits = phone[idx + 1:]
+        if (not phone.startswith('+')
+                or not 2 <= idx <= 5
+                or not phone[1:idx].isdecimal()
+                or not 7 <= len(digits) <= 15
+                or not digits.isdecimal()):
             return False, "Formato de teléfono inválido. Use el formato: +código país número"
 
         # Extract country code
-        parts = phone.split(' ', 1)
-        if len(parts) != 2:
-            return False, "Formato de teléfono inválido"
-
-        country_code = parts[0]
+        country_code = phone[:idx]
 
         # Check country-specific pattern if available
-        if country_code in PHONE_PATTERNS:
-            if not re.match(PHONE_PATTERNS[country_code], phone):
+        country_pattern = PHONE_PATTERNS.get(country_code)
+        if country_pattern is not None:
+            if not country_pattern.match(phone):
                 return False, f"Formato incorrecto para {country_code}. Verifica el número de dígitos."
 
         return True, "Válido"
@@ -76,18 +206,9 @@ class ApplicationService(BaseService):
 
         # Check required fields
         for field in REQUIRED_FIELDS:
-            if not data.get(field) or not data.get(field).strip():
-                field_names = {
-                    'nombre': 'Nombre',
-                    'apellido': 'Apellido',
-                    'nacionalidad': 'Nacionalidad',
-                    'email': 'Email',
-                    'telefono': 'Teléfono',
-                    'puesto': 'Puesto',
-                    'ingles_nivel': 'Nivel de inglés',
-                    'experiencia': 'Experiencia laboral'
-                }
-                errors.append(f"Campo requerido faltante: {field_names.get(field, field)}")
+            value = data.get(field)
+            if not value or not value.strip():
+                errors.append(f"Campo requerido faltante: {_FIELD_LABELS.get(field, field)}")
 
         # Special validation for phone number
         if 'telefono' in data and data['telefono']:
@@ -96,39 +217,20 @@ class ApplicationService(BaseService):
                 errors.append(f"Teléfono: {message}")
 
         # Validate field formats (excluding phone which has special validation)
-        for field, pattern in VALIDATION_PATTERNS.items():
-            if field == 'telefono':  # Skip phone, already validated above
-                continue
-            if field in data and data[field]:
-                if not re.match(pattern, data[field].strip()):
+        for field, pattern in _FIELD_FORMAT_PATTERNS.items():
+            value = data.get(field)
+            if value:
+                if not pattern.match(value.strip()):
                     errors.append(f"Formato inválido para {field}")
 
         # Validate field lengths to prevent DoS
-        max_lengths = {
-            'nombre': 50, 'apellido': 50, 'email': 100, 'telefono': 25,
-            'nacionalidad': 50, 'puesto': 50, 'experiencia': 500,
-            'motivacion': 1000, 'disponibilidad': 200, 'puestos_adicionales': 200,
-            'espanol_nivel': 20, 'otro_idioma': 50, 'otro_idioma_nivel': 20,
-            'ingles_nivel': 20
-        }
-
-        for field, max_length in max_lengths.items():
-            if field in data and data[field] and len(data[field]) > max_length:
+        for field, max_length in _MAX_LENGTHS.items():
+            value = data.get(field)
+            if isinstance(value, str) and len(value) > max_length:
                 errors.append(f"Campo {field} excede la longitud máxima de {max_length} caracteres")
 
         return len(errors) == 0, errors
 
-    def check_duplicate_application(self, email: str) -> bool:
-        """Check if an application with this email already exists"""
-        try:
-            self._ensure_initialized()
-
-            existing = self.collection.find_one({"email": email.lower().strip()})
-            return existing is not None
-        except Exception as e:
-            self.logger.error(f"Error checking duplicate application for {email}: {e}")
-            return False  # If we can't check, allow the application
-
     def validate_file(self, file, field_name: str) -> Tuple[bool, Optional[str], int]:
         """Validate uploaded file size and extension"""
         if not file or not file.filename:
@@ -166,12 +268,9 @@ class ApplicationService(BaseService):
             if not is_valid:
                 return self.error_response("Validation failed", "ValidationError", {"errors": errors})
 
-            # Check for duplicate email
-            if self.check_duplicate_application(data['email']):
-                return self.error_response(
-                    "Ya existe una aplicación con este email",
-                    "DuplicateEmailError"
-                )
+            # Normalize the email once; the stored value and the unique
+            # index must agree on case
+            email = data['email'].strip().lower()
 
             # Process files_info to ensure it's serializable (extract only the needed fields)
             processed_files = {}
@@ -189,24 +288,15 @@ class ApplicationService(BaseService):
                             'field_name': file_data.get('field_name', field_name)
                         }
 
-            # Create Application model instance with required fields
-            application = Application(
-                nombre=data['nombre'].strip(),
-                apellido=data['apellido'].strip(),
-                email=data['email'].strip(),
-                telefono=data['telefono'].strip(),
-                nacionalidad=data['nacionalidad'].strip(),
-                puesto=data['puesto'].strip(),
-                ingles_nivel=data['ingles_nivel'].strip(),
-                experiencia=data['experiencia'].strip(),
-                # Optional fields
-                puestos_adicionales=data.get('puestos_adicionales', '').strip() if data.get('puestos_adicionales') else None,
-                salario_esperado=data.get('salario_esperado', '').strip() if data.get('salario_esperado') else None,
-                disponibilidad=data.get('disponibilidad', '').strip() if data.get('disponibilidad') else None,
-                motivacion=data.get('motivacion', '').strip() if data.get('motivacion') else None,
-                # Files info - use processed files
-                files=processed_files
-            )
+            # Normalize required and optional text fields in a single pass
+            fields = {
+                field: _normalize_field(data.get(field))
+                for field in (*REQUIRED_FIELDS, *OPTIONAL_FIELDS)
+            }
+            fields['email'] = email
+
+            # Create Application model instance
+            application = Application(**fields, files=processed_files)
 
             # Convert to database format
             try:
@@ -220,13 +310,15 @@ class ApplicationService(BaseService):
                     "SerializationError"
                 )
 
-            # Insert into database
+            # Insert into database; duplicates are rejected by the unique
+            # email index (email_unique_ci_idx) and handled below
             result = self.collection.insert_one(app_data)
+            _invalidate_stats_cache()
 
             # Log successful creation
             self.log_operation("create_application", {
                 "application_id": str(result.inserted_id),
-                "email": data['email'],
+                "email": email,
                 "puesto": data.get('puesto'),
                 "has_files": bool(files_info)
             })
@@ -256,12 +348,8 @@ class ApplicationService(BaseService):
             # Search functionality
             if query_params.get('search'):
                 search_term = query_params['search'].strip()
-                mongo_query['$or'] = [
-                    {'nombre': {'$regex': search_term, '$options': 'i'}},
-                    {'apellido': {'$regex': search_term, '$options': 'i'}},
-                    {'email': {'$regex': search_term, '$options': 'i'}},
-                    {'telefono': {'$regex': search_term, '$options': 'i'}}
-                ]
+                if search_term:
+                    mongo_query.update(_search_filter(search_term))
 
             # Status filter
             if query_params.get('status'):
@@ -291,11 +379,15 @@ class ApplicationService(BaseService):
             # Execute query
             total = self.collection.count_documents(mongo_query)
             cursor = self.collection.find(mongo_query).sort(sort_field, sort_order).skip(skip).limit(per_page)
+            # Fetch the whole page in the first batch (no follow-up getMore)
+            cursor = cursor.batch_size(per_page)
+            if not mongo_query and sort_field == 'created_at':
+                # Unfiltered listing: walk the created_at index instead of sorting in memory
+                cursor = cursor.hint([("created_at", -1)])
 
-            applications = []
-            for app in cursor:
-                app['_id'] = str(app['_id'])
-                applications.append(app)
+            # Stringify ObjectId and datetime values here so the JSON encoder
+            # never has to fall back to its default() path
+            applications = [_to_json_doc(app) for app in cursor]
 
             # Calculate pagination info
             pages = (total + per_page - 1) // per_page
@@ -379,6 +471,8 @@ class ApplicationService(BaseService):
             if result.matched_count == 0:
                 return self.error_response("Application not found", "NotFoundError")
 
+            _invalidate_stats_cache()
+
             self.log_operation("update_application", {
                 "application_id": application_id,
                 "updated_fields": list(update_fields.keys())
@@ -423,6 +517,8 @@ class ApplicationService(BaseService):
             if result.matched_count == 0:
                 return self.error_response("Application not found", "NotFoundError")
 
+            _invalidate_stats_cache()
+
             self.log_operation("update_application_status", {
                 "application_id": application_id,
                 "new_status": new_status
@@ -449,16 +545,15 @@ class ApplicationService(BaseService):
             if not ObjectId.is_valid(application_id):
                 return self.error_response("Invalid application ID", "InvalidIdError")
 
-            # Get application before deletion for logging
-            application = self.collection.find_one({"_id": ObjectId(application_id)})
-            if not application:
+            # Delete and fetch the fields needed for logging in one round-trip
+            application = self.collection.find_one_and_delete(
+                {"_id": ObjectId(application_id)},
+                projection={"email": 1, "puesto": 1}
+            )
+            if application is None:
                 return self.error_response("Application not found", "NotFoundError")
 
-            # Delete from database
-            result = self.collection.delete_one({"_id": ObjectId(application_id)})
-
-            if result.deleted_count == 0:
-                return self.error_response("Application not found", "NotFoundError")
+            _invalidate_stats_cache()
 
             self.log_operation("delete_application", {
                 "application_id": application_id,
@@ -482,12 +577,14 @@ class ApplicationService(BaseService):
             # Validate all IDs
             object_ids = []
             for app_id in application_ids:
-                if not ObjectId.is_valid(app_id):
+                if not isinstance(app_id, str) or not _OID_RE.match(app_id):
                     return self.error_response(f"Invalid application ID: {app_id}", "InvalidIdError")
                 object_ids.append(ObjectId(app_id))
 
             # Delete applications
             result = self.collection.delete_many({"_id": {"$in": object_ids}})
+            if result.deleted_count:
+                _invalidate_stats_cache()
 
             self.log_operation("delete_multiple_applications", {
                 "requested_count": len(application_ids),
@@ -507,55 +604,56 @@ class ApplicationService(BaseService):
     def get_application_statistics(self) -> Dict[str, Any]:
         """Get application statistics"""
         try:
-            self._ensure_initialized()
-
-            # Basic counts
-            total_applications = self.collection.count_documents({})
-            pending_applications = self.collection.count_documents({"status": "pending"})
-            approved_applications = self.collection.count_documents({"status": "approved"})
-            rejected_applications = self.collection.count_documents({"status": "rejected"})
+            if time.monotonic() < _stats_cache["expires"]:
+                return self.success_response(_stats_cache["value"], "Statistics retrieved successfully")
 
-            # Today's applications
-            today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-            applications_today = self.collection.count_documents({
-                "created_at": {"$gte": today_start}
-            })
+            self._ensure_initialized()
 
-            # This week's applications
-            from datetime import timedelta
+            now = datetime.now(timezone.utc)
+            today_start = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
             week_start = today_start - timedelta(days=today_start.weekday())
-            applications_this_week = self.collection.count_documents({
-                "created_at": {"$gte": week_start}
-            })
 
-            # Popular positions
-            pipeline = [
-                {"$group": {"_id": "$puesto", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}},
-                {"$limit": 10}
-            ]
-            popular_positions_cursor = self.collection.aggregate(pipeline)
-            popular_positions = list(popular_positions_cursor)
-
-            # English levels distribution
-            pipeline = [
-                {"$group": {"_id": "$ingles_nivel", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}}
-            ]
-            english_levels_cursor = self.collection.aggregate(pipeline)
+            # All counts and distributions in a single aggregation round-trip
+            pipeline = [{"$facet": {
+                "total": [{"$count": "n"}],
+                "pending": [{"$match": {"status": "pending"}}, {"$count": "n"}],
+                "approved": [{"$match": {"status": "approved"}}, {"$count": "n"}],
+                "rejected": [{"$match": {"status": "rejected"}}, {"$count": "n"}],
+                "today": [{"$match": {"created_at": {"$gte": today_start}}}, {"$count": "n"}],
+                "week": [{"$match": {"created_at": {"$gte": week_start}}}, {"$count": "n"}],
+                "positions": [
+                    {"$group": {"_id": "$puesto", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1}},
+                    {"$limit": 10}
+                ],
+                "english_levels": [
+                    {"$group": {"_id": "$ingles_nivel", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1}}
+                ],
+                "countries": [
+                    {"$group": {"_id": "$nacionalidad", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1}},
+                    {"$limit": 15}
+                ]
+            }}]
+            facets = next(self.collection.aggregate(pipeline), {})
+
+            def facet_count(name: str) -> int:
+                items = facets.get(name) or []
+                return items[0]['n'] if items else 0
+
+            total_applications = facet_count("total")
+            pending_applications = facet_count("pending")
+            approved_applications = facet_count("approved")
+            rejected_applications = facet_count("rejected")
+            applications_today = facet_count("today")
+            applications_this_week = facet_count("week")
+            popular_positions = facets.get("positions", [])
             english_levels_distribution = {
-                item['_id']: item['count'] for item in english_levels_cursor
+                item['_id']: item['count'] for item in facets.get("english_levels", [])
             }
-
-            # Countries distribution
-            pipeline = [
-                {"$group": {"_id": "$nacionalidad", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}},
-                {"$limit": 15}
-            ]
-            countries_cursor = self.collection.aggregate(pipeline)
             countries_distribution = {
-                item['_id']: item['count'] for item in countries_cursor
+                item['_id']: item['count'] for item in facets.get("countries", [])
             }
 
             stats = {
@@ -570,6 +668,9 @@ class ApplicationService(BaseService):
                 "countries_distribution": countries_distribution
             }
 
+            _stats_cache["value"] = stats
+            _stats_cache["expires"] = time.monotonic() + _STATS_CACHE_TTL
+
             self.log_operation("get_application_statistics", {"total_applications": total_applications})
 
             return self.success_response(stats, "Statistics retrieved successfully")
@@ -642,12 +743,7 @@ class ApplicationService(BaseService):
             else:
                 cursor = self.collection.find(query).sort("created_at", -1).skip(skip).limit(per_page)
 
-            applications = []
-            for doc in cursor:
-                doc['_id'] = str(doc['_id'])
-                if 'created_at' in doc and isinstance(doc['created_at'], datetime):
-                    doc['created_at'] = doc['created_at'].isoformat()
-                applications.append(doc)
+            applications = [_to_json_doc(doc) for doc in cursor]
 
             # Get total count
             total = self.collection.count_documents(query)
@@ -672,6 +768,91 @@ class ApplicationService(BaseService):
         except Exception as e:
             return self.handle_error("search_applications", e)
 
+    def _build_export_query(self, filters: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Build the MongoDB query for an export from its filters"""
+        query = {}
+        if filters:
+            if filters.get('status'):
+                query['status'] = filters['status']
+
+            if filters.get('position'):
+                query['puesto'] = filters['position']
+
+            if filters.get('nationality'):
+                query['nacionalidad'] = filters['nationality']
+
+            if filters.get('english_level'):
+                query['ingles_nivel'] = filters['english_level']
+
+            # Date range
+            if filters.get('from_date') or filters.get('to_date'):
+                date_filter = {}
+                if filters.get('from_date'):
+                    try:
+                        from_date = datetime.fromisoformat(filters['from_date'].replace('Z', '+00:00'))
+                        date_filter['$gte'] = from_date
+                    except ValueError:
+                        pass
+
+                if filters.get('to_date'):
+                    try:
+                        to_date = datetime.fromisoformat(filters['to_date'].replace('Z', '+00:00'))
+                        date_filter['$lte'] = to_date
+                    except ValueError:
+                        pass
+
+                if date_filter:
+                    query['created_at'] = date_filter
+
+        return query
+
+    def _export_cursor(self, query: Dict[str, Any]):
+        """Cursor over the exported fields, newest first, in large batches"""
+        return self.collection.find(query, _EXPORT_PROJECTION).sort("created_at", -1).batch_size(_EXPORT_BATCH_SIZE)
+
+    def _iter_csv_export(self, cursor):
+        """Yield the CSV export as UTF-8 chunks of up to _EXPORT_BATCH_SIZE rows"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write('\ufeff')  # BOM for Excel compatibility
+        writer.writerow([header for header, _ in _EXPORT_COLUMNS])
+        count = 0
+        try:
+            for app in cursor:
+                writer.writerow(self._export_row(app))
+                count += 1
+                if count % _EXPORT_BATCH_SIZE == 0:
+                    yield buffer.getvalue().encode('utf-8')
+                    buffer.seek(0)
+                    buffer.truncate()
+        except Exception as e:
+            # The 200 status is already sent: log, mark the file as incomplete
+            # and re-raise so the server aborts the chunked response
+            self.logger.error(f"CSV export failed after {count} rows: {e}", exc_info=True)
+            writer.writerow([f"EXPORT INCOMPLETE: failed after {count} rows"])
+            yield buffer.getvalue().encode('utf-8')
+            raise
+        yield buffer.getvalue().encode('utf-8')
+
+    def _write_xlsx_export(self, cursor, output) -> int:
+        """Write the Excel export to output and return the number of rows"""
+        import xlsxwriter
+
+        # constant_memory flushes each row to a temp file once the
+        # next row starts, so peak memory stays at about one row
+        workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+        worksheet = workbook.add_worksheet('Aplicaciones')
+        # Column formats must be set before any rows stream through
+        for idx, (_, width) in enumerate(_EXPORT_COLUMNS):
+            worksheet.set_column(idx, idx, width)
+        worksheet.write_row(0, 0, [header for header, _ in _EXPORT_COLUMNS])
+        count = 0
+        for app in cursor:
+            count += 1
+            worksheet.write_row(count, 0, self._export_row(app))
+        workbook.close()
+        return count
+
     def export_applications(self, format: str = 'excel', filters: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Export applications to CSV or Excel format
@@ -679,187 +860,233 @@ class ApplicationService(BaseService):
         Args:
             format: 'csv' or 'excel'
             filters: Filters to apply (status, date range, position, etc.)
+
+        Returns:
+            Success response whose data holds 'file' (BytesIO positioned at 0,
+            ready for send_file), 'filename', 'mimetype', 'count' and 'format'
         """
         try:
             self._ensure_initialized()
 
-            # Build query from filters
-            query = {}
-            if filters:
-                if filters.get('status'):
-                    query['status'] = filters['status']
+            query = self._build_export_query(filters)
 
-                if filters.get('position'):
-                    query['puesto'] = filters['position']
+            export_format = format.lower()
+            if export_format not in ('csv', 'excel'):
+                return self.error_response("Invalid format. Use 'csv' or 'excel'", "InvalidFormat")
 
-                if filters.get('nationality'):
-                    query['nacionalidad'] = filters['nationality']
+            # Stream rows straight from the cursor into the writer
+            cursor = self._export_cursor(query)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+            output = io.BytesIO()
+
+            if export_format == 'csv':
+                # utf-8-sig for Excel compatibility
+                text_output = io.TextIOWrapper(output, encoding='utf-8-sig', newline='')
+                writer = csv.writer(text_output)
+                writer.writerow([header for header, _ in _EXPORT_COLUMNS])
+                count = 0
+                for app in cursor:
+                    writer.writerow(self._export_row(app))
+                    count += 1
+                text_output.flush()
+                text_output.detach()
+                filename = f"applications_export_{timestamp}.csv"
+                mimetype = 'text/csv'
 
-                if filters.get('english_level'):
-                    query['ingles_nivel'] = filters['english_level']
+            else:
+                count = self._write_xlsx_export(cursor, output)
+                filename = f"applications_export_{timestamp}.xlsx"
+                mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
 
-                # Date range
-                if filters.get('from_date') or filters.get('to_date'):
-                    date_filter = {}
-                    if filters.get('from_date'):
-                        try:
-                            from_date = datetime.fromisoformat(filters['from_date'].replace('Z', '+00:00'))
-                            date_filter['$gte'] = from_date
-                        except ValueError:
-                            pass
+            if count == 0:
+                return self.error_response("No applications found with the given filters", "NoDataFound")
 
-                    if filters.get('to_date'):
-                        try:
-                            to_date = datetime.fromisoformat(filters['to_date'].replace('Z', '+00:00'))
-                            date_filter['$lte'] = to_date
-                        except ValueError:
-                            pass
+            output.seek(0)
 
-                    if date_filter:
-                        query['created_at'] = date_filter
+            self.log_operation("export_applications", {
+                "format": format,
+                "count": count,
+                "filters": filters
+            })
 
-            # Get applications
-            cursor = self.collection.find(query).sort("created_at", -1)
-            applications = list(cursor)
+            return self.success_response({
+                "file": output,
+                "filename": filename,
+                "mimetype": mimetype,
+                "count": count,
+                "format": format
+            }, f"Exported {count} applications to {format.upper()}")
 
-            if not applications:
-                return self.error_response("No applications found with the given filters", "NoDataFound")
+        except ImportError as e:
+            return self.error_response(
+                f"Required library not installed: {str(e)}. Install xlsxwriter.",
+                "DependencyError"
+            )
+        except Exception as e:
+            return self.handle_error("export_applications", e)
 
-            # Convert to pandas DataFrame for easy export
-            import pandas as pd
-            from io import BytesIO
-            import base64
-
-            # Prepare data for export
-            export_data = []
-            for app in applications:
-                export_data.append({
-                    'ID': str(app.get('_id', '')),
-                    'Nombre': app.get('nombre', ''),
-                    'Apellido': app.get('apellido', ''),
-                    'Email': app.get('email', ''),
-                    'Teléfono': app.get('telefono', ''),
-                    'Nacionalidad': app.get('nacionalidad', ''),
-                    'Nivel de Inglés': app.get('ingles_nivel', ''),
-                    'Puesto': app.get('puesto', ''),
-                    'Puestos Adicionales': ', '.join(app.get('puestos_adicionales', [])),
-                    'Experiencia': app.get('experiencia', ''),
-                    'Estado': app.get('status', 'pending'),
-                    'CV URL': app.get('cv_url', ''),
-                    'Foto URL': app.get('foto_url', ''),
-                    'Fecha de Postulación': app.get('created_at', '').isoformat() if isinstance(app.get('created_at'), datetime) else str(app.get('created_at', ''))
-                })
-
-            df = pd.DataFrame(export_data)
-
-            # Generate file based on format
-            if format.lower() == 'csv':
-                output = BytesIO()
-                df.to_csv(output, index=False, encoding='utf-8-sig')  # utf-8-sig for Excel compatibility
-                output.seek(0)
-                file_content = base64.b64encode(output.read()).decode('utf-8')
-                filename = f"applications_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                mimetype = 'text/csv'
+    def export_applications_stream(self, format: str = 'excel', filters: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Export applications as a chunk generator for a streaming HTTP response
 
-            elif format.lower() == 'excel':
-                output = BytesIO()
-                with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                    df.to_excel(writer, index=False, sheet_name='Aplicaciones')
-
-                    # Auto-adjust column widths
-                    worksheet = writer.sheets['Aplicaciones']
-                    for idx, col in enumerate(df.columns):
-                        max_length = max(
-                            df[col].astype(str).apply(len).max(),
-                            len(col)
-                        ) + 2
-                        worksheet.column_dimensions[chr(65 + idx)].width = min(max_length, 50)
-
-                output.seek(0)
-                file_content = base64.b64encode(output.read()).decode('utf-8')
-                filename = f"applications_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        Args:
+            format: 'csv' or 'excel'
+            filters: Filters to apply (status, date range, position, etc.)
 
-            else:
+        Returns:
+            Success response whose data holds 'stream' (iterable of bytes),
+            'filename', 'mimetype', 'count' and 'format'
+        """
+        try:
+            self._ensure_initialized()
+
+            query = self._build_export_query(filters)
+
+            export_format = format.lower()
+            if export_format not in ('csv', 'excel'):
                 return self.error_response("Invalid format. Use 'csv' or 'excel'", "InvalidFormat")
 
-            self.log_operation("export_applications", {
+            count = self.collection.count_documents(query)
+            if count == 0:
+                return self.error_response("No applications found with the given filters", "NoDataFound")
+
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            cursor = self._export_cursor(query)
+            if export_format == 'csv':
+                # Run the query and fetch the first batch now, so query errors
+                # become an error response instead of a truncated download
+                first = next(cursor, None)
+                rows = itertools.chain((first,), cursor) if first is not None else iter(())
+                stream = self._iter_csv_export(rows)
+                filename = f"applications_export_{timestamp}.csv"
+                mimetype = 'text/csv; charset=utf-8'
+            else:
+                # An xlsx is a zip that is only complete once closed, so it is
+                # built here, before the response starts, and sent in one chunk
+                output = io.BytesIO()
+                self._write_xlsx_export(cursor, output)
+                stream = iter((output.getvalue(),))
+                filename = f"applications_export_{timestamp}.xlsx"
+                mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+            self.log_operation("export_applications_stream", {
                 "format": format,
-                "count": len(applications),
+                "count": count,
                 "filters": filters
             })
 
             return self.success_response({
-                "file_content": file_content,
+                "stream": stream,
                 "filename": filename,
                 "mimetype": mimetype,
-                "count": len(applications),
+                "count": count,
                 "format": format
-            }, f"Exported {len(applications)} applications to {format.upper()}")
+            }, f"Exporting {count} applications to {format.upper()}")
 
         except ImportError as e:
             return self.error_response(
-                f"Required library not installed: {str(e)}. Install pandas and openpyxl.",
+                f"Required library not installed: {str(e)}. Install xlsxwriter.",
                 "DependencyError"
             )
         except Exception as e:
-            return self.handle_error("export_applications", e)
+            return self.handle_error("export_applications_stream", e)
+
+    @staticmethod
+    def _export_row(app: Dict[str, Any]) -> List[Any]:
+        """Build one export row, in _EXPORT_COLUMNS order, from an application document"""
+        puestos_adicionales = app.get('puestos_adicionales') or ''
+        if not isinstance(puestos_adicionales, str):
+            puestos_adicionales = ', '.join(puestos_adicionales)
+        created_at = app.get('created_at', '')
+
+        return [
+            str(app.get('_id', '')),
+            app.get('nombre', ''),
+            app.get('apellido', ''),
+            app.get('email', ''),
+            app.get('telefono', ''),
+            app.get('nacionalidad', ''),
+            app.get('ingles_nivel', ''),
+            app.get('puesto', ''),
+            puestos_adicionales,
+            app.get('experiencia', ''),
+            app.get('status', 'pending'),
+            app.get('cv_url', ''),
+            app.get('foto_url', ''),
+            created_at.isoformat() if isinstance(created_at, datetime) else str(created_at)
+        ]
 
     def get_advanced_filters_options(self) -> Dict[str, Any]:
         """Get available options for advanced filters"""
         try:
-            self._ensure_initialized()
+            if time.monotonic() < _filters_cache["expires"]:
+                return self.success_response(_filters_cache["value"])
 
-            # Get unique values for filters
-            nationalities = self.collection.distinct("nacionalidad")
-            positions = self.collection.distinct("puesto")
-            english_levels = self.collection.distinct("ingles_nivel")
-            statuses = self.collection.distinct("status")
-
-            # Get date range
-            oldest = self.collection.find_one({}, {"created_at": 1}, sort=[("created_at", 1)])
-            newest = self.collection.find_one({}, {"created_at": 1}, sort=[("created_at", -1)])
-
-            min_date = None
-            max_date = None
-            if oldest and oldest.get('created_at'):
-                created_at = oldest.get('created_at')
-                min_date = created_at.isoformat() if isinstance(created_at, datetime) else str(created_at)
-            if newest and newest.get('created_at'):
-                created_at = newest.get('created_at')
-                max_date = created_at.isoformat() if isinstance(created_at, datetime) else str(created_at)
+            self._ensure_initialized()
 
-            return self.success_response({
-                "nationalities": sorted([n for n in nationalities if n]),
-                "positions": sorted([p for p in positions if p]),
-                "english_levels": sorted([e for e in english_levels if e]),
-                "statuses": sorted([s for s in statuses if s]),
+            # Unique values and date range in a single collection pass
+            pipeline = [{"$group": {
+                "_id": None,
+                "nationalities": {"$addToSet": "$nacionalidad"},
+                "positions": {"$addToSet": "$puesto"},
+                "english_levels": {"$addToSet": "$ingles_nivel"},
+                "statuses": {"$addToSet": "$status"},
+                "min_date": {"$min": "$created_at"},
+                "max_date": {"$max": "$created_at"}
+            }}]
+            group = next(self.collection.aggregate(pipeline), {})
+
+            min_date = group.get('min_date')
+            max_date = group.get('max_date')
+            if min_date is not None:
+                min_date = min_date.isoformat() if isinstance(min_date, datetime) else str(min_date)
+            if max_date is not None:
+                max_date = max_date.isoformat() if isinstance(max_date, datetime) else str(max_date)
+
+            options = {
+                "nationalities": sorted([n for n in group.get('nationalities', []) if n]),
+                "positions": sorted([p for p in group.get('positions', []) if p]),
+                "english_levels": sorted([e for e in group.get('english_levels', []) if e]),
+                "statuses": sorted([s for s in group.get('statuses', []) if s]),
                 "date_range": {
                     "min": min_date,
                     "max": max_date
                 }
-            })
+            }
+
+            _filters_cache["value"] = options
+            _filters_cache["expires"] = time.monotonic() + _FILTERS_CACHE_TTL
+
+            return self.success_response(options)
 
         except Exception as e:
             return self.handle_error("get_advanced_filters_options", e)
 
     def health_check(self) -> Dict[str, Any]:
-        """Check service health"""
+        """Check service health (probe result reused for _HEALTH_CACHE_TTL seconds)"""
+        if time.monotonic() < _health_cache["expires"]:
+            return _health_cache["value"]
+
         try:
             self._ensure_initialized()
 
-            # Test database connection
-            self.collection.find_one({}, {"_id": 1})
+            # Test database connection (metadata only, no document scan)
+            self.collection.estimated_document_count()
 
-            return {
+            result = {
                 "status": "healthy",
                 "database_connected": True,
                 "service": "ApplicationService"
             }
         except Exception as e:
-            return {
+            result = {
                 "status": "unhealthy",
                 "database_connected": False,
                 "error": str(e),
                 "service": "ApplicationService"
             }
+
+        _health_cache["value"] = result
+        _health_cache["expires"] = time.monotonic() + _HEALTH_CACHE_TTL
+        return result
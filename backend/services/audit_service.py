@@ -2,11 +2,26 @@
 Audit Logging Service
 Comprehensive audit logging for admin actions and system events
 """
+import atexit
+import csv
+import io
+import itertools
+import json
 import logging
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
 from services.base_service import BaseService
+from config.database import get_database
+from config.constants import COLLECTIONS
 
 class AuditEventType(Enum):
     """Audit event types"""
@@ -56,13 +71,213 @@ class AuditLogLevel(Enum):
     ERROR = "error"
     CRITICAL = "critical"
 
+@dataclass(slots=True)
+class AuditEntry:
+    """In-memory audit log entry (slotted: no per-entry dict)"""
+    id: str
+    timestamp: str
+    event_type: str
+    level: str
+    admin_id: Optional[str] = None
+    username: Optional[str] = None
+    role: Optional[str] = None
+    ip_address: Optional[str] = None
+    user_agent: Optional[str] = None
+    resource_type: Optional[str] = None
+    resource_id: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+    created_at: str = ''
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for database storage and API responses"""
+        return {
+            'id': self.id,
+            'timestamp': self.timestamp,
+            'event_type': self.event_type,
+            'level': self.level,
+            'admin_id': self.admin_id,
+            'username': self.username,
+            'role': self.role,
+            'ip_address': self.ip_address,
+            'user_agent': self.user_agent,
+            'resource_type': self.resource_type,
+            'resource_id': self.resource_id,
+            'details': self.details,
+            'created_at': self.created_at
+        }
+
+
+# Buffered audit writes are flushed at this many events or after this delay
+_FLUSH_BATCH_SIZE = 100
+_FLUSH_INTERVAL = 0.25  # seconds
+
+# Events kept for writing while the database is unreachable (oldest dropped first)
+_PENDING_MAX = 10000
+
+# Backoff between attempts to reach the audit collection
+_RECONNECT_INITIAL = 1.0  # seconds
+_RECONNECT_MAX = 60.0  # seconds
+
+# Values BSON stores as-is; anything else in event details is stringified
+_BSON_SCALARS = (str, bool, float, bytes, datetime, ObjectId, type(None))
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _bson_safe(value: Any) -> Any:
+    """Return value with everything BSON cannot encode converted to str"""
+    if isinstance(value, _BSON_SCALARS):
+        return value
+    if isinstance(value, int):
+        return value if _INT64_MIN <= value <= _INT64_MAX else str(value)
+    if isinstance(value, dict):
+        return {str(key): _bson_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_bson_safe(item) for item in value]
+    return str(value)
+
+
 class AuditService(BaseService):
     """Audit logging service for tracking admin actions and system events"""
 
+    # Logging level for each audit level
+    _LEVEL_DISPATCH = {
+        AuditLogLevel.INFO: logging.INFO,
+        AuditLogLevel.WARNING: logging.WARNING,
+        AuditLogLevel.ERROR: logging.ERROR,
+        AuditLogLevel.CRITICAL: logging.CRITICAL
+    }
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(logger)
-        # In production, this would connect to a dedicated audit database
-        self.audit_logs = []  # Temporary in-memory storage
+        self.collection = None
+        # Connection attempts back off instead of giving up after one failure
+        self._connect_lock = threading.Lock()
+        self._connect_delay = _RECONNECT_INITIAL
+        self._next_connect_at = 0.0
+        # Recent events of this process; the audit_logs collection is the
+        # durable store and is used for queries whenever it is reachable.
+        # Entries are appended in time order; _timestamps mirrors their ISO
+        # timestamps so date ranges can be located with bisect.
+        self.audit_logs: List[AuditEntry] = []
+        self._timestamps: List[str] = []
+        # Positions of each admin's / event type's entries (also time-ordered).
+        # Positions are absolute; _base is the number of entries dropped from
+        # the front of audit_logs, so an entry lives at audit_logs[pos - _base].
+        self._by_admin: Dict[str, List[int]] = defaultdict(list)
+        self._by_type: Dict[str, List[int]] = defaultdict(list)
+        self._base = 0
+        # Guards audit_logs, _timestamps, the position indexes and _base,
+        # which request threads append to while others query or trim them
+        self._memory_lock = threading.Lock()
+        # Cap on in-memory entries; the oldest tenth is dropped when exceeded
+        self._max_entries = max(1, int(os.getenv('AUDIT_INMEM_MAX', '50000')))
+        # Sequence for audit ids; unlike len(audit_logs) it never repeats after trimming
+        self._id_counter = itertools.count(1)
+        # Entries waiting to be written to the audit collection in one batch.
+        # A background thread (started on first use, after any gunicorn
+        # --preload fork) connects to the database and writes them.
+        self._pending: List[AuditEntry] = []
+        self._pending_cond = threading.Condition()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_thread_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _get_collection(self):
+        """Return the audit_logs collection, or None while the database is unavailable
+
+        A failed attempt is retried after an exponential backoff instead of
+        disabling persistence for the rest of the process.
+        """
+        if self.collection is not None:
+            return self.collection
+        with self._connect_lock:
+            if self.collection is None and time.monotonic() >= self._next_connect_at:
+                db = get_database()
+                if db is not None:
+                    self.collection = db[COLLECTIONS['audit_logs']]
+                    self._connect_delay = _RECONNECT_INITIAL
+                else:
+                    self.logger.warning(
+                        f"Audit log database unavailable, retrying in {self._connect_delay:.0f}s"
+                    )
+                    self._next_connect_at = time.monotonic() + self._connect_delay
+                    self._connect_delay = min(self._connect_delay * 2, _RECONNECT_MAX)
+        return self.collection
+
+    def _ensure_flush_thread(self):
+        """Start the background flush thread if it is not running"""
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            return
+        with self._flush_thread_lock:
+            if self._flush_thread is None or not self._flush_thread.is_alive():
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, name="audit-flush", daemon=True
+                )
+                self._flush_thread.start()
+
+    def _flush_loop(self):
+        """Write queued entries when a batch fills up or the flush interval elapses"""
+        while True:
+            with self._pending_cond:
+                while not self._pending:
+                    self._pending_cond.wait()
+                if len(self._pending) < _FLUSH_BATCH_SIZE:
+                    self._pending_cond.wait(_FLUSH_INTERVAL)
+            self.flush()
+            if self.collection is None:
+                # Unreachable: sleep until the next connection attempt is due
+                time.sleep(max(_FLUSH_INTERVAL, self._next_connect_at - time.monotonic()))
+
+    def _queue_for_insert(self, entry: AuditEntry):
+        """Buffer an entry for the background flush thread"""
+        with self._pending_cond:
+            self._pending.append(entry)
+            self._pending_cond.notify()
+        self._ensure_flush_thread()
+
+    def flush(self):
+        """Write buffered audit entries to the audit collection
+
+        Entries are kept for a later attempt while the database is unreachable.
+        """
+        with self._pending_cond:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        collection = self._get_collection()
+        if collection is None:
+            with self._pending_cond:
+                self._pending[:0] = batch
+                overflow = len(self._pending) - _PENDING_MAX
+                if overflow > 0:
+                    del self._pending[:overflow]
+            if overflow > 0:
+                self.logger.warning(f"Dropped {overflow} unsaved audit events while the database was unavailable")
+            return
+
+        # Documents are built here, off the request path
+        documents = [entry.to_dict() for entry in batch]
+        try:
+            # Unordered so one bad document does not stop the rest
+            collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            # The server wrote every document it did not list as an error
+            rejected = len(e.details.get('writeErrors', []))
+            self.logger.warning(f"Audit database rejected {rejected} of {len(batch)} events: {e}")
+        except Exception as e:
+            # The batch failed as a whole (e.g. while encoding it), so save the
+            # documents one by one. Documents already sent carry their _id, so
+            # a repeat is rejected as a duplicate instead of stored twice.
+            self.logger.warning(f"Failed to persist {len(batch)} audit events as a batch, retrying singly: {e}")
+            failed = 0
+            for document in documents:
+                try:
+                    collection.insert_one(document)
+                except Exception:
+                    failed += 1
+            if failed:
+                self.logger.warning(f"Failed to persist {failed} of {len(batch)} audit events")
 
     def log_event(self,
                   event_type: AuditEventType,
@@ -77,42 +292,55 @@ class AuditService(BaseService):
                   resource_id: Optional[str] = None) -> Dict[str, Any]:
         """Log an audit event"""
         try:
-            timestamp = datetime.now(timezone.utc)
-
-            audit_entry = {
-                'id': f"audit_{timestamp.strftime('%Y%m%d_%H%M%S')}_{len(self.audit_logs) + 1}",
-                'timestamp': timestamp.isoformat(),
-                'event_type': event_type.value,
-                'level': level.value,
-                'admin_id': admin_id,
-                'username': username,
-                'role': role,
-                'ip_address': ip_address,
-                'user_agent': user_agent,
-                'resource_type': resource_type,
-                'resource_id': resource_id,
-                'details': details or {},
-                'created_at': timestamp.isoformat()
-            }
-
-            # Store in memory (in production, store in database)
-            self.audit_logs.append(audit_entry)
-
-            # Also log to application logger
-            log_message = f"AUDIT [{event_type.value}] User: {username or 'Unknown'} ({role or 'Unknown'}) - {details or {}}"
-
-            if level == AuditLogLevel.INFO:
-                self.logger.info(log_message)
-            elif level == AuditLogLevel.WARNING:
-                self.logger.warning(log_message)
-            elif level == AuditLogLevel.ERROR:
-                self.logger.error(log_message)
-            elif level == AuditLogLevel.CRITICAL:
-                self.logger.critical(log_message)
+            event_value = event_type.value
+            safe_details = _bson_safe(details) if details else {}
+
+            # The timestamp is taken under the lock so entries stay in time
+            # order for the bisect lookups
+            with self._memory_lock:
+                timestamp = datetime.now(timezone.utc)
+                timestamp_iso = timestamp.isoformat()
+
+                audit_entry = AuditEntry(
+                    id=f"audit_{timestamp.strftime('%Y%m%d_%H%M%S')}_{next(self._id_counter)}",
+                    timestamp=timestamp_iso,
+                    event_type=event_value,
+                    level=level.value,
+                    admin_id=admin_id,
+                    username=username,
+                    role=role,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                    details=safe_details,
+                    created_at=timestamp_iso
+                )
+
+                position = self._base + len(self.audit_logs)
+                self.audit_logs.append(audit_entry)
+                self._timestamps.append(timestamp_iso)
+                if admin_id:
+                    self._by_admin[admin_id].append(position)
+                self._by_type[event_value].append(position)
+                if len(self.audit_logs) > self._max_entries:
+                    self._drop_oldest(len(self.audit_logs) - self._max_entries + self._max_entries // 10)
+
+            # Queue for the audit collection (written by the flush thread)
+            self._queue_for_insert(audit_entry)
+
+            # Also log to application logger (formatted only if the level is enabled)
+            log_level = self._LEVEL_DISPATCH.get(level, logging.INFO)
+            if self.logger.isEnabledFor(log_level):
+                self.logger.log(
+                    log_level,
+                    "AUDIT [%s] User: %s (%s) - %s",
+                    event_value, username or 'Unknown', role or 'Unknown', details or {}
+                )
 
             return self.success_response({
-                'audit_id': audit_entry['id'],
-                'timestamp': audit_entry['timestamp'],
+                'audit_id': audit_entry.id,
+                'timestamp': audit_entry.timestamp,
                 'logged': True
             }, "Audit event logged successfully")
 
@@ -253,29 +481,49 @@ class AuditService(BaseService):
                       offset: int = 0) -> Dict[str, Any]:
         """Retrieve audit logs with filtering"""
         try:
-            filtered_logs = self.audit_logs.copy()
-
-            # Apply filters
+            collection = self._get_collection()
+            if collection is not None:
+                self.flush()
+                return self._get_audit_logs_from_db(
+                    collection, admin_id, event_type, start_date, end_date, limit, offset
+                )
+
+            # Apply the remaining filters in a single pass over the date window,
+            # walking it backwards so results come out newest first
+            predicates = []
             if admin_id:
-                filtered_logs = [log for log in filtered_logs if log.get('admin_id') == admin_id]
-
+                predicates.append(lambda log: log.admin_id == admin_id)
+            event_value = event_type.value if event_type else None
             if event_type:
-                filtered_logs = [log for log in filtered_logs if log.get('event_type') == event_type.value]
-
-            if start_date:
-                start_iso = start_date.isoformat()
-                filtered_logs = [log for log in filtered_logs if log.get('timestamp', '') >= start_iso]
-
-            if end_date:
-                end_iso = end_date.isoformat()
-                filtered_logs = [log for log in filtered_logs if log.get('timestamp', '') <= end_iso]
-
-            # Sort by timestamp (newest first)
-            filtered_logs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-
-            # Apply pagination
-            total_count = len(filtered_logs)
-            paginated_logs = filtered_logs[offset:offset + limit]
+                predicates.append(lambda log: log.event_type == event_value)
+
+            with self._memory_lock:
+                lo, hi = self._time_bounds(start_date, end_date)
+                candidates = []
+                if admin_id:
+                    candidates.append(self._by_admin.get(admin_id, []))
+                if event_type:
+                    candidates.append(self._by_type.get(event_value, []))
+
+                if candidates:
+                    # Only visit entries listed in the most selective index
+                    positions = min(candidates, key=len)
+                    base = self._base
+                    first = bisect_left(positions, lo + base)
+                    last = bisect_left(positions, hi + base)
+                    window = (self.audit_logs[pos - base] for pos in reversed(positions[first:last]))
+                    filtered_logs = [log for log in window if all(p(log) for p in predicates)]
+
+                    # Apply pagination
+                    total_count = len(filtered_logs)
+                    page = filtered_logs[offset:offset + limit]
+                else:
+                    # Date filter only: the page can be sliced straight from the window
+                    total_count = hi - lo
+                    page_end = max(lo, hi - offset)
+                    page = self.audit_logs[max(lo, page_end - limit):page_end][::-1]
+
+            paginated_logs = [log.to_dict() for log in page]
 
             return self.success_response({
                 'logs': paginated_logs,
@@ -288,43 +536,117 @@ class AuditService(BaseService):
         except Exception as e:
             return self.handle_error("get_audit_logs", e)
 
+    def _time_bounds(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[int, int]:
+        """Return the in-memory index range covering the dates via binary search
+
+        Callers must hold _memory_lock.
+        """
+        lo = bisect_left(self._timestamps, start_date.isoformat()) if start_date else 0
+        hi = bisect_right(self._timestamps, end_date.isoformat()) if end_date else len(self._timestamps)
+        return lo, hi
+
+    def _time_slice(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> List[Dict[str, Any]]:
+        """Return the in-memory entries within the date range"""
+        with self._memory_lock:
+            lo, hi = self._time_bounds(start_date, end_date)
+            return self.audit_logs[lo:hi]
+
+    def _drop_oldest(self, count: int):
+        """Remove the oldest in-memory entries and advance the index base
+
+        Callers must hold _memory_lock.
+        """
+        if count <= 0:
+            return
+        del self.audit_logs[:count]
+        del self._timestamps[:count]
+        self._base += count
+        for index in (self._by_admin, self._by_type):
+            for key in list(index):
+                positions = index[key]
+                del positions[:bisect_left(positions, self._base)]
+                if not positions:
+                    del index[key]
+
+    def _get_audit_logs_from_db(self, collection,
+                                admin_id: Optional[str],
+                                event_type: Optional[AuditEventType],
+                                start_date: Optional[datetime],
+                                end_date: Optional[datetime],
+                                limit: int,
+                                offset: int) -> Dict[str, Any]:
+        """Filter, sort and paginate audit logs on the server using the audit indexes"""
+        query = self._date_query(start_date, end_date)
+        if admin_id:
+            query['admin_id'] = admin_id
+        if event_type:
+            query['event_type'] = event_type.value
+
+        logs = list(
+            collection.find(query, {'_id': 0})
+            .sort('timestamp', -1)
+            .skip(offset)
+            .limit(limit)
+        )
+        total_count = collection.count_documents(query) if query else collection.estimated_document_count()
+
+        return self.success_response({
+            'logs': logs,
+            'total_count': total_count,
+            'limit': limit,
+            'offset': offset,
+            'has_more': offset + limit < total_count
+        }, "Audit logs retrieved successfully")
+
+    @staticmethod
+    def _date_query(start_date: Optional[datetime], end_date: Optional[datetime]) -> Dict[str, Any]:
+        """Build the timestamp range filter for audit collection queries"""
+        query: Dict[str, Any] = {}
+        if start_date or end_date:
+            query['timestamp'] = {}
+            if start_date:
+                query['timestamp']['$gte'] = start_date.isoformat()
+            if end_date:
+                query['timestamp']['$lte'] = end_date.isoformat()
+        return query
+
+    def _count_events_in_db(self, collection,
+                            start_date: Optional[datetime],
+                            end_date: Optional[datetime]) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+        """Count events by type, level and admin with one aggregation on the server"""
+        pipeline: List[Dict[str, Any]] = []
+        query = self._date_query(start_date, end_date)
+        if query:
+            pipeline.append({'$match': query})
+        pipeline.append({'$facet': {
+            name: [{'$group': {'_id': f'${field}', 'count': {'$sum': 1}}}]
+            for name, field in (('by_type', 'event_type'), ('by_level', 'level'), ('by_admin', 'username'))
+        }})
+        facets = next(collection.aggregate(pipeline), {})
+        return tuple(
+            {group['_id']: group['count'] for group in facets.get(name, [])}
+            for name in ('by_type', 'by_level', 'by_admin')
+        )
+
     def get_audit_statistics(self,
                            start_date: Optional[datetime] = None,
                            end_date: Optional[datetime] = None) -> Dict[str, Any]:
         """Get audit log statistics"""
         try:
-            filtered_logs = self.audit_logs.copy()
-
-            # Apply date filters
-            if start_date:
-                start_iso = start_date.isoformat()
-                filtered_logs = [log for log in filtered_logs if log.get('timestamp', '') >= start_iso]
-
-            if end_date:
-                end_iso = end_date.isoformat()
-                filtered_logs = [log for log in filtered_logs if log.get('timestamp', '') <= end_iso]
-
-            # Calculate statistics
-            total_events = len(filtered_logs)
-            events_by_type = {}
-            events_by_level = {}
-            events_by_admin = {}
-
-            for log in filtered_logs:
-                # By event type
-                event_type = log.get('event_type', 'unknown')
-                events_by_type[event_type] = events_by_type.get(event_type, 0) + 1
-
-                # By level
-                level = log.get('level', 'info')
-                events_by_level[level] = events_by_level.get(level, 0) + 1
-
-                # By admin
-                username = log.get('username', 'unknown')
-                events_by_admin[username] = events_by_admin.get(username, 0) + 1
+            collection = self._get_collection()
+            if collection is not None:
+                self.flush()
+                events_by_type, events_by_level, events_by_admin = self._count_events_in_db(
+                    collection, start_date, end_date
+                )
+            else:
+                filtered_logs = self._time_slice(start_date, end_date)
+                events_by_type = dict(Counter(log.event_type for log in filtered_logs))
+                events_by_level = dict(Counter(log.level for log in filtered_logs))
+                events_by_admin = dict(Counter(log.username for log in filtered_logs))
 
             return self.success_response({
-                'total_events': total_events,
+                'total_events': sum(events_by_type.values()),
                 'events_by_type': events_by_type,
                 'events_by_level': events_by_level,
                 'events_by_admin': events_by_admin,
@@ -366,28 +688,25 @@ class AuditService(BaseService):
                 }, "Audit logs exported successfully")
 
             elif format_type.lower() == 'csv':
-                # Convert to CSV format (simplified)
-                csv_data = []
+                output = io.StringIO()
                 if logs:
-                    # Headers
-                    headers = ['timestamp', 'event_type', 'username', 'role', 'ip_address', 'details']
-                    csv_data.append(','.join(headers))
-
-                    # Data rows
-                    for log in logs:
-                        row = [
+                    writer = csv.writer(output, lineterminator='\n')
+                    writer.writerow(['timestamp', 'event_type', 'username', 'role', 'ip_address', 'details'])
+                    writer.writerows(
+                        [
                             log.get('timestamp', ''),
                             log.get('event_type', ''),
                             log.get('username', ''),
                             log.get('role', ''),
                             log.get('ip_address', ''),
-                            str(log.get('details', {}))
+                            json.dumps(log.get('details', {}), ensure_ascii=False, default=str)
                         ]
-                        csv_data.append(','.join(f'"{field}"' for field in row))
+                        for log in logs
+                    )
 
                 return self.success_response({
                     'format': 'csv',
-                    'data': '\n'.join(csv_data),
+                    'data': output.getvalue(),
                     'total_exported': len(logs)
                 }, "Audit logs exported as CSV successfully")
 
@@ -402,23 +721,29 @@ class AuditService(BaseService):
         try:
             cutoff_date = datetime.now(timezone.utc).replace(
                 hour=0, minute=0, second=0, microsecond=0
-            ) - timezone.timedelta(days=days_to_keep)
+            ) - timedelta(days=days_to_keep)
             cutoff_iso = cutoff_date.isoformat()
 
-            initial_count = len(self.audit_logs)
-            self.audit_logs = [
-                log for log in self.audit_logs
-                if log.get('timestamp', '') >= cutoff_iso
-            ]
-            final_count = len(self.audit_logs)
-            removed_count = initial_count - final_count
+            # Entries are time-ordered, so the old ones form a prefix
+            with self._memory_lock:
+                removed_count = bisect_left(self._timestamps, cutoff_iso)
+                self._drop_oldest(removed_count)
+                remaining_count = len(self.audit_logs)
 
-            return self.success_response({
+            result = {
                 'removed_logs': removed_count,
-                'remaining_logs': final_count,
+                'remaining_logs': remaining_count,
                 'cutoff_date': cutoff_iso,
                 'days_kept': days_to_keep
-            }, f"Cleaned up {removed_count} old audit logs")
+            }
+
+            collection = self._get_collection()
+            if collection is not None:
+                self.flush()
+                deleted = collection.delete_many({'timestamp': {'$lt': cutoff_iso}})
+                result['removed_from_database'] = deleted.deleted_count
+
+            return self.success_response(result, f"Cleaned up {removed_count} old audit logs")
 
         except Exception as e:
             return self.handle_error("cleanup_old_logs", e)
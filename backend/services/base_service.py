@@ -3,39 +3,65 @@ Base Service
 Base class for all services with common functionality
 """
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Optional, Dict, Any
 from abc import ABC, abstractmethod
 
+# Default seconds a service health check may take before it is reported as timed out
+_HEALTH_CHECK_TIMEOUT = 5.0
+
+# log_operation level names to logging levels
+_LEVEL_MAP = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL
+}
+
 
 class BaseService(ABC):
     """Base service class with common functionality"""
 
+    # Seconds ServiceManager waits for health_check; services whose probe does
+    # network I/O derive it from that client's own timeout
+    health_check_timeout: float = _HEALTH_CHECK_TIMEOUT
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize base service with logger"""
-        self.logger = logger or logging.getLogger(self.__class__.__name__)
-
-    def log_operation(self, operation: str, details: Dict[str, Any] = None, level: str = "info"):
-        """Log service operations with structured data"""
-        log_data = {
-            "service": self.__class__.__name__,
-            "operation": operation,
-            **(details or {})
-        }
+        self._service_name = type(self).__name__
+        self.logger = logger or logging.getLogger(self._service_name)
+
+    def log_operation(self, operation: str, details: Dict[str, Any] = None, level: str = "info", **fields):
+        """Log service operations with structured data
 
-        log_method = getattr(self.logger, level, self.logger.info)
-        log_method(f"Service operation: {operation}", extra=log_data)
+        Structured fields can be given as a details dict or as keyword arguments.
+        """
+        log_level = _LEVEL_MAP.get(level, logging.INFO)
+        if not self.logger.isEnabledFor(log_level):
+            return
+
+        log_data = {"service": self._service_name, "operation": operation, **fields}
+        if details:
+            log_data.update(details)
+
+        self.logger.log(log_level, "Service operation: %s", operation, extra=log_data)
 
     def handle_error(self, operation: str, error: Exception, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Handle and log service errors"""
-        error_data = {
-            "service": self.__class__.__name__,
-            "operation": operation,
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            **(context or {})
-        }
-
-        self.logger.error(f"Service error in {operation}", extra=error_data)
+        if self.logger.isEnabledFor(logging.ERROR):
+            error_data = {
+                "service": self._service_name,
+                "operation": operation,
+                "error_type": type(error).__name__,
+                "error_message": str(error)
+            }
+            if context:
+                error_data.update(context)
+
+            self.logger.error("Service error in %s", operation, extra=error_data)
 
         return {
             "success": False,
@@ -75,6 +101,10 @@ class ServiceManager:
     def __init__(self):
         self._services = {}
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Latest health probe per service; a running probe is never resubmitted
+        self._probes: Dict[str, Future] = {}
+        self._probes_lock = threading.Lock()
 
     def register_service(self, name: str, service: BaseService):
         """Register a service instance"""
@@ -90,31 +120,47 @@ class ServiceManager:
         return list(self._services.keys())
 
     def health_check(self) -> Dict[str, Any]:
-        """Check health status of all services"""
+        """Check health status of all services, probing them concurrently"""
         health_status = {
             "status": "healthy",
             "services": {}
         }
 
-        for name, service in self._services.items():
+        started = time.monotonic()
+        futures = {}
+        with self._probes_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="health-check")
+
+            for name, service in self._services.items():
+                future = self._probes.get(name)
+                if future is None or future.done():
+                    # If service has health_check method, use it
+                    probe = service.health_check if hasattr(service, 'health_check') else lambda: {"status": "healthy"}
+                    future = self._probes[name] = self._pool.submit(probe)
+                # A probe still running from an earlier check is waited on
+                # again, so a hung service holds at most one pool worker
+                futures[name] = future
+
+        for name, future in futures.items():
+            timeout = getattr(self._services[name], 'health_check_timeout', _HEALTH_CHECK_TIMEOUT)
             try:
-                # If service has health_check method, use it
-                if hasattr(service, 'health_check'):
-                    service_health = service.health_check()
-                else:
-                    service_health = {"status": "healthy"}
-
-                health_status["services"][name] = service_health
-
-                # If any service is unhealthy, mark overall as unhealthy
-                if service_health.get("status") != "healthy":
-                    health_status["status"] = "degraded"
-
+                service_health = future.result(timeout=max(0.0, started + timeout - time.monotonic()))
+            except FutureTimeoutError:
+                service_health = {
+                    "status": "unhealthy",
+                    "error": f"Health check timed out after {timeout}s"
+                }
             except Exception as e:
-                health_status["services"][name] = {
+                service_health = {
                     "status": "unhealthy",
                     "error": str(e)
                 }
+
+            health_status["services"][name] = service_health
+
+            # If any service is unhealthy, mark overall as unhealthy
+            if service_health.get("status") != "healthy":
                 health_status["status"] = "degraded"
 
         return health_status
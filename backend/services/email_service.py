@@ -2,52 +2,369 @@
 Email Service
 Business logic for email sending and management
 """
+import atexit
+import functools
 import logging
-from typing import Dict, Any, Optional, List
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Optional, List, Mapping, Tuple
 import smtplib
 import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import email.policy
+from email.message import EmailMessage
 from email.mime.base import MIMEBase
 from email import encoders
 import os
 from datetime import datetime, timezone
 import re
 
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
 from services.base_service import BaseService
 from config.email import get_email_config
 
+# Basic email address pattern, compiled once
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Seconds before a blocking SMTP connect or command gives up
+_SMTP_TIMEOUT = 10.0
+
+# TLS client context shared by every SMTP connection; building one loads the
+# system CA bundle, and SSLContext is safe to share between threads
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Seconds a cached SMTP session may sit unused before it is replaced rather
+# than reused; providers drop idle sessions after a few minutes
+_SMTP_IDLE_TTL = 100.0
+
+# Health probes are polled frequently by monitors; each uncached probe costs an
+# SMTP round trip or login, so the last result is shared at module level and
+# refreshed in the background once it is stale
+_HEALTH_CACHE_TTL = 10.0  # seconds
+_health_cache: Dict[str, Any] = {"value": None, "expires": 0.0}
+_health_refresh_lock = threading.Lock()
+
+# Timestamp shown in application emails (formatted once per message)
+_DISPLAY_TIME_FORMAT = '%d/%m/%Y a las %H:%M UTC'
+
+# Timestamp shown in admin password emails
+_ADMIN_TIME_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+# HTML template minification: <pre> blocks are kept verbatim, comments are
+# dropped and whitespace runs collapse to one space, which is how mail clients
+# render them anyway. Inside <style>, spaces around CSS punctuation go too.
+_HTML_PRESERVE_RE = re.compile(r'(<pre\b.*?</pre>|<style\b.*?</style>)', re.S | re.I)
+_HTML_COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.S)
+_WHITESPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{};:,>])\s*')
+
+
+def _minify_html(source: str) -> str:
+    """Strip the indentation, newlines and comments from an HTML template"""
+    parts = _HTML_PRESERVE_RE.split(_HTML_COMMENT_RE.sub('', source))
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            parts[i] = _WHITESPACE_RE.sub(' ', part)
+        elif part[:6].lower() == '<style':
+            parts[i] = _CSS_PUNCTUATION_RE.sub(r'\1', _WHITESPACE_RE.sub(' ', part))
+    return ''.join(parts).strip()
+
+
+class _MinifyingLoader(FileSystemLoader):
+    """FileSystemLoader that minifies HTML templates before they are compiled"""
+
+    def get_source(self, environment, template):
+        source, filename, uptodate = super().get_source(environment, template)
+        if template.endswith('.html.j2'):
+            source = _minify_html(source)
+        return source, filename, uptodate
+
+
+# Email templates, minified and compiled once at import.
+# HTML templates are autoescaped; plain-text templates are not.
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'email_templates')
+_template_env = Environment(
+    loader=_MinifyingLoader(_TEMPLATE_DIR),
+    autoescape=select_autoescape(enabled_extensions=('html.j2',), default_for_string=False),
+    keep_trailing_newline=True,
+    # Templates are read once at import; never stat the files again
+    auto_reload=False
+)
+_CONFIRMATION_HTML = _template_env.get_template('confirmation.html.j2')
+_CONFIRMATION_TEXT = _template_env.get_template('confirmation.txt.j2')
+_ADMIN_NOTIFICATION_HTML = _template_env.get_template('admin_notification.html.j2')
+_ADMIN_NOTIFICATION_TEXT = _template_env.get_template('admin_notification.txt.j2')
+_PASSWORD_RECOVERY_HTML = _template_env.get_template('password_recovery.html.j2')
+_PASSWORD_RESET_CONFIRMATION_HTML = _template_env.get_template('password_reset_confirmation.html.j2')
+_APPLICATION_RESULT_HTML = _template_env.get_template('application_result.html.j2')
+_STATUS_CHANGE_HTML = _template_env.get_template('status_change.html.j2')
+
+
+@functools.lru_cache(maxsize=8)
+def _from_header(address: str):
+    """Parsed From header for a sender address; every message reuses the same one"""
+    return email.policy.default.header_factory('From', address)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_email_config() -> Mapping[str, Any]:
+    """Read the email settings from the environment once per process
+
+    The returned mapping is read-only and shared by every EmailService.
+    Tests that change the environment call _build_email_config.cache_clear().
+    """
+    smtp_username = os.getenv('MAIL_USERNAME', '')
+    return MappingProxyType({
+        'smtp_server': os.getenv('MAIL_SERVER', 'smtp.gmail.com'),
+        'smtp_port': int(os.getenv('MAIL_PORT', '587')),
+        'use_tls': os.getenv('MAIL_USE_TLS', 'True').lower() == 'true',
+        'smtp_username': smtp_username,
+        'smtp_password': os.getenv('MAIL_PASSWORD', ''),
+        'from_email': os.getenv('MAIL_DEFAULT_SENDER', smtp_username),
+        'admin_email': os.getenv('ADMIN_EMAIL', smtp_username),
+        'max_per_connection': int(os.getenv('MAIL_MAX_PER_CONNECTION', '1000')),
+        'pool_size': int(os.getenv('MAIL_POOL_SIZE', '5')),
+        'send_text_part': os.getenv('MAIL_SEND_TEXT_PART', 'True').lower() == 'true'
+    })
+
+
+_LEADING_PERIOD_RE = re.compile(br'(?m)^\.')
+_BARE_EOL_RE = re.compile(r'(?:\r\n|\n|\r(?!\n))')
+
+
+class _PipeliningMixin:
+    """Send MAIL FROM / RCPT TO / DATA as one command group (RFC 2920)
+
+    Used only when the server advertises PIPELINING; otherwise the stock
+    smtplib command-by-command exchange is used. Replies are read back in
+    command order and reported the same way smtplib.SMTP.sendmail does.
+    """
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if not self.has_extn('pipelining'):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+
+        if isinstance(msg, str):
+            msg = _BARE_EOL_RE.sub('\r\n', msg).encode('ascii')
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+
+        mail_opts = list(mail_options)
+        if self.has_extn('size'):
+            mail_opts.insert(0, f"size={len(msg)}")
+        mail_args = (' ' + ' '.join(mail_opts)) if mail_opts else ''
+        rcpt_args = (' ' + ' '.join(rcpt_options)) if rcpt_options else ''
+
+        commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}{mail_args}"]
+        commands.extend(f"RCPT TO:{smtplib.quoteaddr(addr)}{rcpt_args}" for addr in to_addrs)
+        commands.append("DATA")
+        self.send(''.join(f"{command}\r\n" for command in commands))
+
+        # The server answers every pipelined command, in order
+        (code, resp), *rcpt_replies, (data_code, data_resp) = [
+            self.getreply() for _ in commands
+        ]
+        if code != 250:
+            self._reset_after_reply(code, data_code)
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+
+        senderrs = {
+            addr: reply for addr, reply in zip(to_addrs, rcpt_replies)
+            if reply[0] not in (250, 251)
+        }
+        if any(reply[0] == 421 for reply in rcpt_replies):
+            self.close()
+            raise smtplib.SMTPRecipientsRefused(senderrs)
+        if len(senderrs) == len(to_addrs):
+            self._reset_after_reply(data_code, data_code)
+            raise smtplib.SMTPRecipientsRefused(senderrs)
+        if data_code != 354:
+            self._reset_after_reply(data_code)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        data = _LEADING_PERIOD_RE.sub(b'..', msg)
+        if data[-2:] != b'\r\n':
+            data += b'\r\n'
+        self.send(data + b'.\r\n')
+        code, resp = self.getreply()
+        if code != 250:
+            self._reset_after_reply(code)
+            raise smtplib.SMTPDataError(code, resp)
+        return senderrs
+
+    def _reset_after_reply(self, code, data_code=None):
+        """Leave the session ready for the next transaction after a refusal
+
+        code is the reply that refused the transaction; data_code is the reply
+        to a pipelined DATA, which may have opened a data phase to be ended.
+        """
+        if code == 421 or data_code == 421:
+            self.close()
+            return
+        if data_code == 354:
+            # DATA was accepted anyway; end it empty before resetting
+            self.send(b'.\r\n')
+            self.getreply()
+        self.rset()
+
+
+class PipeliningSMTP(_PipeliningMixin, smtplib.SMTP):
+    """smtplib.SMTP with opportunistic command pipelining"""
+
+
+class PipeliningSMTP_SSL(_PipeliningMixin, smtplib.SMTP_SSL):
+    """smtplib.SMTP_SSL with opportunistic command pipelining"""
+
+
+def _quit_quietly(server: smtplib.SMTP):
+    """Close an SMTP session without raising"""
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+@dataclass
+class _PooledSMTP:
+    """An authenticated SMTP session and how much it has been used"""
+    server: smtplib.SMTP
+    sent: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class _SMTPPool:
+    """Bounded pool of authenticated SMTP sessions shared by sending threads
+
+    At most `size` sessions are in use at once; acquire() blocks beyond that.
+    Idle sessions are kept LIFO so the most recently used one, the least
+    likely to have been dropped by the server, is handed out first. A session
+    is closed after `max_per_conn` messages or `_SMTP_IDLE_TTL` idle seconds.
+    """
+
+    def __init__(self, connect: Callable[[], smtplib.SMTP], size: int, max_per_conn: int):
+        self._connect = connect
+        self.max_per_conn = max_per_conn
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _take_idle(self) -> Optional[_PooledSMTP]:
+        """Return a live idle session, closing any that have gone stale"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if time.monotonic() - conn.last_used < _SMTP_IDLE_TTL:
+                try:
+                    if conn.server.noop()[0] == 250:
+                        return conn
+                except (smtplib.SMTPException, OSError):
+                    pass
+            _quit_quietly(conn.server)
+
+    def _put_idle(self, conn: _PooledSMTP):
+        """Keep a session for reuse, closing it if the pool is already full"""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            _quit_quietly(conn.server)
+
+    def acquire(self) -> _PooledSMTP:
+        """Take an idle session or open a new one"""
+        self._slots.acquire()
+        try:
+            return self._take_idle() or _PooledSMTP(self._connect())
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn: _PooledSMTP, broken: bool = False):
+        """Return a session to the pool, closing it if broken or used up"""
+        try:
+            if broken or conn.sent >= self.max_per_conn:
+                _quit_quietly(conn.server)
+            else:
+                conn.last_used = time.monotonic()
+                self._put_idle(conn)
+        finally:
+            self._slots.release()
+
+    def check(self):
+        """NOOP an idle session, or log in on a short-lived one that is closed again"""
+        conn = self._take_idle()
+        if conn is not None:
+            self._put_idle(conn)
+        else:
+            _quit_quietly(self._connect())
+
+    def close(self):
+        """Close every idle session"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _quit_quietly(conn.server)
+
 
 class EmailService(BaseService):
     """Service for handling email operations"""
 
+    # A probe may connect, STARTTLS and log in, each bounded by _SMTP_TIMEOUT
+    health_check_timeout = 3 * _SMTP_TIMEOUT
+
+    # Application statuses as shown to candidates
+    _STATUS_TRANSLATIONS = {
+        'pending': 'En Revisión',
+        'reviewed': 'Revisada',
+        'approved': 'Aprobada',
+        'rejected': 'No Seleccionada',
+        'contacted': 'Contactado',
+        'interview': 'Entrevista Programada'
+    }
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(logger)
         self.email_config = None
         self.smtp_server = None
+        # Hot-path copies of email_config values, bound in _load_email_config
+        self._from_email = None
+        self._admin_email = None
+        self._smtp_server = None
+        self._smtp_port = None
+        self._smtp_user = None
+        self._smtp_pass = None
+        self._smtp_max_per_conn = 1000
+        self._smtp_pool_size = 5
+        # Whether messages carry a plain-text alternative to the HTML body
+        self._send_text = True
+        # Background delivery queue; the worker thread is started on first use
+        # so it is created in the serving process (gunicorn --preload forks)
+        self._queue: queue.Queue = queue.Queue()
+        self._worker_thread: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
         self._load_email_config()
+        # Authenticated SMTP sessions reused across sends and sending threads
+        self._pool = _SMTPPool(self._create_smtp_connection, self._smtp_pool_size, self._smtp_max_per_conn)
 
     def _load_email_config(self):
         """Load email configuration"""
         try:
-            import os
-            # Get email configuration from environment variables
-            smtp_server = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
-            smtp_port = int(os.getenv('MAIL_PORT', '587'))
-            use_tls = os.getenv('MAIL_USE_TLS', 'True').lower() == 'true'
-            smtp_username = os.getenv('MAIL_USERNAME', '')
-            smtp_password = os.getenv('MAIL_PASSWORD', '')
-
-            # Create email config dictionary for our service
-            self.email_config = {
-                'smtp_server': smtp_server,
-                'smtp_port': smtp_port,
-                'use_tls': use_tls,
-                'smtp_username': smtp_username,
-                'smtp_password': smtp_password,
-                'from_email': os.getenv('MAIL_DEFAULT_SENDER', smtp_username),
-                'admin_email': os.getenv('ADMIN_EMAIL', smtp_username)
-            }
+            self.email_config = config = _build_email_config()
+            self._from_email = config['from_email']
+            self._admin_email = config['admin_email']
+            self._smtp_server = config['smtp_server']
+            self._smtp_port = config['smtp_port']
+            self._smtp_user = config['smtp_username']
+            self._smtp_pass = config['smtp_password']
+            self._smtp_max_per_conn = config['max_per_connection']
+            self._smtp_pool_size = config['pool_size']
+            self._send_text = config['send_text_part']
 
             self.log_operation("load_email_config", {"status": "loaded"})
         except Exception as e:
@@ -59,41 +376,112 @@ class EmailService(BaseService):
         if not self.email_config:
             raise Exception("Email configuration not loaded")
 
-        # Create secure SSL context
-        context = ssl.create_default_context()
+        context = _SSL_CONTEXT
 
         # Use SMTP with TLS (not SMTP_SSL) for port 587
-        if self.email_config['smtp_port'] == 587:
+        if self._smtp_port == 587:
             # SMTP with STARTTLS (port 587)
-            server = smtplib.SMTP(
-                self.email_config['smtp_server'],
-                self.email_config['smtp_port']
-            )
+            server = PipeliningSMTP(self._smtp_server, self._smtp_port, timeout=_SMTP_TIMEOUT)
             server.starttls(context=context)
         else:
             # SMTP_SSL for port 465
-            server = smtplib.SMTP_SSL(
-                self.email_config['smtp_server'],
-                self.email_config['smtp_port'],
-                context=context
+            server = PipeliningSMTP_SSL(
+                self._smtp_server, self._smtp_port, context=context, timeout=_SMTP_TIMEOUT
             )
 
         # Login with credentials
-        server.login(
-            self.email_config['smtp_username'],
-            self.email_config['smtp_password']
-        )
+        server.login(self._smtp_user, self._smtp_pass)
 
         return server
 
+    def close(self):
+        """Drain the background queue and close the pooled SMTP connections"""
+        worker = self._worker_thread
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join(timeout=30)
+        self._pool.close()
+
+    def _ensure_worker(self):
+        """Start the background delivery thread if it is not running"""
+        if self._worker_thread is not None and self._worker_thread.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker_thread is None or not self._worker_thread.is_alive():
+                self._worker_thread = threading.Thread(
+                    target=self._worker, name="email-worker", daemon=True
+                )
+                self._worker_thread.start()
+
+    def _worker(self):
+        """Run queued send jobs until the shutdown sentinel arrives"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                job_id, send, args, callback = item
+                result = send(*args)
+                if not result['success']:
+                    self.logger.warning(f"Background email job {job_id} failed: {result['error']}")
+                if callback is not None:
+                    callback(job_id, result)
+            except Exception as e:
+                self.logger.error(f"Background email job failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, messages: List[Tuple[EmailMessage, List[str]]]) -> List[Optional[Exception]]:
+        """Send messages back to back over one pooled SMTP session
+
+        The session is taken from the pool once for the whole batch, replaced
+        once per message if the server drops it mid-send, and rotated when it
+        reaches the per-connection message cap.
+        Returns the exception raised for each message, or None if it was sent.
+        """
+        errors: List[Optional[Exception]] = []
+        conn = None
+        try:
+            for message, recipients in messages:
+                try:
+                    if conn is None:
+                        conn = self._pool.acquire()
+                    try:
+                        conn.server.send_message(message, to_addrs=recipients)
+                    except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                        self._pool.release(conn, broken=True)
+                        conn = None
+                        conn = self._pool.acquire()
+                        conn.server.send_message(message, to_addrs=recipients)
+                    conn.sent += 1
+                    errors.append(None)
+                    if conn.sent >= self._pool.max_per_conn:
+                        self._pool.release(conn)
+                        conn = None
+                except Exception as e:
+                    errors.append(e)
+        finally:
+            if conn is not None:
+                self._pool.release(conn)
+        return errors
+
     def validate_email_address(self, email: str) -> bool:
         """Validate email address format"""
-        if not email or not isinstance(email, str):
+        if not email or not isinstance(email, str) or '@' not in email:
             return False
 
-        # Basic email regex pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email.strip()) is not None
+        return _EMAIL_RE.match(email.strip()) is not None
+
+    def validate_emails(self, emails: List[str]) -> List[str]:
+        """Return the stripped addresses from emails that are valid"""
+        return [email for email in map(str.strip, emails) if _EMAIL_RE.match(email)]
+
+    def _valid_copy_recipients(self, field: str, emails: List[str]) -> List[str]:
+        """Return the valid addresses from a cc / bcc list, logging any that are dropped"""
+        valid = self.validate_emails(emails)
+        if len(valid) != len(emails):
+            self.logger.warning(f"Dropped {len(emails) - len(valid)} invalid {field} address(es)")
+        return valid
 
     def create_confirmation_email(self, candidate_data: Dict[str, Any]) -> Dict[str, str]:
         """Create confirmation email content"""
@@ -103,157 +491,18 @@ class EmailService(BaseService):
 
         subject = f"Confirmación de Aplicación - {puesto} - WorkWave Coast"
 
-        # HTML email template
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="es">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Confirmación de Aplicación - WorkWave Coast</title>
-            <style>
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 600px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background-color: #f4f4f4;
-                }}
-                .container {{
-                    background-color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 30px;
-                }}
-                .logo {{
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #2c5aa0;
-                    margin-bottom: 10px;
-                }}
-                .title {{
-                    color: #2c5aa0;
-                    font-size: 22px;
-                    margin-bottom: 20px;
-                }}
-                .content {{
-                    margin-bottom: 30px;
-                }}
-                .highlight {{
-                    background-color: #e8f4fd;
-                    padding: 15px;
-                    border-radius: 5px;
-                    border-left: 4px solid #2c5aa0;
-                    margin: 20px 0;
-                }}
-                .footer {{
-                    text-align: center;
-                    margin-top: 30px;
-                    padding-top: 20px;
-                    border-top: 1px solid #eee;
-                    font-size: 14px;
-                    color: #666;
-                }}
-                .next-steps {{
-                    background-color: #f8f9fa;
-                    padding: 20px;
-                    border-radius: 5px;
-                    margin: 20px 0;
-                }}
-                .next-steps h3 {{
-                    color: #2c5aa0;
-                    margin-top: 0;
-                }}
-                ul {{
-                    padding-left: 20px;
-                }}
-                li {{
-                    margin-bottom: 8px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <div class="logo">WorkWave Coast</div>
-                    <h1 class="title">¡Aplicación Recibida!</h1>
-                </div>
-
-                <div class="content">
-                    <p>Estimado/a <strong>{nombre} {apellido}</strong>,</p>
-
-                    <p>Gracias por tu interés en unirte al equipo de WorkWave Coast. Hemos recibido exitosamente tu aplicación para la posición de <strong>{puesto}</strong>.</p>
-
-                    <div class="highlight">
-                        <p><strong>✅ Tu aplicación ha sido registrada correctamente</strong></p>
-                        <p>Fecha y hora: {datetime.now(timezone.utc).strftime('%d/%m/%Y a las %H:%M UTC')}</p>
-                    </div>
-
-                    <div class="next-steps">
-                        <h3>Próximos Pasos:</h3>
-                        <ul>
-                            <li>Nuestro equipo de Recursos Humanos revisará tu aplicación a detalle</li>
-                            <li>Si tu perfil cumple con los requisitos del puesto, te contactaremos para coordinar una entrevista</li>
-                            <li>Mantente atento a tu email y teléfono para futuras comunicaciones</li>
-                        </ul>
-                    </div>
-
-                    <p>Valoramos tu tiempo e interés en formar parte de nuestro equipo. WorkWave Coast se especializa en conectar talento internacional con oportunidades laborales en la costa este de Estados Unidos.</p>
-
-                    <p>Si tienes alguna pregunta sobre tu aplicación o el proceso de selección, no dudes en contactarnos respondiendo a este email.</p>
-
-                    <p>¡Esperamos poder conocerte pronto!</p>
-
-                    <p>Saludos cordiales,<br>
-                    <strong>Equipo de Recursos Humanos</strong><br>
-                    WorkWave Coast</p>
-                </div>
-
-                <div class="footer">
-                    <p>Este es un email automático, por favor no respondas a esta dirección.</p>
-                    <p>Para consultas, contacta con nosotros en: info@workwavecoast.com</p>
-                    <p>&copy; 2024 WorkWave Coast. Todos los derechos reservados.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        # Plain text version
-        text_content = f"""
-        Estimado/a {nombre} {apellido},
-
-        Gracias por tu interés en unirte al equipo de WorkWave Coast. Hemos recibido exitosamente tu aplicación para la posición de {puesto}.
-
-        ✅ Tu aplicación ha sido registrada correctamente
-        Fecha y hora: {datetime.now(timezone.utc).strftime('%d/%m/%Y a las %H:%M UTC')}
-
-        PRÓXIMOS PASOS:
-        - Nuestro equipo de Recursos Humanos revisará tu aplicación a detalle
-        - Si tu perfil cumple con los requisitos del puesto, te contactaremos para coordinar una entrevista
-        - Mantente atento a tu email y teléfono para futuras comunicaciones
-
-        Valoramos tu tiempo e interés en formar parte de nuestro equipo. WorkWave Coast se especializa en conectar talento internacional con oportunidades laborales en la costa este de Estados Unidos.
-
-        Si tienes alguna pregunta sobre tu aplicación o el proceso de selección, no dudes en contactarnos respondiendo a este email.
-
-        ¡Esperamos poder conocerte pronto!
+        context = {
+            'nombre': nombre,
+            'apellido': apellido,
+            'puesto': puesto,
+            'timestamp': time.strftime(_DISPLAY_TIME_FORMAT, time.gmtime())
+        }
 
-        Saludos cordiales,
-        Equipo de Recursos Humanos
-        WorkWave Coast
+        # HTML email template
+        html_content = _CONFIRMATION_HTML.render(context)
 
-        ---
-        Este es un email automático, por favor no respondas a esta dirección.
-        Para consultas, contacta con nosotros en: info@workwavecoast.com
-        © 2024 WorkWave Coast. Todos los derechos reservados.
-        """
+        # Plain text version, unless only HTML is sent
+        text_content = _CONFIRMATION_TEXT.render(context) if self._send_text else None
 
         return {
             'subject': subject,
@@ -276,203 +525,31 @@ class EmailService(BaseService):
         subject = f"Nueva Aplicación - {puesto} - {nombre} {apellido}"
 
         # Create files summary
-        files_summary = ""
-        if files_info:
-            files_list = []
-            for field_name, file_info in files_info.items():
-                if file_info and file_info.get('url'):
-                    files_list.append(f"- {field_name}: {file_info.get('original_filename', 'Archivo')}")
-            if files_list:
-                files_summary = "\n".join(files_list)
-            else:
-                files_summary = "No se adjuntaron archivos"
-        else:
-            files_summary = "No se adjuntaron archivos"
+        files_list = [
+            f"- {field_name}: {file_info.get('original_filename', 'Archivo')}"
+            for field_name, file_info in (files_info or {}).items()
+            if file_info and file_info.get('url')
+        ]
+        files_summary = "\n".join(files_list) if files_list else "No se adjuntaron archivos"
+
+        context = {
+            'nombre': nombre,
+            'apellido': apellido,
+            'email': email,
+            'telefono': telefono,
+            'puesto': puesto,
+            'nacionalidad': nacionalidad,
+            'ingles_nivel': ingles_nivel,
+            'experiencia': experiencia,
+            'files_summary': files_summary,
+            'timestamp': time.strftime(_DISPLAY_TIME_FORMAT, time.gmtime())
+        }
 
         # HTML email template
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="es">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Nueva Aplicación - WorkWave Coast</title>
-            <style>
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 700px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background-color: #f8f9fa;
-                }}
-                .container {{
-                    background-color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                }}
-                .header {{
-                    background-color: #2c5aa0;
-                    color: white;
-                    padding: 20px;
-                    border-radius: 5px;
-                    text-align: center;
-                    margin-bottom: 30px;
-                }}
-                .info-grid {{
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 20px;
-                    margin-bottom: 25px;
-                }}
-                .info-item {{
-                    background-color: #f8f9fa;
-                    padding: 15px;
-                    border-radius: 5px;
-                    border-left: 3px solid #2c5aa0;
-                }}
-                .info-label {{
-                    font-weight: bold;
-                    color: #2c5aa0;
-                    font-size: 14px;
-                    margin-bottom: 5px;
-                }}
-                .info-value {{
-                    color: #333;
-                    font-size: 16px;
-                }}
-                .full-width {{
-                    grid-column: 1 / -1;
-                }}
-                .files-section {{
-                    background-color: #e8f4fd;
-                    padding: 20px;
-                    border-radius: 5px;
-                    margin: 20px 0;
-                }}
-                .admin-links {{
-                    background-color: #28a745;
-                    color: white;
-                    padding: 20px;
-                    border-radius: 5px;
-                    text-align: center;
-                    margin-top: 30px;
-                }}
-                .admin-links a {{
-                    color: white;
-                    text-decoration: none;
-                    font-weight: bold;
-                    padding: 10px 20px;
-                    background-color: rgba(255,255,255,0.2);
-                    border-radius: 5px;
-                    margin: 0 10px;
-                    display: inline-block;
-                }}
-                .timestamp {{
-                    text-align: center;
-                    color: #666;
-                    font-size: 14px;
-                    margin-top: 20px;
-                    padding-top: 20px;
-                    border-top: 1px solid #eee;
-                }}
-                @media (max-width: 600px) {{
-                    .info-grid {{
-                        grid-template-columns: 1fr;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🎯 Nueva Aplicación Recibida</h1>
-                    <p>WorkWave Coast - Panel Administrativo</p>
-                </div>
-
-                <div class="info-grid">
-                    <div class="info-item">
-                        <div class="info-label">Candidato</div>
-                        <div class="info-value">{nombre} {apellido}</div>
-                    </div>
-
-                    <div class="info-item">
-                        <div class="info-label">Email</div>
-                        <div class="info-value">{email}</div>
-                    </div>
-
-                    <div class="info-item">
-                        <div class="info-label">Teléfono</div>
-                        <div class="info-value">{telefono}</div>
-                    </div>
-
-                    <div class="info-item">
-                        <div class="info-label">Puesto Solicitado</div>
-                        <div class="info-value">{puesto}</div>
-                    </div>
-
-                    <div class="info-item">
-                        <div class="info-label">Nacionalidad</div>
-                        <div class="info-value">{nacionalidad}</div>
-                    </div>
-
-                    <div class="info-item">
-                        <div class="info-label">Nivel de Inglés</div>
-                        <div class="info-value">{ingles_nivel}</div>
-                    </div>
-
-                    <div class="info-item full-width">
-                        <div class="info-label">Experiencia Laboral</div>
-                        <div class="info-value">{experiencia}</div>
-                    </div>
-                </div>
-
-                <div class="files-section">
-                    <h3 style="margin-top: 0; color: #2c5aa0;">📎 Archivos Adjuntos</h3>
-                    <pre style="white-space: pre-wrap; font-family: inherit;">{files_summary}</pre>
-                </div>
-
-                <div class="admin-links">
-                    <h3 style="margin-top: 0;">⚡ Acciones Rápidas</h3>
-                    <a href="mailto:{email}">Contactar Candidato</a>
-                    <a href="https://workwavecoast.com/admin">Ver en Dashboard</a>
-                </div>
-
-                <div class="timestamp">
-                    Aplicación recibida el {datetime.now(timezone.utc).strftime('%d/%m/%Y a las %H:%M UTC')}
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        # Plain text version
-        text_content = f"""
-        NUEVA APLICACIÓN RECIBIDA - WORKWAVE COAST
-        ==========================================
-
-        INFORMACIÓN DEL CANDIDATO:
-        - Nombre: {nombre} {apellido}
-        - Email: {email}
-        - Teléfono: {telefono}
-        - Puesto Solicitado: {puesto}
-        - Nacionalidad: {nacionalidad}
-        - Nivel de Inglés: {ingles_nivel}
+        html_content = _ADMIN_NOTIFICATION_HTML.render(context)
 
-        EXPERIENCIA LABORAL:
-        {experiencia}
-
-        ARCHIVOS ADJUNTOS:
-        {files_summary}
-
-        ACCIONES RÁPIDAS:
-        - Contactar candidato: {email}
-        - Ver en dashboard: https://workwavecoast.com/admin
-
-        Aplicación recibida el {datetime.now(timezone.utc).strftime('%d/%m/%Y a las %H:%M UTC')}
-        """
+        # Plain text version, unless only HTML is sent
+        text_content = _ADMIN_NOTIFICATION_TEXT.render(context) if self._send_text else None
 
         return {
             'subject': subject,
@@ -480,70 +557,72 @@ class EmailService(BaseService):
             'text_content': text_content
         }
 
+    def _build_message(self, to_email: str, subject: str, html_content: str,
+                       text_content: str = None, cc_emails: List[str] = None,
+                       bcc_emails: List[str] = None) -> Tuple[EmailMessage, List[str]]:
+        """Build a text / HTML alternative message and its envelope recipient list"""
+        cc = cc_emails or ()
+        bcc = bcc_emails or ()
+
+        message = EmailMessage()
+        message["Subject"] = subject
+        message["From"] = _from_header(self._from_email)
+        message["To"] = to_email
+
+        if cc:
+            message["Cc"] = ", ".join(cc)
+        if bcc:
+            message["Bcc"] = ", ".join(bcc)
+
+        # Add text and HTML parts
+        if text_content and self._send_text:
+            message.set_content(text_content)
+            message.add_alternative(html_content, subtype="html")
+        else:
+            message.set_content(html_content, subtype="html")
+
+        return message, [to_email, *cc, *bcc]
+
     def send_email(self, to_email: str, subject: str, html_content: str,
                    text_content: str = None, cc_emails: List[str] = None,
                    bcc_emails: List[str] = None) -> Dict[str, Any]:
         """Send an email"""
-        try:
-            if not self.email_config:
-                return self.error_response(
-                    "Email configuration not loaded",
-                    "ConfigurationError"
-                )
-
-            # Validate recipient email
-            if not self.validate_email_address(to_email):
-                return self.error_response(
-                    f"Invalid email address: {to_email}",
-                    "ValidationError"
-                )
+        if not self.email_config:
+            return self.error_response(
+                "Email configuration not loaded",
+                "ConfigurationError"
+            )
 
-            # Create message
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = self.email_config['from_email']
-            message["To"] = to_email
-            message.set_charset('utf-8')
+        # Validate recipient email
+        if not self.validate_email_address(to_email):
+            return self.error_response(
+                f"Invalid email address: {to_email}",
+                "ValidationError"
+            )
 
+        try:
+            # Copy recipients are optional, so invalid ones are dropped rather than failing the send
             if cc_emails:
-                message["Cc"] = ", ".join(cc_emails)
+                cc_emails = self._valid_copy_recipients("cc", cc_emails)
             if bcc_emails:
-                message["Bcc"] = ", ".join(bcc_emails)
-
-            # Add text and HTML parts
-            if text_content:
-                text_part = MIMEText(text_content, "plain", "utf-8")
-                message.attach(text_part)
-
-            html_part = MIMEText(html_content, "html", "utf-8")
-            message.attach(html_part)
-
-            # Create SMTP connection and send
-            with self._create_smtp_connection() as server:
-                # Prepare recipient list
-                recipients = [to_email]
-                if cc_emails:
-                    recipients.extend(cc_emails)
-                if bcc_emails:
-                    recipients.extend(bcc_emails)
-
-                # Send email - use as_bytes() for proper encoding
-                try:
-                    server.send_message(message)
-                except AttributeError:
-                    # Fallback for older Python versions
-                    server.sendmail(
-                        self.email_config['from_email'],
-                        recipients,
-                        message.as_bytes()
-                    )
+                bcc_emails = self._valid_copy_recipients("bcc", bcc_emails)
 
-            self.log_operation("send_email", {
-                "to_email": to_email,
-                "subject": subject,
-                "cc_count": len(cc_emails) if cc_emails else 0,
-                "bcc_count": len(bcc_emails) if bcc_emails else 0
-            })
+            message, recipients = self._build_message(
+                to_email, subject, html_content, text_content, cc_emails, bcc_emails
+            )
+
+            # Send over the persistent SMTP connection
+            error = self._deliver([(message, recipients)])[0]
+            if error is not None:
+                raise error
+
+            self.log_operation(
+                "send_email",
+                to_email=to_email,
+                subject=subject,
+                cc_count=len(cc_emails or ()),
+                bcc_count=len(bcc_emails or ())
+            )
 
             return self.success_response({
                 "to_email": to_email,
@@ -566,56 +645,57 @@ class EmailService(BaseService):
 
     def send_confirmation_email(self, candidate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Send confirmation email to candidate"""
-        try:
-            print(f"[EMAIL SERVICE] ENTERED send_confirmation_email for {candidate_data.get('email')}")
-            self.logger.info(f"[EMAIL SERVICE] Creating confirmation email for {candidate_data.get('email')}")
+        self.logger.debug("Creating confirmation email for %s", candidate_data.get('email'))
 
-            # Check if email config is loaded
-            if not self.email_config:
-                print("[EMAIL SERVICE] ERROR: Email configuration not loaded")
-                self.logger.error("[EMAIL SERVICE] Email configuration not loaded")
-                return self.error_response(
-                    "Email configuration not available",
-                    "ConfigurationError"
-                )
+        # Check if email config is loaded
+        if not self.email_config:
+            self.logger.error("Email configuration not loaded")
+            return self.error_response(
+                "Email configuration not available",
+                "ConfigurationError"
+            )
 
-            print(f"[EMAIL SERVICE] Config loaded: {self.email_config.get('smtp_server')}:{self.email_config.get('smtp_port')}")
+        # Reject a bad recipient before rendering the templates
+        to_email = candidate_data.get('email')
+        if not self.validate_email_address(to_email):
+            return self.error_response(
+                f"Invalid email address: {to_email}",
+                "ValidationError"
+            )
 
+        try:
             # Log config status (without passwords)
-            self.logger.info(f"Email config loaded: server={self.email_config.get('smtp_server')}, port={self.email_config.get('smtp_port')}, from={self.email_config.get('from_email')}")
+            self.logger.debug(
+                "Email config loaded: server=%s, port=%s, from=%s",
+                self._smtp_server,
+                self._smtp_port,
+                self._from_email
+            )
 
             email_content = self.create_confirmation_email(candidate_data)
-            self.logger.info(f"Email content created, subject: {email_content['subject']}")
 
-            print(f"[EMAIL SERVICE] Calling send_email() to {candidate_data['email']}")
             result = self.send_email(
-                to_email=candidate_data['email'],
+                to_email=to_email,
                 subject=email_content['subject'],
                 html_content=email_content['html_content'],
                 text_content=email_content['text_content']
             )
 
-            print(f"[EMAIL SERVICE] send_email() returned: {result}")
-
             if result.get('success'):
-                print(f"[EMAIL SERVICE] SUCCESS - Email sent to {candidate_data['email']}")
-                self.log_operation("send_confirmation_email", {
-                    "candidate_email": candidate_data['email'],
-                    "candidate_name": f"{candidate_data.get('nombre', '')} {candidate_data.get('apellido', '')}",
-                    "puesto": candidate_data.get('puesto', '')
-                })
+                self.log_operation(
+                    "send_confirmation_email",
+                    candidate_email=candidate_data['email'],
+                    candidate_name=f"{candidate_data.get('nombre', '')} {candidate_data.get('apellido', '')}",
+                    puesto=candidate_data.get('puesto', '')
+                )
             else:
-                print(f"[EMAIL SERVICE] FAILURE - send_email returned: {result}")
-                self.logger.error(f"send_email returned failure: {result}")
+                self.logger.error("send_email returned failure: %s", result)
 
             return result
 
         except Exception as e:
-            print(f"[EMAIL SERVICE] EXCEPTION: {str(e)}")
-            self.logger.error(f"Exception in send_confirmation_email: {str(e)}")
-            import traceback
-            print(f"[EMAIL SERVICE] TRACEBACK: {traceback.format_exc()}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            # exc_info defers traceback formatting to the handler
+            self.logger.error("Exception in send_confirmation_email: %s", e, exc_info=True)
             return self.handle_error("send_confirmation_email", e, {
                 "candidate_email": candidate_data.get('email')
             })
@@ -623,29 +703,35 @@ class EmailService(BaseService):
     def send_admin_notification(self, candidate_data: Dict[str, Any],
                               files_info: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send notification to admin about new application"""
-        try:
-            if not self.email_config or not self.email_config.get('admin_email'):
-                return self.error_response(
-                    "Admin email not configured",
-                    "ConfigurationError"
-                )
+        if not self.email_config or not self._admin_email:
+            return self.error_response(
+                "Admin email not configured",
+                "ConfigurationError"
+            )
+        if not self.validate_email_address(self._admin_email):
+            return self.error_response(
+                f"Invalid email address: {self._admin_email}",
+                "ValidationError"
+            )
 
+        try:
             email_content = self.create_admin_notification_email(candidate_data, files_info)
 
             result = self.send_email(
-                to_email=self.email_config['admin_email'],
+                to_email=self._admin_email,
                 subject=email_content['subject'],
                 html_content=email_content['html_content'],
                 text_content=email_content['text_content']
             )
 
             if result.get('success'):
-                self.log_operation("send_admin_notification", {
-                    "candidate_email": candidate_data['email'],
-                    "candidate_name": f"{candidate_data.get('nombre', '')} {candidate_data.get('apellido', '')}",
-                    "puesto": candidate_data.get('puesto', ''),
-                    "admin_email": self.email_config['admin_email']
-                })
+                self.log_operation(
+                    "send_admin_notification",
+                    candidate_email=candidate_data['email'],
+                    candidate_name=f"{candidate_data.get('nombre', '')} {candidate_data.get('apellido', '')}",
+                    puesto=candidate_data.get('puesto', ''),
+                    admin_email=self._admin_email
+                )
 
             return result
 
@@ -654,15 +740,151 @@ class EmailService(BaseService):
                 "candidate_email": candidate_data.get('email')
             })
 
-    def test_email_configuration(self) -> Dict[str, Any]:
-        """Test email configuration by sending a test email"""
+    def send_application_emails(self, candidate_data: Dict[str, Any],
+                                files_info: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send the candidate confirmation and the admin notification over one SMTP session
+
+        The individual 'confirmation' and 'admin_notification' results are
+        returned as data on success, or as details of an error response if
+        either email was not sent.
+        """
+        try:
+            if not self.email_config:
+                return self.error_response(
+                    "Email configuration not available",
+                    "ConfigurationError"
+                )
+
+            candidate_email = candidate_data.get('email', '')
+            admin_email = self._admin_email
+            results: Dict[str, Dict[str, Any]] = {}
+            pending = []
+
+            if self.validate_email_address(candidate_email):
+                pending.append(('confirmation', candidate_email,
+                                self.create_confirmation_email(candidate_data)))
+            else:
+                results['confirmation'] = self.error_response(
+                    f"Invalid email address: {candidate_email}",
+                    "ValidationError"
+                )
+
+            if not admin_email:
+                results['admin_notification'] = self.error_response(
+                    "Admin email not configured",
+                    "ConfigurationError"
+                )
+            elif not self.validate_email_address(admin_email):
+                results['admin_notification'] = self.error_response(
+                    f"Invalid email address: {admin_email}",
+                    "ValidationError"
+                )
+            else:
+                pending.append(('admin_notification', admin_email,
+                                self.create_admin_notification_email(candidate_data, files_info)))
+
+            messages = [
+                self._build_message(to_email, content['subject'],
+                                    content['html_content'], content['text_content'])
+                for _, to_email, content in pending
+            ]
+            errors = self._deliver(messages)
+            sent_at = datetime.now(timezone.utc).isoformat()
+
+            candidate_name = f"{candidate_data.get('nombre', '')} {candidate_data.get('apellido', '')}"
+            for (kind, to_email, content), error in zip(pending, errors):
+                if error is not None:
+                    results[kind] = self.handle_error(f"send_application_emails.{kind}", error, {
+                        "to_email": to_email
+                    })
+                    continue
+
+                self.log_operation(
+                    f"send_{kind}",
+                    candidate_email=candidate_email,
+                    candidate_name=candidate_name,
+                    puesto=candidate_data.get('puesto', ''),
+                    to_email=to_email
+                )
+                results[kind] = self.success_response({
+                    "to_email": to_email,
+                    "subject": content['subject'],
+                    "sent_at": sent_at
+                }, "Email sent successfully")
+
+            failed = [kind for kind, result in results.items() if not result['success']]
+            if failed:
+                return self.error_response(
+                    f"Application emails not sent: {', '.join(sorted(failed))}",
+                    "EmailDeliveryError",
+                    results
+                )
+            return self.success_response(results, "Application emails sent")
+
+        except Exception as e:
+            return self.handle_error("send_application_emails", e, {
+                "candidate_email": candidate_data.get('email')
+            })
+
+    def queue_application_emails(self, candidate_data: Dict[str, Any],
+                                 files_info: Dict[str, Any] = None,
+                                 callback=None) -> Dict[str, Any]:
+        """Queue the application emails for background delivery and return immediately
+
+        Args:
+            candidate_data: Candidate information (copied before queueing)
+            files_info: Uploaded files summary for the admin notification
+            callback: Optional callable(job_id, result) invoked after delivery
+                      with the send_application_emails result
+        """
         try:
             if not self.email_config:
                 return self.error_response(
-                    "Email configuration not loaded",
+                    "Email configuration not available",
                     "ConfigurationError"
                 )
 
+            job_id = self._enqueue(self.send_application_emails, (dict(candidate_data), files_info), callback)
+
+            self.log_operation("queue_application_emails", {
+                "job_id": job_id,
+                "candidate_email": candidate_data.get('email')
+            })
+
+            return self.success_response({
+                "job_id": job_id,
+                "queued": True
+            }, "Application emails queued")
+
+        except Exception as e:
+            return self.handle_error("queue_application_emails", e, {
+                "candidate_email": candidate_data.get('email')
+            })
+
+    def _enqueue(self, send: Callable[..., Dict[str, Any]], args: tuple, callback=None) -> str:
+        """Queue send(*args) for the background worker and return the job id"""
+        job_id = uuid.uuid4().hex
+        self._ensure_worker()
+        self._queue.put((job_id, send, args, callback))
+        return job_id
+
+    def test_email_configuration(self) -> Dict[str, Any]:
+        """Test email configuration by sending a test email"""
+        if not self.email_config:
+            return self.error_response(
+                "Email configuration not loaded",
+                "ConfigurationError"
+            )
+
+        # Test email goes to the admin
+        to_email = self._admin_email or self._from_email
+        if not self.validate_email_address(to_email):
+            return self.error_response(
+                f"Invalid email address: {to_email}",
+                "ValidationError"
+            )
+
+        try:
             # Create test message
             test_subject = "WorkWave Coast - Test Email Configuration"
             test_html = """
@@ -685,9 +907,8 @@ class EmailService(BaseService):
             WorkWave Coast Email Service
             """
 
-            # Send test email to admin
             result = self.send_email(
-                to_email=self.email_config.get('admin_email', self.email_config['from_email']),
+                to_email=to_email,
                 subject=test_subject,
                 html_content=test_html,
                 text_content=test_text
@@ -696,7 +917,7 @@ class EmailService(BaseService):
             if result.get('success'):
                 self.log_operation("test_email_configuration", {"status": "success"})
                 return self.success_response({
-                    "test_email_sent_to": self.email_config.get('admin_email', self.email_config['from_email']),
+                    "test_email_sent_to": to_email,
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }, "Email configuration test successful")
             else:
@@ -707,65 +928,18 @@ class EmailService(BaseService):
 
     def send_password_recovery_email(self, email: str, username: str, recovery_link: str, expires_at: str) -> Dict[str, Any]:
         """Send password recovery email to admin"""
-        try:
-            if not self.email_config:
-                return self.error_response("Email service not configured", "EmailNotConfigured")
+        if not self.email_config:
+            return self.error_response("Email service not configured", "EmailNotConfigured")
+        if not self.validate_email_address(email):
+            return self.error_response("Invalid email address", "InvalidEmail")
 
+        try:
             # Password recovery email template
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Password Recovery - WorkWave Coast</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                    .header {{ background-color: #007bff; color: white; padding: 20px; text-align: center; }}
-                    .content {{ background-color: #f8f9fa; padding: 30px; }}
-                    .button {{ display: inline-block; padding: 12px 24px; background-color: #28a745; color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }}
-                    .warning {{ background-color: #fff3cd; border: 1px solid #ffeaa7; padding: 15px; border-radius: 5px; margin: 20px 0; }}
-                    .footer {{ background-color: #6c757d; color: white; padding: 15px; text-align: center; font-size: 12px; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>WorkWave Coast</h1>
-                        <h2>Password Recovery</h2>
-                    </div>
-
-                    <div class="content">
-                        <h3>Hello {username},</h3>
-                        <p>We received a request to reset your admin password for WorkWave Coast.</p>
-
-                        <p>Click the button below to reset your password:</p>
-                        <a href="{recovery_link}" class="button">Reset Password</a>
-
-                        <p>Or copy and paste this link into your browser:</p>
-                        <p style="word-break: break-all; color: #007bff;">{recovery_link}</p>
-
-                        <div class="warning">
-                            <strong>Important:</strong>
-                            <ul>
-                                <li>This link will expire at: <strong>{expires_at}</strong></li>
-                                <li>If you didn't request this password reset, please ignore this email</li>
-                                <li>For security reasons, this link can only be used once</li>
-                            </ul>
-                        </div>
-
-                        <p>If you have any issues, please contact the system administrator.</p>
-                    </div>
-
-                    <div class="footer">
-                        <p>This is an automated email from WorkWave Coast Admin System</p>
-                        <p>Please do not reply to this email</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            html_content = _PASSWORD_RECOVERY_HTML.render(
+                username=username,
+                recovery_link=recovery_link,
+                expires_at=expires_at
+            )
 
             result = self.send_email(
                 to_email=email,
@@ -774,11 +948,12 @@ class EmailService(BaseService):
             )
 
             if result.get('success'):
-                self.log_operation("send_password_recovery_email", {
-                    "email": email,
-                    "username": username,
-                    "expires_at": expires_at
-                })
+                self.log_operation(
+                    "send_password_recovery_email",
+                    email=email,
+                    username=username,
+                    expires_at=expires_at
+                )
 
             return result
 
@@ -790,66 +965,15 @@ class EmailService(BaseService):
 
     def send_password_reset_confirmation_email(self, email: str, username: str) -> Dict[str, Any]:
         """Send password reset confirmation email to admin"""
-        try:
-            if not self.email_config:
-                return self.error_response("Email service not configured", "EmailNotConfigured")
+        if not self.email_config:
+            return self.error_response("Email service not configured", "EmailNotConfigured")
+        if not self.validate_email_address(email):
+            return self.error_response("Invalid email address", "InvalidEmail")
 
+        try:
             # Password reset confirmation email template
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Password Reset Confirmation - WorkWave Coast</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                    .header {{ background-color: #28a745; color: white; padding: 20px; text-align: center; }}
-                    .content {{ background-color: #f8f9fa; padding: 30px; }}
-                    .success {{ background-color: #d4edda; border: 1px solid #c3e6cb; padding: 15px; border-radius: 5px; margin: 20px 0; }}
-                    .security-tips {{ background-color: #e2e3e5; border: 1px solid #d6d8db; padding: 15px; border-radius: 5px; margin: 20px 0; }}
-                    .footer {{ background-color: #6c757d; color: white; padding: 15px; text-align: center; font-size: 12px; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>WorkWave Coast</h1>
-                        <h2>Password Reset Successful</h2>
-                    </div>
-
-                    <div class="content">
-                        <h3>Hello {username},</h3>
-
-                        <div class="success">
-                            <h4>✓ Your password has been successfully reset</h4>
-                            <p>You can now log in to the WorkWave Coast admin panel with your new password.</p>
-                        </div>
-
-                        <p>Reset completed at: <strong>{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</strong></p>
-
-                        <div class="security-tips">
-                            <h4>Security Tips:</h4>
-                            <ul>
-                                <li>Keep your password secure and don't share it with anyone</li>
-                                <li>Use a strong, unique password for your admin account</li>
-                                <li>Consider changing your password regularly</li>
-                                <li>If you notice any suspicious activity, contact the system administrator immediately</li>
-                            </ul>
-                        </div>
-
-                        <p>If you didn't reset your password, please contact the system administrator immediately.</p>
-                    </div>
-
-                    <div class="footer">
-                        <p>This is an automated email from WorkWave Coast Admin System</p>
-                        <p>Please do not reply to this email</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            timestamp = time.strftime(_ADMIN_TIME_FORMAT, time.gmtime())
+            html_content = _PASSWORD_RESET_CONFIRMATION_HTML.render(username=username, timestamp=timestamp)
 
             result = self.send_email(
                 to_email=email,
@@ -858,10 +982,11 @@ class EmailService(BaseService):
             )
 
             if result.get('success'):
-                self.log_operation("send_password_reset_confirmation_email", {
-                    "email": email,
-                    "username": username
-                })
+                self.log_operation(
+                    "send_password_reset_confirmation_email",
+                    email=email,
+                    username=username
+                )
 
             return result
 
@@ -871,6 +996,52 @@ class EmailService(BaseService):
                 "username": username
             })
 
+    def create_application_approved_email(self, candidate_data: Dict[str, Any]) -> Dict[str, str]:
+        """Create application approved email content"""
+        return {
+            'subject': "¡Felicitaciones! Tu aplicación ha sido aprobada - WorkWave Coast",
+            'html_content': _APPLICATION_RESULT_HTML.render(
+                variant='approved',
+                nombre=candidate_data.get('nombre', ''),
+                apellido=candidate_data.get('apellido', ''),
+                puesto=candidate_data.get('puesto', '')
+            )
+        }
+
+    def create_application_rejected_email(self, candidate_data: Dict[str, Any]) -> Dict[str, str]:
+        """Create application rejected email content"""
+        return {
+            'subject': "Actualización de tu aplicación - WorkWave Coast",
+            'html_content': _APPLICATION_RESULT_HTML.render(
+                variant='rejected',
+                nombre=candidate_data.get('nombre', ''),
+                puesto=candidate_data.get('puesto', '')
+            )
+        }
+
+    def create_status_change_email(self, candidate_data: Dict[str, Any], new_status: str) -> Dict[str, str]:
+        """Create the email content for a change to new_status
+
+        Approved and rejected applications get their own emails; any other
+        status gets the generic status change notification.
+        """
+        status = new_status.lower()
+        if status == 'approved':
+            return self.create_application_approved_email(candidate_data)
+        if status == 'rejected':
+            return self.create_application_rejected_email(candidate_data)
+
+        status_display = self._STATUS_TRANSLATIONS.get(status, new_status)
+
+        return {
+            'subject': "Actualización de tu aplicación - WorkWave Coast",
+            'html_content': _STATUS_CHANGE_HTML.render(
+                nombre=candidate_data.get('nombre', ''),
+                puesto=candidate_data.get('puesto', ''),
+                status_display=status_display
+            )
+        }
+
     def send_application_approved_email(self, candidate_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send email notification when application is approved
@@ -878,101 +1049,29 @@ class EmailService(BaseService):
         Args:
             candidate_data: Dictionary with candidate information
         """
+        if not self.email_config:
+            return self.error_response("Email service not configured", "EmailNotConfigured")
+
+        email = candidate_data.get('email', '')
+        if not self.validate_email_address(email):
+            return self.error_response("Invalid email address", "InvalidEmail")
+
         try:
-            if not self.email_config:
-                return self.error_response("Email service not configured", "EmailNotConfigured")
-
-            email = candidate_data.get('email', '')
-            if not self.validate_email_address(email):
-                return self.error_response("Invalid email address", "InvalidEmail")
-
-            nombre = candidate_data.get('nombre', '')
-            apellido = candidate_data.get('apellido', '')
-            puesto = candidate_data.get('puesto', '')
-
-            subject = f"¡Felicitaciones! Tu aplicación ha sido aprobada - WorkWave Coast"
-
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="es">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Aplicación Aprobada - WorkWave Coast</title>
-                <style>
-                    body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; }}
-                    .container {{ max-width: 600px; margin: 0 auto; background-color: #ffffff; }}
-                    .header {{ background: linear-gradient(135deg, #28a745 0%, #20c997 100%); color: white; padding: 30px; text-align: center; }}
-                    .header h1 {{ margin: 0; font-size: 28px; }}
-                    .content {{ padding: 30px; background-color: #f8f9fa; }}
-                    .success-banner {{ background-color: #d4edda; border-left: 4px solid #28a745; padding: 20px; margin: 20px 0; border-radius: 5px; }}
-                    .success-banner h2 {{ margin: 0 0 10px 0; color: #155724; }}
-                    .info-box {{ background-color: #ffffff; padding: 20px; border-radius: 5px; margin: 20px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                    .next-steps {{ background-color: #e7f3ff; border-left: 4px solid #0066cc; padding: 20px; margin: 20px 0; border-radius: 5px; }}
-                    .next-steps h3 {{ margin-top: 0; color: #004085; }}
-                    .next-steps ul {{ margin: 10px 0; padding-left: 20px; }}
-                    .footer {{ background-color: #343a40; color: white; padding: 20px; text-align: center; font-size: 12px; }}
-                    .button {{ display: inline-block; padding: 12px 30px; background-color: #28a745; color: white; text-decoration: none; border-radius: 5px; margin: 10px 0; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>🌊 WorkWave Coast</h1>
-                        <p style="margin: 5px 0; font-size: 16px;">Empleos en la Costa Croata</p>
-                    </div>
-
-                    <div class="content">
-                        <div class="success-banner">
-                            <h2>✅ ¡Felicitaciones {nombre}!</h2>
-                            <p style="margin: 5px 0; font-size: 18px;"><strong>Tu aplicación ha sido APROBADA</strong></p>
-                        </div>
-
-                        <div class="info-box">
-                            <h3>Detalles de tu aplicación:</h3>
-                            <p><strong>Nombre:</strong> {nombre} {apellido}</p>
-                            <p><strong>Puesto:</strong> {puesto}</p>
-                            <p><strong>Estado:</strong> <span style="color: #28a745; font-weight: bold;">APROBADO</span></p>
-                        </div>
-
-                        <div class="next-steps">
-                            <h3>📋 Próximos Pasos</h3>
-                            <ul>
-                                <li>Nuestro equipo se pondrá en contacto contigo en las próximas 48-72 horas</li>
-                                <li>Te enviaremos información detallada sobre el puesto y condiciones</li>
-                                <li>Recibirás instrucciones para el proceso de contratación</li>
-                                <li>Mantén tu teléfono y email disponibles para recibir nuestra comunicación</li>
-                            </ul>
-                        </div>
-
-                        <p>Estamos emocionados de tenerte en nuestro equipo para la temporada en la costa croata. ¡Prepárate para una experiencia inolvidable!</p>
-
-                        <p style="margin-top: 20px;"><strong>¿Tienes preguntas?</strong><br>
-                        No dudes en responder a este correo y te responderemos lo antes posible.</p>
-                    </div>
-
-                    <div class="footer">
-                        <p><strong>WorkWave Coast</strong> - Tu oportunidad de trabajar en la costa adriática</p>
-                        <p>Este es un correo automático, pero puedes responder para contactarnos</p>
-                        <p style="margin-top: 10px;">© 2025 WorkWave Coast. Todos los derechos reservados.</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            email_content = self.create_application_approved_email(candidate_data)
 
             result = self.send_email(
                 to_email=email,
-                subject=subject,
-                html_content=html_content
+                subject=email_content['subject'],
+                html_content=email_content['html_content']
             )
 
             if result.get('success'):
-                self.log_operation("send_application_approved_email", {
-                    "email": email,
-                    "nombre": nombre,
-                    "puesto": puesto
-                })
+                self.log_operation(
+                    "send_application_approved_email",
+                    email=email,
+                    nombre=candidate_data.get('nombre', ''),
+                    puesto=candidate_data.get('puesto', '')
+                )
 
             return result
 
@@ -989,101 +1088,29 @@ class EmailService(BaseService):
         Args:
             candidate_data: Dictionary with candidate information
         """
+        if not self.email_config:
+            return self.error_response("Email service not configured", "EmailNotConfigured")
+
+        email = candidate_data.get('email', '')
+        if not self.validate_email_address(email):
+            return self.error_response("Invalid email address", "InvalidEmail")
+
         try:
-            if not self.email_config:
-                return self.error_response("Email service not configured", "EmailNotConfigured")
-
-            email = candidate_data.get('email', '')
-            if not self.validate_email_address(email):
-                return self.error_response("Invalid email address", "InvalidEmail")
-
-            nombre = candidate_data.get('nombre', '')
-            apellido = candidate_data.get('apellido', '')
-            puesto = candidate_data.get('puesto', '')
-
-            subject = f"Actualización de tu aplicación - WorkWave Coast"
-
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="es">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Actualización de Aplicación - WorkWave Coast</title>
-                <style>
-                    body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; }}
-                    .container {{ max-width: 600px; margin: 0 auto; background-color: #ffffff; }}
-                    .header {{ background: linear-gradient(135deg, #0066cc 0%, #0099ff 100%); color: white; padding: 30px; text-align: center; }}
-                    .header h1 {{ margin: 0; font-size: 28px; }}
-                    .content {{ padding: 30px; background-color: #f8f9fa; }}
-                    .info-banner {{ background-color: #fff3cd; border-left: 4px solid #ffc107; padding: 20px; margin: 20px 0; border-radius: 5px; }}
-                    .info-box {{ background-color: #ffffff; padding: 20px; border-radius: 5px; margin: 20px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                    .encouragement {{ background-color: #e7f3ff; border-left: 4px solid #0066cc; padding: 20px; margin: 20px 0; border-radius: 5px; }}
-                    .footer {{ background-color: #343a40; color: white; padding: 20px; text-align: center; font-size: 12px; }}
-                    .button {{ display: inline-block; padding: 12px 30px; background-color: #0066cc; color: white; text-decoration: none; border-radius: 5px; margin: 10px 0; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>🌊 WorkWave Coast</h1>
-                        <p style="margin: 5px 0; font-size: 16px;">Empleos en la Costa Croata</p>
-                    </div>
-
-                    <div class="content">
-                        <h2>Hola {nombre},</h2>
-
-                        <div class="info-banner">
-                            <p style="margin: 0; font-size: 16px;">Gracias por tu interés en trabajar con nosotros en la costa croata.</p>
-                        </div>
-
-                        <div class="info-box">
-                            <p>Hemos revisado cuidadosamente tu aplicación para el puesto de <strong>{puesto}</strong>.</p>
-
-                            <p>Lamentablemente, en esta ocasión hemos decidido no avanzar con tu candidatura para esta posición específica. Esta decisión se debe al alto volumen de aplicaciones recibidas y a la necesidad de ajustarnos a requisitos muy específicos para cada puesto.</p>
-                        </div>
-
-                        <div class="encouragement">
-                            <h3>💡 No te desanimes</h3>
-                            <p><strong>Te animamos a postularte nuevamente:</strong></p>
-                            <ul>
-                                <li>Publicaremos nuevas posiciones regularmente durante la temporada</li>
-                                <li>Tus datos quedan en nuestra base de datos para futuras oportunidades</li>
-                                <li>Puedes aplicar a otros puestos que mejor se ajusten a tu perfil</li>
-                                <li>La experiencia en hostelería y el nivel de idiomas son muy valorados</li>
-                            </ul>
-                        </div>
-
-                        <p>Valoramos mucho el tiempo que dedicaste a tu aplicación y te deseamos mucho éxito en tu búsqueda laboral.</p>
-
-                        <p style="margin-top: 20px;">Si tienes preguntas o deseas más información, no dudes en contactarnos respondiendo a este correo.</p>
-
-                        <p><strong>¡Te deseamos lo mejor!</strong><br>
-                        Equipo WorkWave Coast</p>
-                    </div>
-
-                    <div class="footer">
-                        <p><strong>WorkWave Coast</strong> - Oportunidades laborales en la costa adriática</p>
-                        <p>Puedes responder a este correo para contactarnos</p>
-                        <p style="margin-top: 10px;">© 2025 WorkWave Coast. Todos los derechos reservados.</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            email_content = self.create_application_rejected_email(candidate_data)
 
             result = self.send_email(
                 to_email=email,
-                subject=subject,
-                html_content=html_content
+                subject=email_content['subject'],
+                html_content=email_content['html_content']
             )
 
             if result.get('success'):
-                self.log_operation("send_application_rejected_email", {
-                    "email": email,
-                    "nombre": nombre,
-                    "puesto": puesto
-                })
+                self.log_operation(
+                    "send_application_rejected_email",
+                    email=email,
+                    nombre=candidate_data.get('nombre', ''),
+                    puesto=candidate_data.get('puesto', '')
+                )
 
             return result
 
@@ -1104,9 +1131,10 @@ class EmailService(BaseService):
         """
         try:
             # Route to specific email based on new status
-            if new_status.lower() == 'approved':
+            status = new_status.lower()
+            if status == 'approved':
                 return self.send_application_approved_email(candidate_data)
-            elif new_status.lower() == 'rejected':
+            elif status == 'rejected':
                 return self.send_application_rejected_email(candidate_data)
             else:
                 # For other status changes, send a generic notification
@@ -1117,72 +1145,22 @@ class EmailService(BaseService):
                 if not self.validate_email_address(email):
                     return self.error_response("Invalid email address", "InvalidEmail")
 
-                nombre = candidate_data.get('nombre', '')
-                puesto = candidate_data.get('puesto', '')
-
-                # Translate status to Spanish
-                status_translations = {
-                    'pending': 'En Revisión',
-                    'reviewed': 'Revisada',
-                    'approved': 'Aprobada',
-                    'rejected': 'No Seleccionada',
-                    'contacted': 'Contactado',
-                    'interview': 'Entrevista Programada'
-                }
-
-                status_display = status_translations.get(new_status.lower(), new_status)
-
-                subject = f"Actualización de tu aplicación - WorkWave Coast"
-
-                html_content = f"""
-                <!DOCTYPE html>
-                <html lang="es">
-                <head>
-                    <meta charset="UTF-8">
-                    <style>
-                        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                        .container {{ max-width: 600px; margin: 0 auto; background-color: #ffffff; }}
-                        .header {{ background-color: #0066cc; color: white; padding: 30px; text-align: center; }}
-                        .content {{ padding: 30px; }}
-                        .status-box {{ background-color: #e7f3ff; border-left: 4px solid #0066cc; padding: 15px; margin: 20px 0; }}
-                        .footer {{ background-color: #343a40; color: white; padding: 20px; text-align: center; font-size: 12px; }}
-                    </style>
-                </head>
-                <body>
-                    <div class="container">
-                        <div class="header">
-                            <h1>🌊 WorkWave Coast</h1>
-                        </div>
-                        <div class="content">
-                            <h2>Hola {nombre},</h2>
-                            <p>Tu aplicación para el puesto de <strong>{puesto}</strong> ha sido actualizada.</p>
-                            <div class="status-box">
-                                <p><strong>Estado actual:</strong> {status_display}</p>
-                            </div>
-                            <p>Nos pondremos en contacto contigo si necesitamos información adicional.</p>
-                            <p>Gracias por tu interés en WorkWave Coast.</p>
-                        </div>
-                        <div class="footer">
-                            <p>© 2025 WorkWave Coast. Todos los derechos reservados.</p>
-                        </div>
-                    </div>
-                </body>
-                </html>
-                """
+                email_content = self.create_status_change_email(candidate_data, new_status)
 
                 result = self.send_email(
                     to_email=email,
-                    subject=subject,
-                    html_content=html_content
+                    subject=email_content['subject'],
+                    html_content=email_content['html_content']
                 )
 
                 if result.get('success'):
-                    self.log_operation("send_application_status_change_email", {
-                        "email": email,
-                        "nombre": nombre,
-                        "new_status": new_status,
-                        "old_status": old_status
-                    })
+                    self.log_operation(
+                        "send_application_status_change_email",
+                        email=email,
+                        nombre=candidate_data.get('nombre', ''),
+                        new_status=new_status,
+                        old_status=old_status
+                    )
 
                 return result
 
@@ -1192,8 +1170,82 @@ class EmailService(BaseService):
                 "new_status": new_status
             })
 
+    def queue_application_status_change_email(self, candidate_data: Dict[str, Any], new_status: str,
+                                              old_status: str = None, callback=None) -> Dict[str, Any]:
+        """Queue the status change email for background delivery and return immediately
+
+        Args:
+            candidate_data: Candidate information (copied before queueing)
+            new_status: New status of the application
+            old_status: Previous status (optional)
+            callback: Optional callable(job_id, result) invoked after delivery
+                      with the send_application_status_change_email result
+        """
+        if not self.email_config:
+            return self.error_response("Email service not configured", "EmailNotConfigured")
+
+        email = candidate_data.get('email', '')
+        if not self.validate_email_address(email):
+            return self.error_response("Invalid email address", "InvalidEmail")
+
+        try:
+            job_id = self._enqueue(
+                self.send_application_status_change_email,
+                (dict(candidate_data), new_status, old_status),
+                callback
+            )
+
+            self.log_operation(
+                "queue_application_status_change_email",
+                job_id=job_id,
+                email=email,
+                new_status=new_status
+            )
+
+            return self.success_response({
+                "job_id": job_id,
+                "queued": True
+            }, "Status change email queued")
+
+        except Exception as e:
+            return self.handle_error("queue_application_status_change_email", e, {
+                "email": email,
+                "new_status": new_status
+            })
+
     def health_check(self) -> Dict[str, Any]:
-        """Check service health"""
+        """Check service health (probe result reused for _HEALTH_CACHE_TTL seconds)
+
+        Once the cached result is stale it is returned as is while a
+        background thread probes again, so callers never wait on SMTP after
+        the first check.
+        """
+        cached = _health_cache["value"]
+        if cached is not None:
+            if time.monotonic() >= _health_cache["expires"] and _health_refresh_lock.acquire(blocking=False):
+                threading.Thread(target=self._refresh_health, name="email-health", daemon=True).start()
+            return cached
+
+        with _health_refresh_lock:
+            if _health_cache["value"] is None:
+                self._store_health(self._probe_health())
+            return _health_cache["value"]
+
+    def _refresh_health(self):
+        """Probe in the background and release the refresh lock"""
+        try:
+            self._store_health(self._probe_health())
+        finally:
+            _health_refresh_lock.release()
+
+    @staticmethod
+    def _store_health(result: Dict[str, Any]):
+        """Cache a probe result for _HEALTH_CACHE_TTL seconds"""
+        _health_cache["value"] = result
+        _health_cache["expires"] = time.monotonic() + _HEALTH_CACHE_TTL
+
+    def _probe_health(self) -> Dict[str, Any]:
+        """Check the configuration and that the SMTP server accepts a session"""
         try:
             if not self.email_config:
                 return {
@@ -1203,14 +1255,14 @@ class EmailService(BaseService):
                     "service": "EmailService"
                 }
 
-            # Test SMTP connection
-            with self._create_smtp_connection() as server:
-                server.noop()  # Simple no-operation command to test connection
+            # NOOP an idle pooled session if there is one, otherwise check that
+            # a login succeeds on a short-lived connection that is closed again
+            self._pool.check()
 
             return {
                 "status": "healthy",
                 "email_configured": True,
-                "smtp_server": self.email_config['smtp_server'],
+                "smtp_server": self._smtp_server,
                 "service": "EmailService"
             }
         except Exception as e:
@@ -1221,3 +1273,7 @@ class EmailService(BaseService):
                 "service": "EmailService"
             }
 
+
+# Shared instance: one SMTP pool, delivery queue and worker per process
+email_service = EmailService()
+atexit.register(email_service.close)
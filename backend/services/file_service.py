@@ -2,10 +2,13 @@
 File Service
 Business logic for file upload and management with Cloudinary
 """
+import functools
 import logging
 from typing import Dict, Any, Optional, Tuple, List
 import os
+import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.datastructures import FileStorage
 import cloudinary
 import cloudinary.uploader
@@ -20,10 +23,111 @@ from services.base_service import BaseService
 from config.cloudinary_config import get_cloudinary_config
 from config.constants import FILE_SIZE_LIMITS, ALLOWED_EXTENSIONS, ALLOWED_MIME_TYPES
 
+# Path separators and characters reserved on common filesystems, scanned in
+# one pass; '../' and '..\\' traversal is caught by the separators
+_UNSAFE_FILENAME_RE = re.compile(r'[/\\<>:"|?*]')
+
+# Per-field allowed extensions and MIME types as sets for O(1) membership
+# tests, with the lists shown in validation errors joined once
+_EXTENSION_SETS = {field: frozenset(exts) for field, exts in ALLOWED_EXTENSIONS.items()}
+_MIME_TYPE_SETS = {field: frozenset(types) for field, types in ALLOWED_MIME_TYPES.items()}
+_ALLOWED_EXTENSIONS_TEXT = {field: ', '.join(exts) for field, exts in ALLOWED_EXTENSIONS.items()}
+_ALLOWED_MIME_TYPES_TEXT = {field: ', '.join(types) for field, types in ALLOWED_MIME_TYPES.items()}
+
+# Public IDs the Admin API accepts in one delete_resources call
+_DELETE_BATCH_SIZE = 100
+
+# delete_resources needs an explicit resource type, so 'auto' deletes are
+# tried as each of these in turn, retrying only the IDs not yet deleted
+_AUTO_DELETE_RESOURCE_TYPES = ('image', 'raw', 'video')
+
+# Upper bound on concurrent Cloudinary uploads for one application
+_UPLOAD_WORKERS = 5
+
+
+def _size_upload_connection_pool():
+    """Let cloudinary's shared upload connection pool keep one connection per upload worker
+
+    The uploader reuses one keep-alive urllib3 PoolManager for every request,
+    but by default it keeps a single idle connection per host, so parallel
+    uploads would each open a new TLS connection and throw it away.
+    """
+    http = getattr(cloudinary.uploader, '_http', None)
+    pool_kw = getattr(http, 'connection_pool_kw', None)
+    if pool_kw is not None:
+        pool_kw['maxsize'] = _UPLOAD_WORKERS
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_cloudinary_sdk() -> bool:
+    """Configure the Cloudinary SDK from the environment once per process
+
+    Returns whether credentials were found. Every FileService shares the
+    result; tests that change the environment call
+    _configure_cloudinary_sdk.cache_clear().
+    """
+    # Get credentials from environment variables
+    cloud_name = os.getenv('CLOUDINARY_CLOUD_NAME')
+    api_key = os.getenv('CLOUDINARY_API_KEY')
+    api_secret = os.getenv('CLOUDINARY_API_SECRET')
+
+    if not all([cloud_name, api_key, api_secret]):
+        return False
+
+    get_cloudinary_config(cloud_name, api_key, api_secret)
+    cloudinary.config(
+        cloud_name=cloud_name,
+        api_key=api_key,
+        api_secret=api_secret
+    )
+    _size_upload_connection_pool()
+    return True
+
 
 class FileService(BaseService):
     """Service for handling file upload and management operations"""
 
+    # Cloudinary upload options, built once and shallow-copied for each upload.
+    # The SDK only reads them, so the nested lists are shared between uploads.
+    _DEFAULT_UPLOAD_OPTIONS: Dict[str, Any] = {
+        'resource_type': 'auto',  # Automatically detect resource type
+        'use_filename': False,
+        'unique_filename': True,
+        'overwrite': False
+    }
+    _DOCUMENT_UPLOAD_OPTIONS: Dict[str, Any] = {
+        **_DEFAULT_UPLOAD_OPTIONS,
+        'flags': ['attachment']  # Force download instead of display
+    }
+    _UPLOAD_OPTIONS: Dict[str, Dict[str, Any]] = {
+        # For CV documents
+        'cv': {**_DOCUMENT_UPLOAD_OPTIONS, 'resource_type': 'raw'},
+        # For photos with advanced transformations
+        'foto': {
+            **_DEFAULT_UPLOAD_OPTIONS,
+            'resource_type': 'image',
+            'transformation': [
+                # Resize and optimize
+                {'width': 800, 'height': 800, 'crop': 'limit'},
+                {'quality': 'auto:good'},
+                {'format': 'auto'},
+                # Add subtle enhancement
+                {'effect': 'auto_brightness:20'},
+                {'effect': 'auto_contrast:10'}
+            ],
+            'eager': [
+                # Generate thumbnail
+                {'width': 150, 'height': 150, 'crop': 'thumb', 'gravity': 'face'},
+                # Generate medium size
+                {'width': 400, 'height': 400, 'crop': 'limit'}
+            ]
+        },
+        # For other documents
+        'carta_presentacion': _DOCUMENT_UPLOAD_OPTIONS,
+        'referencias': _DOCUMENT_UPLOAD_OPTIONS,
+        'certificados': _DOCUMENT_UPLOAD_OPTIONS,
+    }
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__(logger)
         self.cloudinary_configured = False
@@ -32,22 +136,11 @@ class FileService(BaseService):
     def _configure_cloudinary(self):
         """Configure Cloudinary with environment variables"""
         try:
-            # Get credentials from environment variables
-            cloud_name = os.getenv('CLOUDINARY_CLOUD_NAME')
-            api_key = os.getenv('CLOUDINARY_API_KEY')
-            api_secret = os.getenv('CLOUDINARY_API_SECRET')
-
-            if not all([cloud_name, api_key, api_secret]):
+            if not _configure_cloudinary_sdk():
                 self.logger.warning("Cloudinary credentials not found in environment variables")
                 self.cloudinary_configured = False
                 return
 
-            config = get_cloudinary_config(cloud_name, api_key, api_secret)
-            cloudinary.config(
-                cloud_name=cloud_name,
-                api_key=api_key,
-                api_secret=api_secret
-            )
             self.cloudinary_configured = True
             self.log_operation("configure_cloudinary", {"status": "configured"})
         except Exception as e:
@@ -60,56 +153,71 @@ class FileService(BaseService):
             return True, None, 0
 
         # Validate file extension
-        if field_name in ALLOWED_EXTENSIONS:
-            file_extension = file.filename.split('.')[-1].lower() if '.' in file.filename else ''
-            if f'.{file_extension}' not in ALLOWED_EXTENSIONS[field_name]:
-                allowed = ', '.join(ALLOWED_EXTENSIONS[field_name])
+        allowed_extensions = _EXTENSION_SETS.get(field_name)
+        if allowed_extensions is not None:
+            _, dot, file_extension = file.filename.rpartition('.')
+            if not dot or '.' + file_extension.lower() not in allowed_extensions:
+                allowed = _ALLOWED_EXTENSIONS_TEXT[field_name]
                 return False, f"Tipo de archivo no permitido para {field_name}. Permitidos: {allowed}", 0
 
         # Validate MIME type
-        if field_name in ALLOWED_MIME_TYPES and hasattr(file, 'content_type') and file.content_type:
-            if file.content_type not in ALLOWED_MIME_TYPES[field_name]:
-                allowed_mimes = ', '.join(ALLOWED_MIME_TYPES[field_name])
-                return False, f"Tipo MIME no permitido para {field_name}. Esperado: {allowed_mimes}, recibido: {file.content_type}", 0
+        allowed_mimes = _MIME_TYPE_SETS.get(field_name)
+        content_type = getattr(file, 'content_type', None)
+        if allowed_mimes is not None and content_type:
+            if content_type not in allowed_mimes:
+                allowed = _ALLOWED_MIME_TYPES_TEXT[field_name]
+                return False, f"Tipo MIME no permitido para {field_name}. Esperado: {allowed}, recibido: {content_type}", 0
+
+        # Validate filename for security
+        if not self._is_safe_filename(file.filename):
+            return False, f"Nombre de archivo no válido para {field_name}", 0
+
+        # Validate file size, rejecting on a declared Content-Length before touching the stream
+        size_limit = FILE_SIZE_LIMITS.get(field_name)
+        if size_limit is not None and file.content_length > size_limit:
+            return False, self._size_error(field_name, size_limit), file.content_length
 
-        # Validate file size
         try:
-            file.seek(0, 2)  # Seek to end
-            file_size = file.tell()
-            file.seek(0)  # Reset to beginning
+            file_size = self._get_file_size(file)
         except IOError:
             return False, f"Error al procesar el archivo {field_name}", 0
 
-        if field_name in FILE_SIZE_LIMITS and file_size > FILE_SIZE_LIMITS[field_name]:
-            max_size_mb = FILE_SIZE_LIMITS[field_name] / (1024 * 1024)
-            return False, f"El archivo {field_name} es demasiado grande. Máximo: {max_size_mb}MB", file_size
+        if size_limit is not None and file_size > size_limit:
+            return False, self._size_error(field_name, size_limit), file_size
 
         # Additional security validation
         if file_size == 0:
             return False, f"El archivo {field_name} está vacío", 0
 
-        # Validate filename for security
-        if not self._is_safe_filename(file.filename):
-            return False, f"Nombre de archivo no válido para {field_name}", file_size
-
         return True, None, file_size
 
+    def _size_error(self, field_name: str, size_limit: int) -> str:
+        """Error message for a file over its size limit"""
+        max_size_mb = size_limit / (1024 * 1024)
+        return f"El archivo {field_name} es demasiado grande. Máximo: {max_size_mb}MB"
+
+    def _get_file_size(self, file: FileStorage) -> int:
+        """Size of an uploaded file, from its descriptor when it is on disk"""
+        stream = file.stream
+        # An in-memory SpooledTemporaryFile would be written to disk by fileno()
+        if getattr(stream, '_rolled', True):
+            try:
+                return os.fstat(stream.fileno()).st_size
+            except (AttributeError, OSError, ValueError):
+                pass
+
+        file.seek(0, 2)  # Seek to end
+        file_size = file.tell()
+        file.seek(0)  # Reset to beginning
+        return file_size
+
     def _is_safe_filename(self, filename: str) -> bool:
         """Check if filename is safe (no path traversal, etc.)"""
         if not filename:
             return False
 
-        # Check for path traversal attempts
-        dangerous_patterns = ['../', '..\\', '/', '\\', '<', '>', ':', '"', '|', '?', '*']
-        for pattern in dangerous_patterns:
-            if pattern in filename:
-                return False
-
-        # Check length
-        if len(filename) > 255:
-            return False
-
-        return True
+        # Check length, then path traversal and reserved characters
+        return len(filename) <= 255 and _UNSAFE_FILENAME_RE.search(filename) is None
 
     def generate_unique_filename(self, original_filename: str, prefix: str = "workwave") -> str:
         """Generate a unique filename for upload"""
@@ -146,50 +254,13 @@ class FileService(BaseService):
             # Generate unique public_id
             public_id = self.generate_unique_filename(file.filename, public_id_prefix)
 
-            # Determine resource type and additional options
+            # Per-field options plus this file's public_id
             upload_options = {
+                **self._UPLOAD_OPTIONS.get(field_name, self._DEFAULT_UPLOAD_OPTIONS),
                 'public_id': public_id,
-                'resource_type': 'auto',  # Automatically detect resource type
                 'folder': f'workwave/{field_name}',  # Organize by field type
-                'use_filename': False,
-                'unique_filename': True,
-                'overwrite': False
             }
 
-            # Add specific options based on file type
-            if field_name == 'cv':
-                # For CV documents
-                upload_options.update({
-                    'resource_type': 'raw',
-                    'flags': ['attachment'],  # Force download instead of display
-                })
-            elif field_name == 'foto':
-                # For photos with advanced transformations
-                upload_options.update({
-                    'resource_type': 'image',
-                    'transformation': [
-                        # Resize and optimize
-                        {'width': 800, 'height': 800, 'crop': 'limit'},
-                        {'quality': 'auto:good'},
-                        {'format': 'auto'},
-                        # Add subtle enhancement
-                        {'effect': 'auto_brightness:20'},
-                        {'effect': 'auto_contrast:10'}
-                    ],
-                    'eager': [
-                        # Generate thumbnail
-                        {'width': 150, 'height': 150, 'crop': 'thumb', 'gravity': 'face'},
-                        # Generate medium size
-                        {'width': 400, 'height': 400, 'crop': 'limit'}
-                    ]
-                })
-            elif field_name in ['carta_presentacion', 'referencias', 'certificados']:
-                # For other documents
-                upload_options.update({
-                    'resource_type': 'auto',
-                    'flags': ['attachment']
-                })
-
             # Upload to Cloudinary
             self.logger.info(f"Uploading {field_name} to Cloudinary: {file.filename}")
 
@@ -245,7 +316,7 @@ class FileService(BaseService):
 
     def upload_multiple_files(self, files: Dict[str, FileStorage],
                             public_id_prefix: str = "workwave") -> Dict[str, Any]:
-        """Upload multiple files to Cloudinary"""
+        """Upload multiple files to Cloudinary, up to _UPLOAD_WORKERS at a time"""
         try:
             if not files:
                 return self.success_response({}, "No files provided")
@@ -254,19 +325,29 @@ class FileService(BaseService):
             errors = []
             total_size = 0
 
-            for field_name, file in files.items():
-                if file and file.filename:
-                    # Upload individual file
-                    upload_result = self.upload_to_cloudinary(file, field_name, public_id_prefix)
+            pending = [(field_name, file) for field_name, file in files.items() if file and file.filename]
+
+            def upload(item):
+                field_name, file = item
+                return self.upload_to_cloudinary(file, field_name, public_id_prefix)
+
+            # Each upload is a blocking HTTPS request, so they overlap in threads
+            workers = min(len(pending), _UPLOAD_WORKERS)
+            if workers <= 1:
+                upload_results = [upload(item) for item in pending]
+            else:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-upload") as executor:
+                    upload_results = list(executor.map(upload, pending))
 
-                    if upload_result.get('success'):
-                        results[field_name] = upload_result['data']
-                        total_size += upload_result['data'].get('size', 0)
-                    else:
-                        errors.append({
-                            'field': field_name,
-                            'error': upload_result.get('message', 'Upload failed')
-                        })
+            for (field_name, _), upload_result in zip(pending, upload_results):
+                if upload_result.get('success'):
+                    results[field_name] = upload_result['data']
+                    total_size += upload_result['data'].get('size', 0)
+                else:
+                    errors.append({
+                        'field': field_name,
+                        'error': upload_result.get('message', 'Upload failed')
+                    })
 
             # Check if any files were uploaded successfully
             if results:
@@ -356,18 +437,9 @@ class FileService(BaseService):
                 return self.error_response("No public IDs provided", "ValidationError")
 
             results = []
-            deleted_count = 0
-
-            for public_id in public_ids:
-                delete_result = self.delete_file(public_id, resource_type)
-                results.append({
-                    'public_id': public_id,
-                    'success': delete_result.get('success', False),
-                    'message': delete_result.get('message', '')
-                })
-
-                if delete_result.get('success'):
-                    deleted_count += 1
+            for start in range(0, len(public_ids), _DELETE_BATCH_SIZE):
+                results.extend(self._delete_batch(public_ids[start:start + _DELETE_BATCH_SIZE], resource_type))
+            deleted_count = sum(1 for result in results if result['success'])
 
             self.log_operation("delete_multiple_files", {
                 "requested_count": len(public_ids),
@@ -388,6 +460,50 @@ class FileService(BaseService):
                 "public_ids_count": len(public_ids) if public_ids else 0
             })
 
+    def _delete_batch(self, public_ids: List[str], resource_type: str) -> List[Dict[str, Any]]:
+        """Delete up to _DELETE_BATCH_SIZE files with Admin API calls
+
+        A resource_type of 'auto' is resolved by trying each of
+        _AUTO_DELETE_RESOURCE_TYPES. Files left over when a batch call fails
+        are deleted one by one.
+        """
+        resource_types = _AUTO_DELETE_RESOURCE_TYPES if resource_type == 'auto' else (resource_type,)
+        statuses: Dict[str, str] = {}
+        remaining = public_ids
+        fallback: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            for batch_type in resource_types:
+                deleted = cloudinary.api.delete_resources(remaining, resource_type=batch_type).get('deleted', {})
+                statuses.update(deleted)
+                remaining = [public_id for public_id in remaining if deleted.get(public_id) != 'deleted']
+                if not remaining:
+                    break
+        except Exception as e:
+            self.logger.warning(f"Batch delete of {len(remaining)} files failed, deleting individually: {e}")
+            for public_id in remaining:
+                fallback[public_id] = self.delete_file(public_id, resource_type)
+
+        results = []
+        for public_id in public_ids:
+            if public_id in fallback:
+                delete_result = fallback[public_id]
+                results.append({
+                    'public_id': public_id,
+                    'success': delete_result.get('success', False),
+                    'message': delete_result.get('message', '')
+                })
+                continue
+
+            status = statuses.get(public_id, 'unknown error')
+            success = status == 'deleted'
+            results.append({
+                'public_id': public_id,
+                'success': success,
+                'message': "File deleted successfully" if success else f"Failed to delete file: {status}"
+            })
+        return results
+
     def get_file_info(self, public_id: str, resource_type: str = 'auto') -> Dict[str, Any]:
         """Get information about a file from Cloudinary"""
         try:
@@ -0,0 +1,201 @@
+"""
+Audit Service Tests
+Unit tests for audit logging, persistence and statistics
+"""
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, MagicMock, patch
+
+import bson
+import pytest
+from bson.errors import InvalidDocument
+
+import services.audit_service as audit_module
+from services.audit_service import AuditService, AuditEventType, AuditEntry
+
+
+def _entry(audit_id):
+    """Minimal queued audit entry"""
+    return AuditEntry(id=audit_id, timestamp='2026-01-01T00:00:00+00:00',
+                      event_type='login_success', level='info')
+
+
+@pytest.fixture
+def service():
+    """AuditService with no reachable database"""
+    with patch.object(audit_module, 'get_database', return_value=None):
+        audit = AuditService(Mock(spec=logging.Logger))
+        yield audit
+
+
+class TestAuditPersistence:
+    """Test cases for connecting to and writing the audit collection"""
+
+    def test_unreachable_database_is_retried(self, service):
+        """Test that one failed connection does not disable persistence"""
+        db = MagicMock()
+        with patch.object(audit_module, 'get_database', side_effect=[None, db]) as get_database:
+            assert service._get_collection() is None
+            # Within the backoff window no new attempt is made
+            assert service._get_collection() is None
+            assert get_database.call_count == 1
+
+            service._next_connect_at = 0.0  # backoff elapsed
+            assert service._get_collection() is db.__getitem__.return_value
+
+    def test_flush_keeps_entries_while_unreachable(self, service):
+        """Test that queued entries survive a failed flush"""
+        entries = [_entry('audit_1'), _entry('audit_2')]
+        service._pending = list(entries)
+
+        with patch.object(audit_module, 'get_database', return_value=None):
+            service.flush()
+
+        assert service._pending == entries
+
+    def test_details_are_made_bson_safe(self, service):
+        """Test that details BSON cannot encode are converted when queued"""
+        queued = []
+        service._queue_for_insert = queued.append
+
+        service.log_event(AuditEventType.FILE_UPLOADED, details={
+            'tags': {'cv'}, 'size': 2 ** 70, 'path': Path('/tmp/cv.pdf'), 1: 'numeric key'
+        })
+
+        details = queued[0].details
+        assert details == {'tags': ['cv'], 'size': str(2 ** 70), 'path': '/tmp/cv.pdf', '1': 'numeric key'}
+        bson.encode(queued[0].to_dict())
+
+    def test_failed_batch_is_retried_singly(self, service):
+        """Test that one unwritable document does not lose the rest of the batch"""
+        collection = Mock()
+        collection.insert_many.side_effect = InvalidDocument("cannot encode object")
+        collection.insert_one.side_effect = [None, InvalidDocument("cannot encode object"), None]
+        service.collection = collection
+        service._pending = [_entry('audit_1'), _entry('audit_2'), _entry('audit_3')]
+
+        service.flush()
+
+        assert [call.args[0]['id'] for call in collection.insert_one.call_args_list] == [
+            'audit_1', 'audit_2', 'audit_3'
+        ]
+        assert service._pending == []
+
+
+class TestAuditStatistics:
+    """Test cases for get_audit_statistics"""
+
+    def test_statistics_from_database(self, service):
+        """Test that statistics are aggregated on the server when it is reachable"""
+        collection = Mock()
+        collection.aggregate.return_value = iter([{
+            'by_type': [{'_id': 'login_success', 'count': 3}, {'_id': 'logout', 'count': 1}],
+            'by_level': [{'_id': 'info', 'count': 4}],
+            'by_admin': [{'_id': 'admin', 'count': 4}]
+        }])
+        service.collection = collection
+
+        result = service.get_audit_statistics()
+
+        assert result['success'] is True
+        assert result['data']['total_events'] == 4
+        assert result['data']['events_by_type'] == {'login_success': 3, 'logout': 1}
+        assert result['data']['events_by_admin'] == {'admin': 4}
+        collection.aggregate.assert_called_once()
+
+    def test_statistics_from_memory(self, service):
+        """Test the in-memory fallback when the database is unreachable"""
+        service._queue_for_insert = Mock()
+        service.log_event(AuditEventType.LOGIN_SUCCESS, admin_id='a1', username='admin')
+        service.log_event(AuditEventType.LOGOUT, admin_id='a1', username='admin')
+
+        with patch.object(audit_module, 'get_database', return_value=None):
+            result = service.get_audit_statistics()
+
+        assert result['data']['total_events'] == 2
+        assert result['data']['events_by_type'] == {'login_success': 1, 'logout': 1}
+
+
+class TestInMemoryLog:
+    """Test cases for the bounded in-memory audit log"""
+
+    def test_in_memory_log_is_bounded(self, service):
+        """Test that AUDIT_INMEM_MAX caps the entries and their indexes"""
+        service._queue_for_insert = Mock()
+        service._max_entries = 10
+
+        for _ in range(25):
+            service.log_event(AuditEventType.LOGIN_SUCCESS, admin_id='a1', username='admin')
+
+        assert len(service.audit_logs) <= 10
+        assert len(service._timestamps) == len(service.audit_logs)
+        assert len(service._by_admin['a1']) == len(service.audit_logs)
+        result = service.get_audit_logs(admin_id='a1', limit=100)
+        assert result['data']['total_count'] == len(service.audit_logs)
+
+    def test_concurrent_logging_keeps_indexes_consistent(self, service):
+        """Test that appends from several threads keep the log, timestamps and indexes aligned"""
+        service._queue_for_insert = Mock()
+        service._max_entries = 50
+
+        def log_many(admin_id):
+            for _ in range(200):
+                service.log_event(AuditEventType.LOGIN_SUCCESS, admin_id=admin_id, username=admin_id)
+
+        threads = [threading.Thread(target=log_many, args=(f'a{i}',)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(service.audit_logs) <= 50
+        assert service._timestamps == sorted(service._timestamps)
+        assert service._timestamps == [log.timestamp for log in service.audit_logs]
+        for admin_id, positions in service._by_admin.items():
+            assert all(service.audit_logs[pos - service._base].admin_id == admin_id for pos in positions)
+        assert sum(len(positions) for positions in service._by_admin.values()) == len(service.audit_logs)
+
+
+class TestAuditCleanup:
+    """Test cases for cleanup_old_logs"""
+
+    def _log_aged_events(self, service, ages_in_days):
+        """Log one event per age, oldest first, backdating its timestamp"""
+        service._queue_for_insert = Mock()
+        now = datetime.now(timezone.utc)
+        for index, age in enumerate(ages_in_days):
+            service.log_event(AuditEventType.LOGIN_SUCCESS, admin_id='a1', username='admin')
+            timestamp = (now - timedelta(days=age)).isoformat()
+            service.audit_logs[index].timestamp = timestamp
+            service._timestamps[index] = timestamp
+
+    def test_cleanup_removes_old_entries_from_memory(self, service):
+        """Test that entries older than the retention window are dropped"""
+        self._log_aged_events(service, [120, 95, 10, 0])
+
+        with patch.object(audit_module, 'get_database', return_value=None):
+            result = service.cleanup_old_logs(days_to_keep=90)
+
+        assert result['success'] is True
+        assert result['data']['removed_logs'] == 2
+        assert result['data']['remaining_logs'] == 2
+        assert 'removed_from_database' not in result['data']
+        assert service.get_audit_logs()['data']['total_count'] == 2
+
+    def test_cleanup_removes_old_entries_from_database(self, service):
+        """Test that the same cutoff is applied to the audit collection"""
+        collection = Mock()
+        collection.delete_many.return_value.deleted_count = 7
+        service.collection = collection
+
+        result = service.cleanup_old_logs(days_to_keep=30)
+
+        assert result['success'] is True
+        assert result['data']['removed_from_database'] == 7
+        cutoff = datetime.fromisoformat(result['data']['cutoff_date'])
+        assert timedelta(days=30) <= datetime.now(timezone.utc) - cutoff < timedelta(days=31)
+        collection.delete_many.assert_called_once_with(
+            {'timestamp': {'$lt': result['data']['cutoff_date']}}
+        )
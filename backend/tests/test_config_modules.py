@@ -4,7 +4,7 @@ Testing the new modular configuration system
 """
 import pytest
 import os
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, MagicMock
 
 
 class TestConfigSettings:
@@ -210,6 +210,34 @@ class TestDatabaseConfig:
         assert admin_logs is not None
         assert email_logs is not None
 
+    def test_create_indexes_drops_replaced_email_index(self):
+        """Test that the old email index is dropped once its replacement exists"""
+        from config.database import DatabaseConfig
+
+        mock_collection = Mock()
+        mock_collection.index_information.return_value = {
+            '_id_': {}, 'email_unique_idx': {}, 'email_unique_ci_idx': {}
+        }
+        db_config = DatabaseConfig('mongodb://test:27017/test')
+        db_config._db = MagicMock()
+        db_config._db.__getitem__.return_value = mock_collection
+
+        assert db_config.create_indexes() is True
+        mock_collection.drop_index.assert_called_once_with('email_unique_idx')
+
+    def test_create_indexes_keeps_email_index_without_replacement(self):
+        """Test that the old email index stays if the new one could not be built"""
+        from config.database import DatabaseConfig
+
+        mock_collection = Mock()
+        mock_collection.index_information.return_value = {'_id_': {}, 'email_unique_idx': {}}
+        db_config = DatabaseConfig('mongodb://test:27017/test')
+        db_config._db = MagicMock()
+        db_config._db.__getitem__.return_value = mock_collection
+
+        assert db_config.create_indexes() is True
+        mock_collection.drop_index.assert_not_called()
+
 
 class TestCloudinaryConfig:
     """Test Cloudinary configuration"""
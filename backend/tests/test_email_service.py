@@ -0,0 +1,625 @@
+"""
+Email Service Tests
+Unit tests for SMTP delivery helpers in the email service
+"""
+import email
+import email.policy
+import logging
+import os
+import smtplib
+import socket
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+import services.email_service as email_module
+from services.email_service import EmailService, PipeliningSMTP
+
+
+class StubSMTPServer:
+    """Single-connection SMTP server that records what the client sends
+
+    With pipelining enabled the server advertises PIPELINING and holds
+    back the replies to MAIL / RCPT until DATA arrives, so a client that
+    waits for each reply before sending the next command times out.
+    """
+
+    def __init__(self, refused_recipients=(), refuse_sender=False, pipelining=True):
+        self.refused_recipients = set(refused_recipients)
+        self.refuse_sender = refuse_sender
+        self.pipelining = pipelining
+        self.commands = []
+        self.messages = []
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.bind(('127.0.0.1', 0))
+        self._sock.listen(1)
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._sock.close()
+        self._thread.join(timeout=5)
+
+    def _serve(self):
+        conn, _ = self._sock.accept()
+        conn.settimeout(5)
+        with conn, conn.makefile('rb') as rfile:
+            def reply(*lines):
+                conn.sendall(b''.join(line.encode() + b'\r\n' for line in lines))
+
+            reply('220 stub ESMTP')
+            pending = []
+            recipients = []
+            sender_ok = False
+            while True:
+                line = rfile.readline()
+                if not line:
+                    return
+                command = line.decode().rstrip('\r\n')
+                self.commands.append(command)
+                verb = command.split(':', 1)[0].split(' ', 1)[0].upper()
+
+                if verb == 'EHLO':
+                    features = ['250-PIPELINING'] if self.pipelining else []
+                    reply('250-stub', *features, '250 SIZE 1000000')
+                    continue
+                if verb == 'MAIL':
+                    sender_ok = not self.refuse_sender
+                    recipients = []
+                    pending.append('250 OK' if sender_ok else '550 Sender rejected')
+                elif verb == 'RCPT':
+                    address = command.split(':', 1)[1].strip().split(' ')[0].strip('<>')
+                    if not sender_ok:
+                        pending.append('503 Need MAIL first')
+                    elif address in self.refused_recipients:
+                        pending.append('550 No such user')
+                    else:
+                        recipients.append(address)
+                        pending.append('250 OK')
+                elif verb == 'DATA':
+                    pending.append('354 Go ahead' if recipients else '554 No valid recipients')
+                elif verb in ('RSET', 'NOOP'):
+                    recipients = []
+                    pending.append('250 OK')
+                elif verb == 'QUIT':
+                    reply('221 Bye')
+                    return
+                else:
+                    pending.append('500 Unknown command')
+
+                if self.pipelining and verb in ('MAIL', 'RCPT'):
+                    continue
+                reply(*pending)
+                pending = []
+
+                if verb == 'DATA' and recipients:
+                    body = b''
+                    while True:
+                        chunk = rfile.readline()
+                        if not chunk or chunk == b'.\r\n':
+                            break
+                        body += chunk
+                    self.messages.append((list(recipients), body))
+                    recipients = []
+                    reply('250 Queued')
+
+
+@pytest.fixture
+def smtp_stub():
+    servers = []
+    clients = []
+
+    def connect(**options):
+        server = StubSMTPServer(**options)
+        client = PipeliningSMTP('127.0.0.1', server.port, timeout=2)
+        servers.append(server)
+        clients.append(client)
+        return server, client
+
+    yield connect
+
+    for client in clients:
+        client.close()
+    for server in servers:
+        server.close()
+
+
+MESSAGE = b'Subject: test\r\n\r\nHello\r\n'
+
+
+class TestPipeliningSMTP:
+    """Test cases for the pipelined MAIL / RCPT / DATA exchange"""
+
+    def test_sends_envelope_as_one_group(self, smtp_stub):
+        server, client = smtp_stub()
+
+        refused = client.sendmail('from@example.com', ['a@example.com', 'b@example.com'], MESSAGE)
+
+        assert refused == {}
+        assert server.messages == [(['a@example.com', 'b@example.com'], MESSAGE)]
+        assert server.commands[1:5] == [
+            'MAIL FROM:<from@example.com> size=%d' % len(MESSAGE),
+            'RCPT TO:<a@example.com>',
+            'RCPT TO:<b@example.com>',
+            'DATA',
+        ]
+
+    def test_reports_refused_recipients(self, smtp_stub):
+        server, client = smtp_stub(refused_recipients={'bad@example.com'})
+
+        refused = client.sendmail('from@example.com', ['ok@example.com', 'bad@example.com'], MESSAGE)
+
+        assert refused == {'bad@example.com': (550, b'No such user')}
+        assert server.messages == [(['ok@example.com'], MESSAGE)]
+
+    def test_all_recipients_refused(self, smtp_stub):
+        server, client = smtp_stub(refused_recipients={'a@example.com', 'b@example.com'})
+
+        with pytest.raises(smtplib.SMTPRecipientsRefused) as excinfo:
+            client.sendmail('from@example.com', ['a@example.com', 'b@example.com'], MESSAGE)
+
+        assert set(excinfo.value.recipients) == {'a@example.com', 'b@example.com'}
+        assert server.messages == []
+        assert server.commands[-1].upper() == 'RSET'
+        # The session is left usable for the next message
+        assert client.noop()[0] == 250
+
+    def test_sender_refused_resets_session(self, smtp_stub):
+        server, client = smtp_stub(refuse_sender=True)
+
+        with pytest.raises(smtplib.SMTPSenderRefused):
+            client.sendmail('from@example.com', ['a@example.com'], MESSAGE)
+
+        assert server.commands[-1].upper() == 'RSET'
+        assert client.noop()[0] == 250
+
+    def test_dot_stuffing(self, smtp_stub):
+        server, client = smtp_stub()
+        message = b'Subject: dots\r\n\r\n.leading dot\r\nmiddle . dot\r\n.\r\nend'
+
+        client.sendmail('from@example.com', ['a@example.com'], message)
+
+        (_, body), = server.messages
+        assert body == b'Subject: dots\r\n\r\n..leading dot\r\nmiddle . dot\r\n..\r\nend\r\n'
+
+    def test_falls_back_without_pipelining(self, smtp_stub):
+        server, client = smtp_stub(pipelining=False, refused_recipients={'bad@example.com'})
+
+        refused = client.sendmail('from@example.com', ['ok@example.com', 'bad@example.com'], MESSAGE)
+
+        assert refused == {'bad@example.com': (550, b'No such user')}
+        assert server.messages == [(['ok@example.com'], MESSAGE)]
+
+
+class TestEmailServiceHealthCheck:
+    """Test cases for the EmailService SMTP probe"""
+
+    @pytest.fixture(autouse=True)
+    def empty_health_cache(self):
+        with patch.dict(email_module._health_cache, {"value": None, "expires": 0.0}):
+            yield
+
+    def setup_method(self):
+        self.service = EmailService(Mock(spec=logging.Logger))
+        self.pool = self.service._pool
+
+    def test_probe_closes_its_own_connection(self):
+        """Test that a probe with no idle session does not leave one open"""
+        server = Mock()
+        self.pool._connect = Mock(return_value=server)
+
+        assert self.service.health_check()['status'] == 'healthy'
+
+        server.quit.assert_called_once()
+        assert self.pool._idle.empty()
+
+    def test_probe_reuses_idle_session(self):
+        """Test that an idle session is checked with NOOP and kept"""
+        session = Mock()
+        session.noop.return_value = (250, b'OK')
+        self.pool._put_idle(email_module._PooledSMTP(session))
+        self.pool._connect = Mock()
+
+        assert self.service.health_check()['status'] == 'healthy'
+
+        self.pool._connect.assert_not_called()
+        session.quit.assert_not_called()
+        assert self.pool._idle.get_nowait().server is session
+
+    def test_probe_replaces_dead_session(self):
+        """Test that a dropped idle session is discarded before probing"""
+        session = Mock()
+        session.noop.side_effect = smtplib.SMTPServerDisconnected()
+        self.pool._put_idle(email_module._PooledSMTP(session))
+        self.pool._connect = Mock(return_value=Mock())
+
+        assert self.service.health_check()['status'] == 'healthy'
+
+        session.quit.assert_called_once()
+        self.pool._connect.assert_called_once()
+        assert self.pool._idle.empty()
+
+
+    def test_result_cached_across_instances(self):
+        """Test that a recent probe result is reused without touching SMTP"""
+        self.pool._connect = Mock(return_value=Mock())
+        first = self.service.health_check()
+
+        second = EmailService(Mock(spec=logging.Logger))
+        second._pool._connect = Mock()
+        assert second.health_check() is first
+        second._pool._connect.assert_not_called()
+
+    def test_stale_result_refreshed_in_background(self):
+        """Test that a stale result is returned at once while a new probe runs"""
+        release = threading.Event()
+        self.pool._connect = Mock(return_value=Mock())
+        stale = self.service.health_check()
+        email_module._health_cache["expires"] = 0.0
+
+        def slow_connect():
+            release.wait(5)
+            raise OSError("connection refused")
+
+        self.pool._connect = Mock(side_effect=slow_connect)
+        assert self.service.health_check() is stale
+        # A refresh is already running, so no second probe is started
+        assert self.service.health_check() is stale
+
+        release.set()
+        with email_module._health_refresh_lock:
+            pass
+        assert self.service.health_check()["status"] == "unhealthy"
+        assert self.pool._connect.call_count == 1
+
+
+class TestSharedEmailService:
+    """Test cases for the process-wide EmailService instance"""
+
+    def test_only_shared_instance_closed_at_exit(self):
+        """Test that creating an instance does not pin it with an exit hook"""
+        with patch.object(email_module.atexit, 'register') as register:
+            EmailService(Mock(spec=logging.Logger))
+
+        register.assert_not_called()
+        assert isinstance(email_module.email_service, EmailService)
+
+
+class TestApplicationEmailQueue:
+    """Test cases for background delivery of queued emails"""
+
+    CANDIDATE = {'nombre': 'Ana', 'apellido': 'Ruiz', 'email': 'ana@example.com', 'puesto': 'Chef'}
+
+    def setup_method(self):
+        self.service = EmailService(Mock(spec=logging.Logger))
+        self.service._admin_email = 'admin@example.com'
+
+    def _run_job(self, errors):
+        """Queue one job, deliver it with the given per-message errors and return its result"""
+        done = threading.Event()
+        results = []
+
+        def callback(job_id, result):
+            results.append(result)
+            done.set()
+
+        with patch.object(self.service, '_deliver', return_value=errors):
+            queued = self.service.queue_application_emails(self.CANDIDATE, {}, callback=callback)
+            assert queued['success'] is True
+            assert done.wait(5)
+        self.service.close()
+        return results[0]
+
+    def test_worker_reports_success(self):
+        result = self._run_job([None, None])
+
+        assert result['success'] is True
+        assert result['data']['confirmation']['success'] is True
+        assert result['data']['admin_notification']['success'] is True
+
+    def test_worker_reports_failed_sends(self):
+        error = smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        result = self._run_job([error, error])
+
+        assert result['success'] is False
+        assert result['error_type'] == 'EmailDeliveryError'
+        assert result['details']['confirmation']['success'] is False
+        assert result['details']['admin_notification']['success'] is False
+        self.service.logger.warning.assert_called_once()
+
+    def test_partial_failure_is_not_success(self):
+        result = self._run_job([None, smtplib.SMTPDataError(554, b'Rejected')])
+
+        assert result['success'] is False
+        assert result['error'] == 'Application emails not sent: admin_notification'
+        assert result['details']['confirmation']['success'] is True
+
+    def test_status_change_email_queued(self):
+        done = threading.Event()
+        results = []
+
+        def callback(job_id, result):
+            results.append(result)
+            done.set()
+
+        with patch.object(self.service, '_deliver', return_value=[None]) as deliver:
+            queued = self.service.queue_application_status_change_email(
+                self.CANDIDATE, 'contacted', 'pending', callback=callback
+            )
+            assert queued['success'] is True
+            assert done.wait(5)
+        self.service.close()
+
+        assert results[0]['success'] is True
+        (message, recipients), = deliver.call_args.args[0]
+        assert recipients == ['ana@example.com']
+
+    def test_invalid_status_change_recipient_not_queued(self):
+        result = self.service.queue_application_status_change_email({'email': 'nope'}, 'approved')
+
+        assert result['error_type'] == 'InvalidEmail'
+        assert self.service._worker_thread is None
+
+    def test_invalid_admin_email_not_sent(self):
+        self.service._admin_email = 'admin-at-example'
+
+        with patch.object(self.service, '_deliver', return_value=[None]) as deliver:
+            result = self.service.send_application_emails(self.CANDIDATE, {})
+
+        assert result['details']['admin_notification']['error_type'] == 'ValidationError'
+        assert result['details']['confirmation']['success'] is True
+        (message, recipients), = deliver.call_args.args[0]
+        assert recipients == ['ana@example.com']
+
+
+class TestSendEmail:
+    """Test cases for EmailService.send_email"""
+
+    def test_invalid_copy_recipients_are_dropped(self):
+        service = EmailService(Mock(spec=logging.Logger))
+
+        with patch.object(service, '_deliver', return_value=[None]) as deliver:
+            result = service.send_email(
+                'to@example.com', 'Subject', '<p>Hi</p>',
+                cc_emails=[' cc@example.com ', 'not-an-address'],
+                bcc_emails=['bcc@example.com', '']
+            )
+
+        assert result['success'] is True
+        (message, recipients), = deliver.call_args.args[0]
+        assert recipients == ['to@example.com', 'cc@example.com', 'bcc@example.com']
+        assert message['Cc'] == 'cc@example.com'
+        assert service.logger.warning.call_count == 2
+
+
+    def test_message_has_text_and_html_alternatives(self, smtp_stub):
+        service = EmailService(Mock(spec=logging.Logger))
+        service._from_email = 'from@example.com'
+        message, recipients = service._build_message(
+            'to@example.com', 'Confirmación', '<p>Hola</p>', 'Hola', bcc_emails=['bcc@example.com']
+        )
+
+        server, client = smtp_stub()
+        client.send_message(message, to_addrs=recipients)
+
+        (delivered_to, body), = server.messages
+        assert delivered_to == ['to@example.com', 'bcc@example.com']
+        parsed = email.message_from_bytes(body, policy=email.policy.default)
+        assert parsed['Subject'] == 'Confirmación'
+        assert parsed['Bcc'] is None
+        assert [part.get_content_type() for part in parsed.iter_parts()] == ['text/plain', 'text/html']
+        assert parsed.get_body(('html',)).get_content().strip() == '<p>Hola</p>'
+
+    def test_from_header_parsed_once(self):
+        service = EmailService(Mock(spec=logging.Logger))
+        service._from_email = 'WorkWave Coast <from@example.com>'
+
+        first, _ = service._build_message('a@example.com', 'Subject', '<p>Hi</p>')
+        second, _ = service._build_message('b@example.com', 'Subject', '<p>Hi</p>')
+
+        assert first['From'] is second['From']
+        assert first['From'].addresses[0].addr_spec == 'from@example.com'
+        assert b'From: WorkWave Coast <from@example.com>' in first.as_bytes()
+
+    def test_invalid_recipient_rejected_before_rendering(self):
+        service = EmailService(Mock(spec=logging.Logger))
+
+        with patch.object(service, 'create_confirmation_email') as create:
+            result = service.send_confirmation_email({'email': 'not-an-address', 'nombre': 'Ana'})
+
+        assert result['success'] is False
+        assert result['error_type'] == 'ValidationError'
+        create.assert_not_called()
+
+    def test_password_emails_validate_recipient_before_rendering(self):
+        service = EmailService(Mock(spec=logging.Logger))
+
+        with patch.object(email_module, '_PASSWORD_RECOVERY_HTML') as recovery, \
+                patch.object(email_module, '_PASSWORD_RESET_CONFIRMATION_HTML') as confirmation:
+            results = [
+                service.send_password_recovery_email('admin', 'admin', 'https://example.com/r', '1h'),
+                service.send_password_reset_confirmation_email('', 'admin'),
+            ]
+
+        assert [result['error_type'] for result in results] == ['InvalidEmail', 'InvalidEmail']
+        recovery.render.assert_not_called()
+        confirmation.render.assert_not_called()
+
+    def test_text_part_can_be_disabled(self):
+        service = EmailService(Mock(spec=logging.Logger))
+        service._send_text = False
+
+        content = service.create_confirmation_email({'nombre': 'Ana', 'puesto': 'Chef'})
+        message, _ = service._build_message('to@example.com', 'Subject', '<p>Hi</p>', 'Hi')
+
+        assert content['text_content'] is None
+        assert message.get_content_type() == 'text/html'
+
+
+class TestSMTPPool:
+    """Test cases for pooling and rotating SMTP sessions"""
+
+    def setup_method(self):
+        self.connections = []
+        self.pool = email_module._SMTPPool(self._connect, size=2, max_per_conn=1000)
+        self.service = EmailService(Mock(spec=logging.Logger))
+        self.service._pool = self.pool
+
+    def _connect(self):
+        server = Mock()
+        server.noop.return_value = (250, b'OK')
+        self.connections.append(server)
+        return server
+
+    def _send(self, count):
+        return self.service._deliver([(Mock(), ['a@example.com'])] * count)
+
+    def test_rotates_after_message_cap(self):
+        self.pool.max_per_conn = 2
+
+        assert self._send(5) == [None] * 5
+
+        assert [server.send_message.call_count for server in self.connections] == [2, 2, 1]
+        self.connections[0].quit.assert_called_once()
+        self.connections[1].quit.assert_called_once()
+
+    def test_replaces_idle_session(self):
+        self._send(1)
+        self.pool._idle.queue[0].last_used -= email_module._SMTP_IDLE_TTL
+
+        self._send(1)
+
+        assert len(self.connections) == 2
+        self.connections[0].noop.assert_not_called()
+        self.connections[0].quit.assert_called_once()
+
+    def test_reuses_recent_session(self):
+        self._send(1)
+        self._send(1)
+
+        assert len(self.connections) == 1
+        assert self.pool._idle.queue[0].sent == 2
+
+    def test_concurrent_sends_use_separate_sessions(self):
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+
+        assert first.server is not second.server
+        # Both slots are taken, so a third sender waits
+        assert self.pool._slots.acquire(blocking=False) is False
+
+        self.pool.release(first)
+        self.pool.release(second)
+        assert self.pool.acquire().server is second.server  # most recently used first
+
+    def test_broken_session_is_not_reused(self):
+        conn = self.pool.acquire()
+        self.pool.release(conn, broken=True)
+
+        conn.server.quit.assert_called_once()
+        assert self.pool._idle.empty()
+
+    def test_reconnects_when_dropped_mid_send(self):
+        self._send(1)
+        self.connections[0].send_message.side_effect = smtplib.SMTPServerDisconnected()
+
+        assert self._send(1) == [None]
+        assert len(self.connections) == 2
+        self.connections[1].send_message.assert_called_once()
+
+
+class TestEmailConfig:
+    """Test cases for loading the email settings"""
+
+    def teardown_method(self):
+        email_module._build_email_config.cache_clear()
+
+    def test_config_read_once_and_shared(self):
+        email_module._build_email_config.cache_clear()
+        with patch.dict(os.environ, {'MAIL_USERNAME': 'sender@example.com', 'MAIL_PORT': '465'}):
+            first = EmailService(Mock(spec=logging.Logger))
+            second = EmailService(Mock(spec=logging.Logger))
+
+        assert first.email_config is second.email_config
+        assert first._smtp_port == 465
+        assert first._from_email == 'sender@example.com'
+        with pytest.raises(TypeError):
+            first.email_config['smtp_port'] = 25
+
+    def test_invalid_config_is_not_cached(self):
+        email_module._build_email_config.cache_clear()
+        with patch.dict(os.environ, {'MAIL_PORT': 'not-a-port'}):
+            service = EmailService(Mock(spec=logging.Logger))
+        assert service.email_config is None
+
+        with patch.dict(os.environ, {'MAIL_PORT': '587'}):
+            assert EmailService(Mock(spec=logging.Logger)).email_config is not None
+
+
+class TestEmailTemplates:
+    """Test cases for loading and rendering the email templates"""
+
+    def test_minify_collapses_whitespace(self):
+        source = (
+            '<html>\n  <head>\n    <style>\n      .a {\n        color: red;\n      }\n    </style>\n'
+            '  </head>\n  <!-- note -->\n  <body>\n    <p>Hola   {{ nombre }}</p>\n'
+            '    <pre style="white-space: pre-wrap;">{{ files }}\n  kept</pre>\n  </body>\n</html>\n'
+        )
+
+        assert email_module._minify_html(source) == (
+            '<html> <head> <style>.a{color:red;}</style> </head> <body> <p>Hola {{ nombre }}</p> '
+            '<pre style="white-space: pre-wrap;">{{ files }}\n  kept</pre> </body> </html>'
+        )
+
+    def test_rendered_templates_keep_content(self):
+        service = EmailService(Mock(spec=logging.Logger))
+        candidate = {'nombre': 'Ana', 'apellido': 'Ruiz', 'email': 'ana@example.com', 'puesto': 'Chef'}
+        files_info = {'cv': {'url': 'https://example.com/cv.pdf', 'original_filename': 'cv.pdf'}}
+
+        html = service.create_admin_notification_email(candidate, files_info)['html_content']
+
+        assert '\n    ' not in html
+        assert 'Ana' in html and 'Chef' in html
+        assert '<pre style="white-space: pre-wrap; font-family: inherit;">- cv: cv.pdf</pre>' in html
+
+    def test_candidate_fields_are_escaped(self):
+        service = EmailService(Mock(spec=logging.Logger))
+        candidate = {'nombre': '<script>x</script>', 'puesto': 'Chef & "Sous"'}
+
+        for create in (service.create_application_approved_email, service.create_application_rejected_email):
+            html = create(candidate)['html_content']
+            assert '<script>' not in html
+            assert '&lt;script&gt;' in html and 'Chef &amp; &#34;Sous&#34;' in html
+
+    def test_admin_notification_without_uploaded_files(self):
+        service = EmailService(Mock(spec=logging.Logger))
+        candidate = {'nombre': 'Ana', 'puesto': 'Chef'}
+
+        for files_info in (None, {}, {'cv': None, 'carta': {'original_filename': 'carta.pdf'}}):
+            text = service.create_admin_notification_email(candidate, files_info)['text_content']
+            assert 'No se adjuntaron archivos' in text
+
+
+class TestStatusChangeEmails:
+    """Test cases for application status change emails"""
+
+    def setup_method(self):
+        self.service = EmailService(Mock(spec=logging.Logger))
+
+    def test_approved_status_sends_approval_email(self):
+        with patch.object(self.service, '_deliver', return_value=[None]) as deliver:
+            result = self.service.send_application_status_change_email(
+                {'nombre': 'Ana', 'email': 'ana@example.com', 'puesto': 'Chef'}, 'Approved'
+            )
+
+        assert result['success'] is True
+        (message, recipients), = deliver.call_args.args[0]
+        assert recipients == ['ana@example.com']
+        assert '¡Felicitaciones' in message['Subject']
+
+    def test_generic_status_is_translated(self):
+        content = self.service.create_status_change_email({'nombre': 'Ana', 'puesto': 'Chef'}, 'Interview')
+
+        assert 'Entrevista Programada' in content['html_content']
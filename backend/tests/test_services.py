@@ -4,6 +4,7 @@ Unit tests for service layer components
 """
 import pytest
 import logging
+from contextlib import contextmanager
 from unittest.mock import Mock, patch, MagicMock
 from services import ApplicationService, AdminService, FileService, EmailService
 
@@ -24,6 +25,22 @@ class TestApplicationService:
         assert "service" in result
         assert result["service"] == "ApplicationService"
 
+    def test_health_check_cached_across_instances(self):
+        """Test that a new service instance reuses the recent probe result"""
+        import services.application_service as application_module
+
+        with patch.dict(application_module._health_cache, {"value": None, "expires": 0.0}):
+            first = ApplicationService(self.logger)
+            first._initialized = True
+            first.collection = Mock()
+            second = ApplicationService(self.logger)
+            second._initialized = True
+            second.collection = Mock()
+
+            assert first.health_check()["status"] == "healthy"
+            assert second.health_check()["status"] == "healthy"
+            second.collection.estimated_document_count.assert_not_called()
+
     def test_validate_application_data_valid(self):
         """Test validation with valid data"""
         valid_data = {
@@ -51,6 +68,134 @@ class TestApplicationService:
         assert result[0] is False  # Should be invalid
         assert isinstance(result[1], str)  # Should have error message
 
+    def test_validate_application_data_length_error_order(self):
+        """Test that length errors follow the field order, not submission order"""
+        data = {
+            'experiencia': 'x' * 501,
+            'puesto': 'Developer',
+            'nombre': 'a' * 51,
+        }
+
+        valid, errors = self.service.validate_application_data(data)
+        assert valid is False
+        assert errors[-2:] == [
+            "Campo nombre excede la longitud máxima de 50 caracteres",
+            "Campo experiencia excede la longitud máxima de 500 caracteres",
+        ]
+
+    @pytest.mark.parametrize("phone", [
+        '+34 600123456',
+        '+1 5551234567',
+        '+385 9112345678',
+        '+1234 1234567',
+        '+54 123456789012345',
+        '  +34 600123456  ',  # Surrounding whitespace is stripped
+    ])
+    def test_validate_phone_number_valid(self, phone):
+        """Test phone numbers in the "+<code> <number>" format"""
+        assert self.service.validate_phone_number(phone) == (True, "Válido")
+
+    @pytest.mark.parametrize("phone", [
+        '34 600123456',  # Missing leading '+'
+        '++34 600123456',
+        '+ 600123456',  # Empty country code
+        '+12345 6001234',  # Country code too long
+        '+3a 600123456',
+        '+34600123456',  # No separator
+        '+34\t600123456',  # Tab separator
+        '+34  600123456',  # Multiple spaces
+        '+34 600 123 456',
+        '+34 600123',  # Number too short
+        '+34 1234567890123456',  # Number too long
+        '+34 600-123456',
+    ])
+    def test_validate_phone_number_invalid_format(self, phone):
+        """Test phone numbers that do not match the international format"""
+        valid, message = self.service.validate_phone_number(phone)
+        assert valid is False
+        assert message == "Formato de teléfono inválido. Use el formato: +código país número"
+
+    @pytest.mark.parametrize("phone", ['', None, 34600123456])
+    def test_validate_phone_number_missing(self, phone):
+        """Test that empty or non-string phone numbers are rejected"""
+        assert self.service.validate_phone_number(phone) == (False, "Número de teléfono requerido")
+
+    def _mock_export_cursor(self, documents):
+        """Point the service at a mock collection whose export cursor yields documents"""
+        self.service._initialized = True
+        self.service.collection = Mock()
+        self.service.collection.count_documents.return_value = 2
+        self.service.collection.find.return_value.sort.return_value.batch_size.return_value = documents
+
+    def test_export_stream_query_error_before_response(self):
+        """Test that a failing export query is reported before streaming starts"""
+        def failing_cursor():
+            raise RuntimeError("bad query")
+            yield
+
+        self._mock_export_cursor(failing_cursor())
+        result = self.service.export_applications_stream('csv', {})
+        assert result["success"] is False
+
+    def test_export_stream_marks_truncated_csv(self):
+        """Test that a cursor failure mid-stream is logged and not hidden"""
+        def broken_cursor():
+            yield {'_id': 1, 'nombre': 'Ana'}
+            raise RuntimeError("cursor lost")
+
+        self._mock_export_cursor(broken_cursor())
+        result = self.service.export_applications_stream('csv', {})
+        assert result["success"] is True
+
+        chunks = []
+        with pytest.raises(RuntimeError):
+            for chunk in result["data"]["stream"]:
+                chunks.append(chunk)
+
+        assert b''.join(chunks).decode('utf-8').endswith("EXPORT INCOMPLETE: failed after 1 rows\r\n")
+        self.logger.error.assert_called()
+
+    def test_create_application_keeps_list_puestos_adicionales(self):
+        """Test that list values of puestos_adicionales are stored, not dropped"""
+        self.service._initialized = True
+        self.service.collection = Mock()
+        self.service.collection.insert_one.return_value = Mock(inserted_id='abc123')
+        data = {
+            'nombre': 'Juan', 'apellido': 'Pérez', 'email': 'Juan@Example.com',
+            'telefono': '+54 11 1234 5678', 'nacionalidad': 'Argentina',
+            'puesto': 'Cocinero', 'ingles_nivel': 'B1', 'experiencia': '5 años',
+            'puestos_adicionales': [' Mozo ', '', 'Bartender']
+        }
+
+        with patch.object(self.service, 'validate_application_data', return_value=(True, {})):
+            result = self.service.create_application(data)
+
+        assert result['success'] is True
+        stored = self.service.collection.insert_one.call_args[0][0]
+        assert stored['puestos_adicionales'] == ['Mozo', 'Bartender']
+        assert stored['email'] == 'juan@example.com'
+
+    def test_search_filter_email(self):
+        """Test that email searches are an escaped, anchored prefix match"""
+        from services.application_service import _search_filter
+        assert _search_filter('juan.p@email.com') == {
+            'email': {'$regex': r'^juan\.p@email\.com', '$options': 'i'}
+        }
+
+    def test_search_filter_phone(self):
+        """Test that phone searches match anywhere in the number"""
+        from services.application_service import _search_filter
+        assert _search_filter('600123') == {'telefono': {'$regex': '600123'}}
+        assert _search_filter('+34 600') == {'telefono': {'$regex': r'\+34\ 600'}}
+
+    def test_search_filter_name_words(self):
+        """Test that every word must prefix a name word or the email"""
+        from services.application_service import _search_filter
+        query = _search_filter('Jua Pér')
+        assert [clause['$or'][0]['nombre']['$regex'] for clause in query['$and']] == [
+            r'(?:^|\s)Jua', r'(?:^|\s)Pér'
+        ]
+
 
 class TestAdminService:
     """Test cases for AdminService"""
@@ -82,6 +227,28 @@ class TestAdminService:
         assert "error" in result
 
 
+class TestDashboardBounds:
+    """Test cases for AdminService._get_dashboard_bounds"""
+
+    def test_bounds_follow_the_minute_of_now(self):
+        """Test that bounds cached just before midnight are not reused after it"""
+        from types import SimpleNamespace
+        from datetime import datetime, timedelta, timezone
+
+        holder = SimpleNamespace(_bounds_cache=None)
+        before = datetime(2026, 3, 31, 23, 59, 30, tzinfo=timezone.utc)
+        after = before + timedelta(seconds=45)
+
+        assert AdminService._get_dashboard_bounds(holder, before)[0].day == 31
+        assert AdminService._get_dashboard_bounds(holder, before.replace(second=59)) is holder._bounds_cache[1]
+
+        today_start, week_start, month_start, thirty_days_ago = AdminService._get_dashboard_bounds(holder, after)
+        assert today_start == datetime(2026, 4, 1, tzinfo=timezone.utc)
+        assert week_start == datetime(2026, 3, 30, tzinfo=timezone.utc)
+        assert month_start == datetime(2026, 4, 1, tzinfo=timezone.utc)
+        assert thirty_days_ago == datetime(2026, 3, 2, 0, 0, tzinfo=timezone.utc)
+
+
 class TestFileService:
     """Test cases for FileService"""
 
@@ -98,6 +265,207 @@ class TestFileService:
         assert "service" in result
         assert result["service"] == "FileService"
 
+    @pytest.mark.parametrize("filename,safe", [
+        ('cv.pdf', True),
+        ('mi cv (2025)..final.pdf', True),
+        ('../etc/passwd', False),
+        ('..\\boot.ini', False),
+        ('dir/cv.pdf', False),
+        ('C:cv.pdf', False),
+        ('cv<1>.pdf', False),
+        ('cv?.pdf', False),
+        ('a' * 252 + '.pdf', False),
+        ('', False),
+    ])
+    def test_is_safe_filename(self, filename, safe):
+        """Test that separators, reserved characters and long names are rejected"""
+        assert self.service._is_safe_filename(filename) is safe
+
+    @pytest.mark.parametrize("filename,content_type,error", [
+        ('CV.PDF', 'application/pdf', None),
+        ('cv', 'application/pdf', "Tipo de archivo no permitido para cv. Permitidos: .pdf"),
+        ('cv.docx', 'application/pdf', "Tipo de archivo no permitido para cv. Permitidos: .pdf"),
+        ('cv.pdf', 'image/png', "Tipo MIME no permitido para cv. Esperado: application/pdf, recibido: image/png"),
+    ])
+    def test_validate_file_type(self, filename, content_type, error):
+        """Test extension and MIME type checks against the allowed sets"""
+        from io import BytesIO
+        from werkzeug.datastructures import FileStorage
+
+        file = FileStorage(BytesIO(b'%PDF-1.4'), filename=filename, content_type=content_type)
+        valid, message, _ = self.service.validate_file(file, 'cv')
+
+        assert valid is (error is None)
+        assert message == error
+
+    def test_validate_file_rejects_before_sizing(self):
+        """Test that bad names and declared oversize uploads never touch the stream"""
+        from io import BytesIO
+        from werkzeug.datastructures import FileStorage, Headers
+
+        oversize = FileStorage(BytesIO(b'%PDF'), filename='cv.pdf', content_type='application/pdf',
+                               headers=Headers({'Content-Length': str(6 * 1024 * 1024)}))
+        unsafe = FileStorage(BytesIO(b'%PDF'), filename='../cv.pdf', content_type='application/pdf')
+
+        with patch.object(self.service, '_get_file_size') as get_size:
+            assert self.service.validate_file(oversize, 'cv') == (
+                False, "El archivo cv es demasiado grande. Máximo: 5.0MB", 6 * 1024 * 1024
+            )
+            assert self.service.validate_file(unsafe, 'cv') == (False, "Nombre de archivo no válido para cv", 0)
+            get_size.assert_not_called()
+
+    def test_file_size_from_descriptor_or_stream(self):
+        """Test that on-disk uploads are sized by fstat and in-memory ones by seeking"""
+        import tempfile
+        from io import BytesIO
+        from werkzeug.datastructures import FileStorage
+
+        spooled = tempfile.SpooledTemporaryFile(max_size=1024)
+        spooled.write(b'x' * 10)
+        spooled.seek(0)
+        with tempfile.TemporaryFile() as on_disk:
+            on_disk.write(b'x' * 2048)
+            on_disk.seek(0)
+
+            assert self.service._get_file_size(FileStorage(on_disk, filename='cv.pdf')) == 2048
+            assert self.service._get_file_size(FileStorage(BytesIO(b'x' * 5))) == 5
+            assert self.service._get_file_size(FileStorage(spooled, filename='cv.pdf')) == 10
+            assert spooled._rolled is False
+
+    def test_delete_multiple_files_in_batches(self):
+        """Test that deletes are sent 100 public IDs per Admin API call"""
+        public_ids = [f'workwave/cv/{i}' for i in range(150)]
+        self.service.cloudinary_configured = True
+
+        def delete_resources(ids, resource_type):
+            return {'deleted': {public_id: 'not_found' if public_id.endswith('/7') else 'deleted'
+                                for public_id in ids}}
+
+        with patch('cloudinary.api.delete_resources', side_effect=delete_resources) as batch, \
+                patch('cloudinary.uploader.destroy') as destroy:
+            result = self.service.delete_multiple_files(public_ids, 'raw')
+
+        assert [len(call.args[0]) for call in batch.call_args_list] == [100, 50]
+        destroy.assert_not_called()
+        assert result['data']['summary'] == {'requested_count': 150, 'deleted_count': 149, 'failed_count': 1}
+        assert result['data']['results'][7] == {
+            'public_id': 'workwave/cv/7', 'success': False, 'message': "Failed to delete file: not_found"
+        }
+
+    def test_delete_multiple_files_resolves_auto_resource_type(self):
+        """Test that the default 'auto' type is batched as image, then raw for the rest"""
+        self.service.cloudinary_configured = True
+        self.logger.warning.reset_mock()
+        stored_as = {'workwave/foto/a': 'image', 'workwave/cv/a': 'raw'}
+
+        def delete_resources(ids, resource_type):
+            if resource_type == 'auto':
+                raise RuntimeError("Invalid resource type auto")
+            return {'deleted': {public_id: 'deleted' if stored_as.get(public_id) == resource_type else 'not_found'
+                                for public_id in ids}}
+
+        with patch('cloudinary.api.delete_resources', side_effect=delete_resources) as batch, \
+                patch('cloudinary.uploader.destroy') as destroy:
+            result = self.service.delete_multiple_files(['workwave/foto/a', 'workwave/cv/a', 'missing'])
+
+        assert [(call.args[0], call.kwargs['resource_type']) for call in batch.call_args_list] == [
+            (['workwave/foto/a', 'workwave/cv/a', 'missing'], 'image'),
+            (['workwave/cv/a', 'missing'], 'raw'),
+            (['missing'], 'video'),
+        ]
+        destroy.assert_not_called()
+        self.logger.warning.assert_not_called()
+        assert [r['success'] for r in result['data']['results']] == [True, True, False]
+        assert result['data']['results'][2]['message'] == "Failed to delete file: not_found"
+
+    def test_delete_multiple_files_falls_back_per_file(self):
+        """Test that a failed batch call is retried one file at a time"""
+        self.service.cloudinary_configured = True
+
+        with patch('cloudinary.api.delete_resources', side_effect=RuntimeError("rate limited")), \
+                patch('cloudinary.uploader.destroy', return_value={'result': 'ok'}) as destroy:
+            result = self.service.delete_multiple_files(['a', 'b'], 'raw')
+
+        assert destroy.call_count == 2
+        assert result['data']['summary']['deleted_count'] == 2
+
+    def test_upload_multiple_files_in_parallel(self):
+        """Test that the files of one application upload concurrently"""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def upload(file, field_name, prefix):
+            barrier.wait()
+            if field_name == 'foto':
+                return self.service.error_response("Upload failed", "UploadError")
+            return self.service.success_response({'size': 10, 'field_name': field_name})
+
+        files = {'cv': Mock(filename='cv.pdf'), 'foto': Mock(filename='foto.png'), 'referencias': None}
+        with patch.object(self.service, 'upload_to_cloudinary', side_effect=upload):
+            result = self.service.upload_multiple_files(files)
+
+        assert list(result['data']['files']) == ['cv']
+        assert result['data']['summary'] == {'uploaded_count': 1, 'error_count': 1, 'total_size': 10}
+
+    @pytest.mark.parametrize("field_name,resource_type,flags", [
+        ('cv', 'raw', ['attachment']),
+        ('foto', 'image', None),
+        ('referencias', 'auto', ['attachment']),
+        ('otro', 'auto', None),
+    ])
+    def test_upload_options_per_field(self, field_name, resource_type, flags):
+        """Test the Cloudinary options each field is uploaded with"""
+        from io import BytesIO
+        from werkzeug.datastructures import FileStorage
+
+        self.service.cloudinary_configured = True
+        file = FileStorage(BytesIO(b'data'), filename='file.pdf')
+        uploaded = {'secure_url': 'https://res/x', 'public_id': 'x', 'resource_type': 'raw', 'created_at': 'now'}
+
+        with patch.object(self.service, 'validate_file', return_value=(True, None, 4)), \
+                patch('cloudinary.uploader.upload', return_value=uploaded) as upload:
+            assert self.service.upload_to_cloudinary(file, field_name)['success'] is True
+
+        options = upload.call_args.kwargs
+        assert options['folder'] == f'workwave/{field_name}'
+        assert options['resource_type'] == resource_type
+        assert options.get('flags') == flags
+        assert options['public_id'].startswith('workwave_') and options['overwrite'] is False
+        assert ('eager' in options) is (field_name == 'foto')
+        assert 'public_id' not in self.service._UPLOAD_OPTIONS.get(field_name, self.service._DEFAULT_UPLOAD_OPTIONS)
+
+    @contextmanager
+    def _cloudinary_credentials(self):
+        """Configure a fresh SDK setup from fake credentials, yielding the cloudinary.config mock"""
+        from services.file_service import _configure_cloudinary_sdk
+
+        credentials = {'CLOUDINARY_CLOUD_NAME': 'cloud', 'CLOUDINARY_API_KEY': 'key', 'CLOUDINARY_API_SECRET': 'secret'}
+        _configure_cloudinary_sdk.cache_clear()
+        try:
+            with patch.dict('os.environ', credentials), patch('services.file_service.get_cloudinary_config'), \
+                    patch('cloudinary.config') as sdk_config:
+                yield sdk_config
+        finally:
+            _configure_cloudinary_sdk.cache_clear()
+
+    def test_upload_connection_pool_sized_for_workers(self):
+        """Test that configuring Cloudinary lets its pool keep a connection per upload worker"""
+        import cloudinary.uploader
+        from services.file_service import _UPLOAD_WORKERS
+
+        with self._cloudinary_credentials(), patch.dict(cloudinary.uploader._http.connection_pool_kw):
+            assert FileService(self.logger).cloudinary_configured is True
+            assert cloudinary.uploader._http.connection_pool_kw['maxsize'] == _UPLOAD_WORKERS
+
+    def test_cloudinary_configured_once_per_process(self):
+        """Test that later FileService instances reuse the SDK configuration"""
+        with self._cloudinary_credentials() as sdk_config:
+            services = [FileService(self.logger) for _ in range(3)]
+
+        assert all(service.cloudinary_configured for service in services)
+        sdk_config.assert_called_once_with(cloud_name='cloud', api_key='key', api_secret='secret')
+
 
 class TestEmailService:
     """Test cases for EmailService"""
@@ -141,6 +509,72 @@ class TestBaseServiceFunctionality:
         assert result["error"] == "Test error"
         assert result["error_type"] == "TestError"
 
+    def test_log_operation_keyword_fields(self):
+        """Test that structured fields can be passed as keyword arguments"""
+        logger = Mock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = True
+        service = ApplicationService(logger)
+
+        service.log_operation("export", {"format": "csv"}, rows=3)
+
+        extra = logger.log.call_args.kwargs["extra"]
+        assert extra == {"service": "ApplicationService", "operation": "export", "rows": 3, "format": "csv"}
+
+    def test_log_operation_skipped_below_level(self):
+        """Test that nothing is logged when the level is disabled"""
+        logger = Mock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = False
+        service = ApplicationService(logger)
+
+        service.log_operation("export", rows=3)
+
+        logger.log.assert_not_called()
+
+
+class TestServiceManager:
+    """Test cases for ServiceManager health checks"""
+
+    def _hung_service(self, release, timeout):
+        """Service whose health check blocks until release is set"""
+        service = Mock()
+        service.health_check_timeout = timeout
+        service.health_check.side_effect = lambda: release.wait(5) and {"status": "healthy"}
+        return service
+
+    def test_hung_probe_is_not_resubmitted(self):
+        """Test that a probe still running is awaited again rather than resubmitted"""
+        import threading
+        from services import ServiceManager
+
+        release = threading.Event()
+        manager = ServiceManager()
+        service = self._hung_service(release, timeout=0.05)
+        manager.register_service("slow", service)
+
+        try:
+            for _ in range(3):
+                health = manager.health_check()
+                assert health["status"] == "degraded"
+                assert "timed out after 0.05s" in health["services"]["slow"]["error"]
+            assert service.health_check.call_count == 1
+        finally:
+            release.set()
+
+    def test_probe_uses_service_timeout(self):
+        """Test that each service is given its own health check timeout"""
+        import threading
+        from services import ServiceManager
+
+        release = threading.Event()
+        manager = ServiceManager()
+        manager.register_service("slow", self._hung_service(release, timeout=5))
+        threading.Timer(0.1, release.set).start()
+
+        health = manager.health_check()
+
+        assert health["status"] == "healthy"
+        assert health["services"]["slow"] == {"status": "healthy"}
+
 
 # Integration tests
 class TestServiceIntegration: